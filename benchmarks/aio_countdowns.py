@@ -0,0 +1,177 @@
+"""Many concurrent `AsyncCountdown`s sharing one event loop.
+
+Starts N countdowns (100k by default) with durations spread over 2-7
+seconds, pauses and resumes some of them, cancels the waiters of others, and
+cancels a few countdowns outright. Then it checks that:
+
+- every countdown that wasn't cancelled finished, and none finished early;
+- late wakeups stay within a small bound (p99 and max);
+- cancelled waiters and countdowns raised `CancelledError` and nothing else;
+- CPU time while waiting stays bounded (the loop sleeps between expiries).
+
+Exits with code 1 if any check fails.
+
+Usage:
+    python benchmarks/aio_countdowns.py
+    python benchmarks/aio_countdowns.py --count 20000 --scale 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.aio import AsyncCountdown, AsyncStopwatch  # noqa: E402
+from core.termclock import Countdown  # noqa: E402
+
+# CPU seconds per 100k countdowns spent between setup and the last expiry.
+WAIT_CPU_BUDGET_S = 4.0
+# How late a finish may be seen, after its deadline.
+LATE_P99_BUDGET_MS = 50.0
+
+
+async def _run(count: int, spread: float) -> dict:
+    rng = random.Random(1234)
+    # Countdowns start on creation, so hold them all until setup is done; the
+    # 2 s minimum keeps expiries clear of the resume loop below.
+    timers = []
+    for _ in range(count):
+        countdown = Countdown(2.0 + rng.random() * spread)
+        countdown.pause()
+        timers.append(AsyncCountdown(countdown))
+    finished_at: dict[int, float] = {}
+    cancelled: set[int] = set()
+
+    async def wait(index: int, timer: AsyncCountdown) -> None:
+        try:
+            await timer.finished()
+        except asyncio.CancelledError:
+            cancelled.add(index)
+            return
+        finished_at[index] = time.monotonic()
+
+    tasks = [asyncio.create_task(wait(i, t)) for i, t in enumerate(timers)]
+    await asyncio.sleep(0)  # let every task register its waiter
+    for timer in timers:
+        timer.countdown.resume()
+
+    # Every 50th countdown: pause for 200 ms, then resume (deadline moves).
+    paused = timers[::50]
+    for timer in paused:
+        timer.countdown.pause()
+    # Every 97th waiter is cancelled; its countdown keeps running.
+    for task in tasks[1::97]:
+        task.cancel()
+    # Every 1001st countdown is cancelled outright.
+    for timer in timers[3::1001]:
+        timer.cancel()
+
+    cpu_started = time.process_time()
+    await asyncio.sleep(0.2)
+    for timer in paused:
+        timer.countdown.resume()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    wait_cpu = time.process_time() - cpu_started
+
+    late_ms = []
+    early = 0
+    for index, seen in finished_at.items():
+        countdown = timers[index].countdown
+        # Deadlines are final once a countdown finished without pauses since.
+        lateness = (seen - countdown._deadline) * 1000
+        early += lateness < 0
+        late_ms.append(lateness)
+
+    expected_cancelled = len(set(range(1, count, 97)) | set(range(3, count, 1001)))
+    return {
+        "finished": len(finished_at),
+        "expected": count - expected_cancelled,
+        "cancelled": len(cancelled),
+        "expected_cancelled": expected_cancelled,
+        "early": early,
+        "late_ms": sorted(late_ms),
+        "wait_cpu": wait_cpu,
+    }
+
+
+async def _check_ticks() -> bool:
+    """A stopwatch ticking at 50 ms, paused for 200 ms, yields in order."""
+    stopwatch = AsyncStopwatch()
+    stopwatch.stopwatch.start()
+    seen: list[float] = []
+
+    async def consume() -> None:
+        async for elapsed in stopwatch.ticks(0.05):
+            seen.append(elapsed)
+
+    task = asyncio.create_task(consume())
+    await asyncio.sleep(0.125)
+    stopwatch.stopwatch.stop()
+    await asyncio.sleep(0.2)  # no ticks while stopped
+    stopwatch.stopwatch.start()
+    await asyncio.sleep(0.14)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    marks = [int(elapsed / 0.05) for elapsed in seen]
+    return marks == [1, 2, 3, 4, 5] and task.cancelled()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000, help="Countdowns.")
+    parser.add_argument("--spread", type=float, default=5.0, help="Seconds.")
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Multiply every budget (e.g. for slow CI machines).",
+    )
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    result = asyncio.run(_run(args.count, args.spread))
+    wall = time.perf_counter() - started
+    late = result["late_ms"]
+    p99 = late[min(len(late) - 1, int(0.99 * len(late)))] if late else 0.0
+
+    cpu_budget = WAIT_CPU_BUDGET_S * args.count / 100_000 * args.scale
+    late_budget = LATE_P99_BUDGET_MS * args.scale
+    checks = [
+        (
+            result["finished"] == result["expected"],
+            f"finished {result['finished']}/{result['expected']}",
+        ),
+        (
+            result["cancelled"] == result["expected_cancelled"],
+            f"cancelled {result['cancelled']}/{result['expected_cancelled']}",
+        ),
+        (result["early"] == 0, f"finished early: {result['early']}"),
+        (
+            p99 <= late_budget,
+            f"lateness p99 {p99:.2f} ms, max {late[-1] if late else 0:.2f} ms "
+            f"(budget {late_budget:.0f} ms)",
+        ),
+        (
+            result["wait_cpu"] <= cpu_budget,
+            f"CPU while waiting {result['wait_cpu']:.2f} s of {wall:.2f} s wall "
+            f"(budget {cpu_budget:.2f} s)",
+        ),
+        (asyncio.run(_check_ticks()), "stopwatch ticks follow stop/start"),
+    ]
+
+    failed = False
+    for ok, message in checks:
+        failed |= not ok
+        print(f"{'ok' if ok else 'FAIL':4}  {message}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,133 @@
+"""Owner cost and consistency of `tm sw --attach` viewers.
+
+Publishes a stopwatch snapshot in a loop (in a throwaway runtime directory)
+while viewer processes read it through `LiveView` as fast as they can, and
+checks that:
+
+1. no viewer ever sees a torn snapshot: every publish writes the same
+   counter into the value and the lap fields, and viewers compare them;
+2. publishing with `--viewers` readers attached costs the owner no more
+   CPU time than `--max-slowdown` times what it costs with none. Readers
+   never write to the mapping, so only cache traffic can slow it down; CPU
+   time rather than wall time, because the viewers here spin on a shared
+   machine (real ones poll ten times a second).
+
+Exits with code 1 if a check fails.
+
+Usage:
+    python benchmarks/attach.py
+    python benchmarks/attach.py --viewers 48 --seconds 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.snapshot import LiveSnapshot, LiveView  # noqa: E402
+
+NAME = "Attach bench"
+
+
+class _Laps:
+    """Lap fields that all carry the same counter."""
+
+    def __init__(self, value: int) -> None:
+        self.count = value
+        self.last = self.min = self.max = self.mean = self.stdev = float(value)
+        self.p50 = self.p95 = float(value)
+
+
+def _viewer(stop, results) -> None:
+    view = LiveView.find(NAME)
+    reads = torn = 0
+    while not stop.is_set():
+        snapshot = view.read()
+        if snapshot is None:
+            continue
+        reads += 1
+        laps = snapshot.laps
+        if not (snapshot.value_ns == laps.count == laps.p95 == laps.last):
+            torn += 1
+    view.close()
+    results.put((reads, torn))
+
+
+def _publish_ns(snapshot: LiveSnapshot, seconds: float, counter: list[int]) -> float:
+    """Mean CPU time of one publish, publishing back to back for `seconds`."""
+    publishes = 0
+    spent = 0
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        started = time.thread_time_ns()
+        for _ in range(100):
+            counter[0] += 1
+            snapshot.publish(True, counter[0], _Laps(counter[0]))
+        spent += time.thread_time_ns() - started
+        publishes += 100
+    return spent / publishes
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--viewers", type=int, default=24, help="Viewer processes.")
+    parser.add_argument("--seconds", type=float, default=2.0, help="Per stage.")
+    parser.add_argument(
+        "--max-slowdown",
+        type=float,
+        default=2.0,
+        help="Allowed publish slowdown with viewers attached.",
+    )
+    args = parser.parse_args()
+    failed = False
+
+    def report(ok: bool, message: str) -> None:
+        nonlocal failed
+        failed |= not ok
+        print(f"{'ok' if ok else 'FAIL':4}  {message}")
+
+    with tempfile.TemporaryDirectory() as root:
+        os.environ["XDG_RUNTIME_DIR"] = root
+        counter = [0]
+        with LiveSnapshot(NAME, "stopwatch") as snapshot:
+            snapshot.publish(True, 0, _Laps(0))
+            alone = _publish_ns(snapshot, args.seconds, counter)
+
+            context = multiprocessing.get_context("fork")
+            stop = context.Event()
+            results = context.Queue()
+            viewers = [
+                context.Process(target=_viewer, args=(stop, results))
+                for _ in range(args.viewers)
+            ]
+            for viewer in viewers:
+                viewer.start()
+            time.sleep(0.2)
+            watched = _publish_ns(snapshot, args.seconds, counter)
+            stop.set()
+            totals = [results.get(timeout=30) for _ in viewers]
+            for viewer in viewers:
+                viewer.join()
+
+    reads = sum(r for r, _ in totals)
+    torn = sum(t for _, t in totals)
+    report(
+        torn == 0, f"{reads} viewer reads during {counter[0]} publishes, {torn} torn"
+    )
+    report(
+        watched <= alone * args.max_slowdown,
+        f"publish {alone / 1000:.2f} us alone, {watched / 1000:.2f} us with "
+        f"{args.viewers} viewers (max {args.max_slowdown:g}x)",
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,211 @@
+"""Load harness for the `tm daemon` Unix-socket server.
+
+Starts a daemon in a throwaway directory (its XDG data, state and runtime
+directories all point there, so nothing touches your real history), then:
+
+1. times single `tm start`/`tm stop` client processes end to end,
+2. fires many concurrent in-process requests and reports round-trip latency,
+3. attaches idle watchers and checks they all receive a broadcast event,
+4. sends requests that aren't JSON objects and checks each gets an error
+   reply on a connection that stays usable.
+
+Exits with code 1 if a stage goes over its budget or the daemon misbehaves.
+
+Usage:
+    python benchmarks/daemon.py
+    python benchmarks/daemon.py --clients 200 --watchers 500 --scale 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from core.ipc import DaemonNotRunning, _connect, decode, encode, request  # noqa: E402
+
+# Median wall time of one client process, including interpreter start.
+CLIENT_BUDGET_MS = 150.0
+# 99th percentile round trip of an in-process request under concurrency.
+REQUEST_BUDGET_MS = 50.0
+
+
+def _wait_for_socket(path: Path, daemon: subprocess.Popen, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if daemon.poll() is not None:
+            raise RuntimeError(f"daemon exited early with code {daemon.returncode}")
+        try:
+            request("status", path=path)
+            return
+        except DaemonNotRunning:
+            time.sleep(0.01)
+    raise RuntimeError("daemon did not start listening in time")
+
+
+def _percentile(samples: list[float], p: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+
+def _bench_client_processes(env: dict[str, str], runs: int) -> list[float]:
+    walls = []
+    for i in range(runs):
+        started = time.perf_counter()
+        subprocess.run(
+            [
+                sys.executable,
+                str(SRC_DIR / "launcher.py"),
+                ("start", "stop")[i % 2],
+                "proc",
+            ],
+            env=env,
+            capture_output=True,
+            check=True,
+        )
+        walls.append((time.perf_counter() - started) * 1000)
+    return walls
+
+
+def _bench_requests(path: Path, clients: int, per_client: int) -> list[float]:
+    def client(index: int) -> list[float]:
+        name = f"bench-{index}"
+        samples = []
+        for i in range(per_client):
+            op = ("start", "status", "stop")[i % 3]
+            started = time.perf_counter()
+            if op == "status":
+                request(op, path=path, name=name)
+            else:
+                request(op, path=path, name=name, seconds=3600)
+            samples.append((time.perf_counter() - started) * 1000)
+        return samples
+
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        return [s for samples in pool.map(client, range(clients)) for s in samples]
+
+
+def _check_watchers(path: Path, watchers: int) -> int:
+    """Attach `watchers` connections, trigger one event, count who saw it."""
+    sockets = []
+    try:
+        for _ in range(watchers):
+            sock = _connect(path, 5.0)
+            sock.sendall(encode({"op": "watch"}))
+            sockets.append((sock, sock.makefile("rb")))
+        for _, lines in sockets:
+            lines.readline()  # ack
+
+        request("start", path=path, name="watched", seconds=3600)
+        received = 0
+        for _, lines in sockets:
+            event = decode(lines.readline())
+            received += event.get("name") == "watched"
+        return received
+    finally:
+        for sock, lines in sockets:
+            lines.close()
+            sock.close()
+
+
+def _check_malformed(path: Path) -> bool:
+    """Send requests that aren't JSON objects; True if each got an error."""
+    with _connect(path, 5.0) as sock, sock.makefile("rb") as lines:
+        replies = []
+        for line in (b"[1, 2]\n", b'"status"\n', b"42\n", b"null\n", b"{\n"):
+            sock.sendall(line)
+            replies.append(decode(lines.readline()))
+        sock.sendall(encode({"op": "status"}))
+        status = decode(lines.readline())
+    return not any(reply["ok"] for reply in replies) and status["ok"]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="Client processes.")
+    parser.add_argument("--clients", type=int, default=50, help="Concurrent clients.")
+    parser.add_argument("--requests", type=int, default=30, help="Requests each.")
+    parser.add_argument("--watchers", type=int, default=200, help="Idle watchers.")
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Multiply every budget (e.g. for slow CI machines).",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="tm-daemon-bench-") as tmp:
+        env = dict(
+            os.environ,
+            PYTHONPATH=str(SRC_DIR),
+            XDG_DATA_HOME=str(Path(tmp) / "data"),
+            XDG_STATE_HOME=str(Path(tmp) / "state"),
+            XDG_RUNTIME_DIR=str(Path(tmp) / "run"),
+        )
+        Path(env["XDG_RUNTIME_DIR"]).mkdir(mode=0o700)
+        path = Path(env["XDG_RUNTIME_DIR"]) / "time-manager" / "daemon.sock"
+
+        daemon = subprocess.Popen(
+            [sys.executable, str(SRC_DIR / "launcher.py"), "daemon"], env=env
+        )
+        failed = False
+        try:
+            _wait_for_socket(path, daemon, timeout=10.0)
+
+            walls = _bench_client_processes(env, max(1, args.runs))
+            wall = statistics.median(walls)
+            budget = CLIENT_BUDGET_MS * args.scale
+            ok = wall <= budget
+            failed |= not ok
+            print(
+                f"{'ok' if ok else 'FAIL':4}  tm start/stop process  "
+                f"median {wall:7.1f} ms (budget {budget:.0f} ms)"
+            )
+
+            samples = _bench_requests(path, args.clients, args.requests)
+            p99 = _percentile(samples, 0.99)
+            budget = REQUEST_BUDGET_MS * args.scale
+            ok = p99 <= budget
+            failed |= not ok
+            print(
+                f"{'ok' if ok else 'FAIL':4}  {args.clients} concurrent clients  "
+                f"p50 {_percentile(samples, 0.5):6.2f} ms  p99 {p99:6.2f} ms "
+                f"(budget {budget:.0f} ms, {len(samples)} requests)"
+            )
+
+            received = _check_watchers(path, args.watchers)
+            ok = received == args.watchers
+            failed |= not ok
+            print(
+                f"{'ok' if ok else 'FAIL':4}  watchers               "
+                f"{received}/{args.watchers} received the broadcast"
+            )
+
+            ok = _check_malformed(path)
+            failed |= not ok
+            print(f"{'ok' if ok else 'FAIL':4}  malformed requests get error replies")
+
+            request("shutdown", path=path)
+            daemon.wait(timeout=10)
+            ok = daemon.returncode == 0 and not path.exists()
+            failed |= not ok
+            print(f"{'ok' if ok else 'FAIL':4}  clean shutdown")
+        finally:
+            if daemon.poll() is None:
+                daemon.terminate()
+                daemon.wait()
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
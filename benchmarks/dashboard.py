@@ -0,0 +1,126 @@
+"""Headless load test of the `tm dash` dashboard with hundreds of timers.
+
+Runs `DashboardTui` under Textual's test pilot (no terminal needed) with
+`--stopwatches` running stopwatches at random phases plus `--countdowns`
+countdowns, then checks that:
+
+1. mounting builds only the lines on screen, not one per timer;
+2. while it runs, each visible row is rebuilt about once per displayed
+   second, and off-screen rows never are;
+3. the whole app (Textual included) stays under a CPU budget per second;
+4. key presses (moving the cursor, starting and stopping a timer) are
+   handled quickly.
+
+Exits with code 1 if a check fails.
+
+Usage:
+    python benchmarks/dashboard.py
+    python benchmarks/dashboard.py --stopwatches 1000 --countdowns 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.termclock import Stopwatch  # noqa: E402
+from tui.dashboard import DashboardTui, TimerList  # noqa: E402
+
+SIZE = (100, 40)
+# CPU seconds per second of wall time, the app and Textual together.
+CPU_BUDGET = 0.10
+# Median time from a key press to the app having handled it and redrawn,
+# as the test pilot sees it (most of it is the pilot waiting for the screen
+# to settle: about 60 ms with a two-timer dashboard on a slow machine).
+KEY_BUDGET_MS = 150.0
+
+
+def _timers(stopwatches: int, countdowns: int, rng: random.Random):
+    watches = []
+    for i in range(stopwatches):
+        stopwatch = Stopwatch(name=f"Project {i:04}")
+        # Running, at a random point within its second.
+        stopwatch.restore(rng.randrange(3600 * 10**9), time.time_ns())
+        watches.append(stopwatch)
+    timers = [(f"Countdown {i:04}", rng.randrange(60, 7200)) for i in range(countdowns)]
+    return watches, timers
+
+
+async def _run(args) -> int:
+    failed = False
+
+    def report(ok: bool, message: str) -> None:
+        nonlocal failed
+        failed |= not ok
+        print(f"{'ok' if ok else 'FAIL':4}  {message}")
+
+    rng = random.Random(1234)
+    stopwatches, countdowns = _timers(args.stopwatches, args.countdowns, rng)
+    total = len(stopwatches) + len(countdowns)
+    app = DashboardTui(stopwatches, countdowns)
+    async with app.run_test(size=SIZE) as pilot:
+        timer_list = app.query_one(TimerList)
+        await pilot.pause(0.5)
+        height = timer_list.size.height
+        built = timer_list.lines_rendered
+        report(
+            built <= 2 * height,
+            f"mount built {built} lines for {total} timers ({height} visible)",
+        )
+
+        timer_list.lines_rendered = 0
+        refreshes = timer_list.refreshes
+        cpu = time.process_time()
+        wall = time.perf_counter()
+        await pilot.pause(args.seconds)
+        cpu = (time.process_time() - cpu) / (time.perf_counter() - wall)
+        lines = timer_list.lines_rendered / args.seconds
+        report(
+            lines <= 1.5 * height,
+            f"{lines:.0f} lines rebuilt per second for {height} visible rows "
+            f"({(timer_list.refreshes - refreshes) / args.seconds:.0f} wakeups/s)",
+        )
+        budget = CPU_BUDGET * args.scale
+        report(
+            cpu <= budget,
+            f"{100 * cpu:.1f}% CPU while running (budget {100 * budget:.0f}%)",
+        )
+
+        latencies = []
+        for key in ["down"] * 20 + ["pagedown"] * 5 + ["space", "space"] * 5:
+            started = time.perf_counter()
+            await pilot.press(key)
+            latencies.append((time.perf_counter() - started) * 1000)
+        median = statistics.median(latencies)
+        key_budget = KEY_BUDGET_MS * args.scale
+        report(
+            median <= key_budget,
+            f"key press handled in {median:.1f} ms median, "
+            f"{max(latencies):.1f} ms max (budget {key_budget:.0f} ms)",
+        )
+    return 1 if failed else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stopwatches", type=int, default=300, help="Stopwatches.")
+    parser.add_argument("--countdowns", type=int, default=300, help="Countdowns.")
+    parser.add_argument("--seconds", type=float, default=5.0, help="Run time.")
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Multiply every budget (e.g. for slow CI machines).",
+    )
+    return asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,150 @@
+"""Overhead of the timer event bus (`core.events`).
+
+Measures, for N stopwatch start/stop cycles:
+
+1. the cost with no sink attached, and of the `bus.active` check alone;
+2. the extra cost on the timer's own thread once a sink is attached, which
+   must stay small because delivery happens on the dispatch thread;
+
+then checks that every event reaches a ring-buffer and a JSONL sink in
+order, and that a stalled sink makes the bus drop events (counted in
+`bus.dropped`) instead of blocking the timer.
+
+Exits with code 1 if a check fails or the attached cost goes over budget.
+
+Usage:
+    python benchmarks/events.py
+    python benchmarks/events.py --cycles 200000 --scale 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import sys
+import threading
+import time
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core import termclock  # noqa: E402
+from core.events import (  # noqa: E402
+    CallbackSink,
+    EventBus,
+    JsonlSink,
+    RingBufferSink,
+    bus,
+)
+from core.termclock import Stopwatch  # noqa: E402
+
+# Extra time per emitted event on the emitting thread, with a sink attached.
+EMIT_BUDGET_US = 5.0
+# Emitting while the sink is stalled and the queue is full, per event.
+FULL_QUEUE_BUDGET_US = 5.0
+
+
+def _cycle_ns(cycles: int) -> float:
+    stopwatch = Stopwatch(name="bench")
+    started = time.perf_counter_ns()
+    for _ in range(cycles):
+        stopwatch.start()
+        stopwatch.stop()
+    return (time.perf_counter_ns() - started) / cycles
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cycles", type=int, default=50_000, help="Start/stops.")
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Multiply every budget (e.g. for slow CI machines).",
+    )
+    args = parser.parse_args()
+    cycles = max(1, args.cycles)
+    failed = False
+
+    def report(ok: bool, message: str) -> None:
+        nonlocal failed
+        failed |= not ok
+        print(f"{'ok' if ok else 'FAIL':4}  {message}")
+
+    _cycle_ns(1000)  # warm up
+    idle = min(_cycle_ns(cycles) for _ in range(3))
+    gate = min(
+        timeit.repeat("bus.active", globals={"bus": bus}, number=1_000_000, repeat=3)
+    )
+    print(
+        f"      no sink: {idle:7.0f} ns per start/stop, "
+        f"{gate * 1000:.1f} ns per `bus.active` check"
+    )
+
+    ring = bus.attach(RingBufferSink(2 * cycles))
+    attached = _cycle_ns(cycles)
+    bus.flush()
+    per_event_us = (attached - idle) / 2 / 1000
+    budget = EMIT_BUDGET_US * args.scale
+    report(
+        per_event_us <= budget,
+        f"with a sink: {attached:6.0f} ns per start/stop, "
+        f"+{per_event_us:.2f} us per event (budget {budget:.0f} us)",
+    )
+    events = ring.events()
+    kinds = [event.kind for event in events]
+    in_order = kinds == ["stopwatch.started", "stopwatch.stopped"] * cycles
+    report(
+        in_order and bus.dropped == 0,
+        f"ring buffer got {len(events)}/{2 * cycles} events in order "
+        f"({bus.dropped} dropped)",
+    )
+    bus.detach(ring)
+
+    # JSON encoding is slower than a timer can emit in a tight loop, so
+    # this one goes in bursts the size of the queue.
+    stream = io.StringIO()
+    jsonl = bus.attach(JsonlSink(stream))
+    stopwatch = Stopwatch(name="bench")
+    burst = bus.maxsize // 3
+    for done in range(0, cycles, burst):
+        for _ in range(min(burst, cycles - done)):
+            stopwatch.start()
+            stopwatch.lap()
+            stopwatch.stop()
+        bus.flush()
+    bus.detach(jsonl)
+    lines = stream.getvalue().splitlines()
+    parsed = [json.loads(line) for line in lines]
+    report(
+        len(parsed) == 3 * cycles
+        and all(p["timer"] == "bench" for p in parsed)
+        and [p["laps"] for p in parsed[1::3]] == list(range(1, cycles + 1)),
+        f"JSONL sink wrote {len(parsed)}/{3 * cycles} lines in order",
+    )
+
+    # A sink that stalls: emitting must not block, the overflow is dropped.
+    small = EventBus(maxsize=100)
+    release = threading.Event()
+    small.attach(CallbackSink(lambda event: release.wait()))
+    termclock._bus, saved = small, termclock._bus
+    try:
+        stalled = _cycle_ns(cycles)
+    finally:
+        termclock._bus = saved
+        release.set()
+    small.close()
+    per_event_us = stalled / 2 / 1000
+    budget = FULL_QUEUE_BUDGET_US * args.scale
+    report(
+        small.dropped > 0 and per_event_us <= budget,
+        f"stalled sink: {per_event_us:.2f} us per event, "
+        f"{small.dropped} dropped (budget {budget:.0f} us)",
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,154 @@
+"""Check the integer `format_time` against the original float version.
+
+`core.formatting` formats through whole-second integers and memoizes the
+last whole second. This compares its output, exception for exception,
+with the float-`divmod` implementation it replaced:
+
+1. every centisecond from 0 to `--hours` hours, each with its two
+   neighbouring floats (the values where truncation could go either way);
+2. every whole second up to 100 hours, as int and float;
+3. random floats across many magnitudes, big integers, negative values,
+   -0.0, NaN and infinity.
+
+Every value goes through `format_time` (both variants), `format_seconds`,
+`format_centiseconds` and `format_hms`, in an order that mixes memo hits
+and misses. It then times the old and new versions on a 60 fps sequence.
+Exits with code 1 on the first mismatch.
+
+Usage:
+    python benchmarks/format_time.py
+    python benchmarks/format_time.py --hours 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.formatting import (  # noqa: E402
+    format_centiseconds,
+    format_hms,
+    format_seconds,
+    format_time,
+)
+
+
+def reference_format_time(seconds: float, *, show_centiseconds: bool = True) -> str:
+    """`format_time` as it was before the integer rewrite."""
+
+    seconds = max(0.0, float(seconds))
+    minutes, secs = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+
+    if show_centiseconds:
+        centiseconds = int((seconds * 100) % 100)
+        if hours > 0:
+            return f"{int(hours):02}:{int(minutes):02}:{int(secs):02}.{centiseconds:02}"
+        return f"{int(minutes):02}:{int(secs):02}.{centiseconds:02}"
+
+    if hours > 0:
+        return f"{int(hours):02}:{int(minutes):02}:{int(secs):02}"
+    return f"{int(minutes):02}:{int(secs):02}"
+
+
+def reference_hms(seconds: float) -> str:
+    """The `count(":")` padding the call sites used to do."""
+    time_str = reference_format_time(seconds, show_centiseconds=False)
+    if time_str.count(":") == 1:
+        return f"00:{time_str}"
+    return time_str
+
+
+def _outcome(function, value, **kwargs):
+    try:
+        return function(value, **kwargs)
+    except Exception as error:  # compare the failure, not just that it failed
+        return (type(error), str(error))
+
+
+def _check(value) -> str | None:
+    """Describe the first mismatch for `value`, or None."""
+    with_cs = _outcome(reference_format_time, value)
+    without_cs = _outcome(reference_format_time, value, show_centiseconds=False)
+    cases = (
+        ("format_time", _outcome(format_time, value), with_cs),
+        (
+            "format_time(show_centiseconds=False)",
+            _outcome(format_time, value, show_centiseconds=False),
+            without_cs,
+        ),
+        ("format_centiseconds", _outcome(format_centiseconds, value), with_cs),
+        ("format_seconds", _outcome(format_seconds, value), without_cs),
+        ("format_hms", _outcome(format_hms, value), _outcome(reference_hms, value)),
+    )
+    for name, got, expected in cases:
+        if got != expected:
+            return f"{name}({value!r}) = {got!r}, expected {expected!r}"
+    return None
+
+
+def _values(hours: int, rng: random.Random):
+    for centis in range(hours * 360_000):
+        value = centis / 100
+        yield value
+        yield math.nextafter(value, -math.inf)
+        yield math.nextafter(value, math.inf)
+    for whole in range(100 * 3600 + 1):
+        yield whole
+        yield float(whole)
+    for _ in range(100_000):
+        yield rng.uniform(0, 10 ** rng.randint(0, 12))
+    for exponent in range(30, 70):
+        yield 2**exponent
+        yield float(2**exponent)
+        yield math.nextafter(float(2**exponent), 0)
+    yield from (-0.0, -1, -1.5, -1e300, 1e300, True, False, "12.5")
+    yield from (math.nan, math.inf, -math.inf)
+
+
+def _time_frames(function, frames: int) -> float:
+    values = [i / 60 for i in range(frames)]
+    started = time.perf_counter_ns()
+    for value in values:
+        function(value)
+    return (time.perf_counter_ns() - started) / frames
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--hours",
+        type=int,
+        default=1,
+        help="Check every centisecond up to this many hours (default 1).",
+    )
+    parser.add_argument("--seed", type=int, default=1234, help="Random seed.")
+    args = parser.parse_args()
+
+    checked = 0
+    for value in _values(max(0, args.hours), random.Random(args.seed)):
+        mismatch = _check(value)
+        if mismatch:
+            print(f"FAIL  {mismatch}")
+            return 1
+        checked += 1
+    print(f"ok    {checked} values formatted identically")
+
+    frames = 600_000
+    old = _time_frames(reference_hms, frames)
+    new = _time_frames(format_hms, frames)
+    print(
+        f"      HH:MM:SS at 60 fps: {old:.0f} ns -> {new:.0f} ns per call "
+        f"({old / new:.1f}x)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
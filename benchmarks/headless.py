@@ -0,0 +1,124 @@
+"""`tm cd` and `tm sw` with no terminal, as in CI jobs and `nohup`.
+
+Runs `tm` as a child process with stdin from /dev/null and stdout into a
+pipe (in a throwaway data and runtime directory), and checks that:
+
+1. `tm cd` picks the headless output by itself and exits 0 when the
+   countdown finishes, writing one line for the start, one per `--every`
+   and one for the finish, and nothing on stderr;
+2. `tm sw --jsonl` writes one JSON event per line, pauses and resumes on
+   SIGUSR1 and stops on SIGINT;
+3. between lines the process sleeps: the countdown's CPU time, interpreter
+   start-up included, stays under a budget.
+
+Exits with code 1 if a check fails.
+
+Usage:
+    python benchmarks/headless.py
+    python benchmarks/headless.py --seconds 10 --scale 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import resource
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+# CPU seconds of the whole `tm cd` process (start-up dominates).
+CPU_BUDGET = 0.5
+
+
+def _tm(args: list[str], env: dict[str, str]) -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, str(SRC_DIR / "launcher.py"), *args],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        env=env,
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=int, default=5, help="Countdown length.")
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Multiply every budget (e.g. for slow CI machines).",
+    )
+    args = parser.parse_args()
+    failed = False
+
+    def report(ok: bool, message: str) -> None:
+        nonlocal failed
+        failed |= not ok
+        print(f"{'ok' if ok else 'FAIL':4}  {message}")
+
+    with tempfile.TemporaryDirectory() as root:
+        env = dict(os.environ)
+        for var in ("XDG_RUNTIME_DIR", "XDG_DATA_HOME", "XDG_STATE_HOME"):
+            env[var] = os.path.join(root, var.lower())
+        env.pop("TM_EVENTS", None)
+
+        before = resource.getrusage(resource.RUSAGE_CHILDREN)
+        countdown = _tm(["cd", f"{args.seconds}s", "--every", "1s"], env)
+        out, err = countdown.communicate(timeout=args.seconds + 30)
+        after = resource.getrusage(resource.RUSAGE_CHILDREN)
+        lines = out.splitlines()
+        expected = args.seconds + 1  # start, a line per second left, finish
+        report(
+            countdown.returncode == 0
+            and not err
+            and len(lines) == expected
+            and lines[-1].endswith("time's up"),
+            f"tm cd {args.seconds}s: exit {countdown.returncode}, "
+            f"{len(lines)} lines (expected {expected}), "
+            f"{len(err.splitlines())} on stderr",
+        )
+        cpu = (after.ru_utime - before.ru_utime) + (after.ru_stime - before.ru_stime)
+        budget = CPU_BUDGET * args.scale
+        report(
+            cpu <= budget,
+            f"tm cd {args.seconds}s used {cpu:.2f} CPU s (budget {budget:g})",
+        )
+
+        stopwatch = _tm(["sw", "-n", "Headless bench", "--jsonl", "--every", "1s"], env)
+        # Signal only once it has started (and so has its handlers in place).
+        first = stopwatch.stdout.readline()
+        for delay, signum in ((1.5, signal.SIGUSR1), (1.0, signal.SIGUSR1)):
+            time.sleep(delay)
+            stopwatch.send_signal(signum)
+        time.sleep(1.2)
+        stopwatch.send_signal(signal.SIGINT)
+        out, err = stopwatch.communicate(timeout=30)
+        out = first + out
+        try:
+            kinds = [json.loads(line)["event"] for line in out.splitlines()]
+        except ValueError:
+            kinds = []
+        report(
+            stopwatch.returncode == 0
+            and not err
+            and kinds[:1] == ["stopwatch.started"]
+            and kinds.count("stopwatch.started") == 2
+            and kinds.count("stopwatch.stopped") == 2
+            and "stopwatch.tick" in kinds
+            and kinds[-1] == "stopwatch.stopped",
+            f"tm sw --jsonl: exit {stopwatch.returncode}, events {kinds}",
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
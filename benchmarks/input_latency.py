@@ -0,0 +1,182 @@
+"""Keypress-to-render latency of the plain `tm sw` loop.
+
+Runs `tm sw --renderer ansi` in a pseudo-terminal (with its XDG directories in
+a throwaway directory), then:
+
+1. presses Space at random moments, always well clear of the once-a-second
+   redraw, and times how long until the redrawn frame starts arriving;
+2. pastes "llll" in one write and checks it shows up as a single frame with
+   four laps, not four frames;
+3. sends arrow keys and a lone Escape to the paused stopwatch and checks
+   they draw nothing and don't hold up the next key.
+
+Exits with code 1 if the p99 latency goes over budget or a check fails.
+
+Usage:
+    python benchmarks/input_latency.py
+    python benchmarks/input_latency.py --presses 200 --scale 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import fcntl
+import os
+import pty
+import random
+import select
+import statistics
+import struct
+import sys
+import tempfile
+import termios
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+# Keypress to the first byte of the redrawn frame, 99th percentile.
+LATENCY_BUDGET_MS = 20.0
+# Nothing is sent within this long of the previous frame, nor of the next
+# second boundary, so a reply can't be mistaken for a clock redraw.
+_QUIET_S = 0.2
+
+
+class _Terminal:
+    """A child process on the other end of an 80x24 pseudo-terminal."""
+
+    def __init__(self, argv: list[str], env: dict[str, str]) -> None:
+        pid, fd = pty.fork()
+        if pid == 0:  # child
+            os.chdir(SRC_DIR)
+            os.execve(sys.executable, [sys.executable, *argv], env)
+        fcntl.ioctl(fd, termios.TIOCSWINSZ, struct.pack("HHHH", 24, 80, 0, 0))
+        self.pid, self.fd = pid, fd
+        self.last_output = time.perf_counter()
+
+    def read(self, timeout: float) -> bytes:
+        """Collect output until nothing arrives for `timeout` seconds."""
+        out = b""
+        while select.select([self.fd], [], [], timeout)[0]:
+            try:
+                data = os.read(self.fd, 65536)
+            except OSError:
+                break
+            if not data:
+                break
+            out += data
+            self.last_output = time.perf_counter()
+        return out
+
+    def press(self, keys: bytes) -> float:
+        """Send `keys`; return seconds until the first byte of the reply."""
+        sent = time.perf_counter()
+        os.write(self.fd, keys)
+        if not select.select([self.fd], [], [], 1.0)[0]:
+            return float("inf")
+        replied = time.perf_counter()
+        self.read(0.02)
+        return replied - sent
+
+    def settle(self) -> None:
+        """Wait until a keypress can't coincide with a clock redraw."""
+        self.read(0)
+        while True:
+            # Paused, nothing is drawn; running, a frame comes every second.
+            since = (time.perf_counter() - self.last_output) % 1.0
+            if _QUIET_S <= since <= 1.0 - _QUIET_S:
+                return
+            self.read(0.01)
+
+    def close(self) -> None:
+        os.write(self.fd, b"q")
+        self.read(0.5)
+        os.waitpid(self.pid, 0)
+        os.close(self.fd)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--presses", type=int, default=60, help="Space presses.")
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Multiply every budget (e.g. for slow CI machines).",
+    )
+    args = parser.parse_args()
+
+    rng = random.Random(1234)
+    failed = False
+    with tempfile.TemporaryDirectory(prefix="tm-input-bench-") as tmp:
+        env = dict(
+            os.environ,
+            TERM="xterm-256color",
+            XDG_DATA_HOME=tmp,
+            XDG_STATE_HOME=tmp,
+            XDG_RUNTIME_DIR=tmp,
+        )
+        term = _Terminal(
+            ["launcher.py", "sw", "-n", "bench", "--renderer", "ansi"], env
+        )
+        try:
+            first = b""
+            deadline = time.perf_counter() + 10
+            while b"Stopwatch" not in first and time.perf_counter() < deadline:
+                first += term.read(0.1)
+            if b"Stopwatch" not in first:
+                print("FAIL  no first frame from `tm sw`")
+                return 1
+
+            latencies = []
+            for _ in range(max(1, args.presses)):
+                term.settle()
+                time.sleep(rng.random() * 0.1)
+                latencies.append(term.press(b" ") * 1000)
+            latencies.sort()
+            p99 = latencies[min(len(latencies) - 1, int(0.99 * len(latencies)))]
+            budget = LATENCY_BUDGET_MS * args.scale
+            ok = p99 <= budget
+            failed |= not ok
+            print(
+                f"{'ok' if ok else 'FAIL':4}  keypress to render  "
+                f"p50 {statistics.median(latencies):5.2f} ms  p99 {p99:5.2f} ms "
+                f"(budget {budget:.0f} ms)"
+            )
+
+            # Make sure it's running, so laps count.
+            if len(latencies) % 2:
+                term.settle()
+                term.press(b" ")
+            term.settle()
+            os.write(term.fd, b"llll")
+            frame = term.read(0.1)
+            ok = b"Laps 4" in frame and not any(
+                f"Laps {n}".encode() in frame for n in (1, 2, 3)
+            )
+            failed |= not ok
+            print(f"{'ok' if ok else 'FAIL':4}  pasted 'llll' drawn as one frame")
+
+            # Paused, so any output at all would be a spurious redraw.
+            term.settle()
+            term.press(b" ")
+            os.write(term.fd, b"\x1b[A\x1b[B\x1b[5~\x1bOP")
+            quiet = term.read(0.1)
+            os.write(term.fd, b"\x1b")
+            quiet += term.read(0.1)
+            ok = not quiet
+            latency = term.press(b" ") * 1000
+            ok = ok and latency <= budget
+            failed |= not ok
+            print(
+                f"{'ok' if ok else 'FAIL':4}  escape sequences ignored, next key "
+                f"drawn in {latency:.2f} ms"
+            )
+        finally:
+            term.close()
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,104 @@
+"""Cost of the `--profile` frame profiler itself.
+
+Records N empty frames (begin, four phase marks, end) and checks that:
+
+1. one recorded frame costs little next to the frames it measures
+   (a plain-mode stopwatch frame is tens of microseconds);
+2. recording allocates no memory once the profiler exists (its buffers are
+   preallocated), measured with `tracemalloc`;
+3. the histogram percentiles land within 1.6% of the exact values.
+
+Exits with code 1 if any check fails.
+
+Usage:
+    python benchmarks/profiler.py
+    python benchmarks/profiler.py --frames 1000000 --scale 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.profiler import PHASES, FrameProfiler, Histogram  # noqa: E402
+
+# One begin/mark/end cycle, median over repeats.
+FRAME_BUDGET_US = 10.0
+# Heap growth allowed while recording (interpreter noise, not per frame).
+ALLOC_BUDGET_BYTES = 4096
+
+
+def _record(profiler: FrameProfiler, frames: int) -> None:
+    begin, mark, end = profiler.begin, profiler.mark, profiler.end
+    phases = range(len(PHASES))
+    for _ in range(frames):
+        begin()
+        for phase in phases:
+            mark(phase)
+        end()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=200_000, help="Frames.")
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Multiply every budget (e.g. for slow CI machines).",
+    )
+    args = parser.parse_args()
+    frames = max(1, args.frames)
+    failed = False
+
+    def report(ok: bool, message: str) -> None:
+        nonlocal failed
+        failed |= not ok
+        print(f"{'ok' if ok else 'FAIL':4}  {message}")
+
+    profiler = FrameProfiler(capacity=frames // 4 or 1)
+    _record(profiler, 1000)  # warm up, and wrap the sample ring early
+    samples = []
+    for _ in range(5):
+        started = time.perf_counter_ns()
+        _record(profiler, frames // 5 or 1)
+        samples.append((time.perf_counter_ns() - started) / (frames // 5 or 1))
+    per_frame_us = sorted(samples)[2] / 1000
+    budget = FRAME_BUDGET_US * args.scale
+    report(
+        per_frame_us <= budget,
+        f"{per_frame_us:.2f} us per recorded frame (budget {budget:.0f} us)",
+    )
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    _record(profiler, frames)
+    grown = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    report(
+        grown <= ALLOC_BUDGET_BYTES,
+        f"{grown} bytes allocated over {frames} frames "
+        f"(budget {ALLOC_BUDGET_BYTES} bytes)",
+    )
+
+    rng = random.Random(1234)
+    values = sorted(int(rng.lognormvariate(12, 1.5)) for _ in range(100_000))
+    histogram = Histogram()
+    for value in values:
+        histogram.add(value)
+    worst = 0.0
+    for p in (50.0, 90.0, 99.0, 99.9):
+        exact = values[min(len(values) - 1, -(-len(values) * int(p * 10) // 1000) - 1)]
+        worst = max(worst, abs(histogram.percentile(p) - exact) / exact)
+    report(worst <= 0.016, f"histogram percentiles within {100 * worst:.2f}% of exact")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,118 @@
+"""Check that projects whose names share a slug keep separate history.
+
+"Project Alpha" and "Project-Alpha" both slug to `project-alpha`. In a
+throwaway data directory this records runs for each through its own
+journal and `RunStore`, imports both journals again (as a restart after a
+crash would), saves a stopwatch state for one of them, and checks that:
+
+1. the two projects get different journal files, while names the history
+   database treats as one project ("project alpha") share one;
+2. each project's runs are stored once, under its own name, after any
+   number of imports;
+3. a run appended to an idle `RunStore` is visible to another connection
+   straight away, without waiting for the batch to fill;
+4. the saved state is found for its own project only, so `tm sw --resume`
+   can't pick up the other project's stopwatch.
+
+Exits with code 1 if a check fails.
+
+Usage:
+    python benchmarks/project_keys.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.journal import Journal, journal_path  # noqa: E402
+from core.runlog import NS_PER_SECOND, StopwatchRun  # noqa: E402
+from core.state import StateFile, StopwatchState  # noqa: E402
+from core.store import RunStore  # noqa: E402
+
+NAMES = ("Project Alpha", "Project-Alpha")
+
+
+def _runs(first_start_s: int, count: int) -> list[StopwatchRun]:
+    runs = []
+    for i in range(count):
+        start_ns = (first_start_s + 60 * i) * NS_PER_SECOND
+        runs.append(StopwatchRun(start_ns, start_ns + NS_PER_SECOND, NS_PER_SECOND))
+    return runs
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.parse_args()
+    failed = False
+
+    def report(ok: bool, message: str) -> None:
+        nonlocal failed
+        failed |= not ok
+        print(f"{'ok' if ok else 'FAIL':4}  {message}")
+
+    with tempfile.TemporaryDirectory() as root:
+        os.environ["XDG_DATA_HOME"] = os.path.join(root, "data")
+        os.environ["XDG_STATE_HOME"] = os.path.join(root, "state")
+        paths = [journal_path(name) for name in NAMES]
+        report(
+            paths[0] != paths[1] and journal_path("project alpha") == paths[0],
+            f"journals: {', '.join(path.name for path in paths)}",
+        )
+
+        # Interleaved runs, so neither project's newest run hides the other's.
+        expected = {
+            NAMES[0]: _runs(1_700_000_000, 5),
+            NAMES[1]: _runs(1_700_000_030, 5),
+        }
+        for name, runs in expected.items():
+            with Journal.for_project(name) as journal:
+                for run in runs:
+                    journal.append(run)
+
+        store_file = Path(root) / "history.sqlite3"
+        for _ in range(3):
+            with RunStore(store_file) as store:
+                for name in NAMES:
+                    store.import_journal(name, journal_path(name))
+
+        with RunStore(store_file) as store:
+            for name, runs in expected.items():
+                stored = sorted(run.start_ns for _, run in store.query(project=name))
+                report(
+                    stored == [run.start_ns for run in runs],
+                    f"{name!r}: {len(stored)} runs stored (expected {len(runs)})",
+                )
+
+        with RunStore(store_file) as writer, RunStore(store_file) as reader:
+            run = _runs(1_800_000_000, 1)[0]
+            writer.append(NAMES[0], run)
+            seen = [r.start_ns for _, r in reader.query(project=NAMES[0], limit=1)]
+            report(
+                seen == [run.start_ns],
+                "a run appended to an idle store is visible to other readers",
+            )
+
+        saved = StopwatchState(True, 5 * NS_PER_SECOND, 1_700_000_000, 1_700_000_001)
+        state = StateFile.for_project(NAMES[0])
+        state.write(saved)
+        state.close()
+        found = []
+        for name in NAMES:
+            state = StateFile.for_project(name)
+            found.append(state.read())
+            state.close()
+        report(
+            found == [saved, None],
+            f"state saved for {NAMES[0]!r}: read back as {found}",
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
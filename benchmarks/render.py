@@ -0,0 +1,134 @@
+"""Bytes and CPU per frame: ANSI damage-tracking renderer vs. Rich `Live`.
+
+Replays an hour of a plain-mode stopwatch (one frame per displayed second,
+a lap every 10 minutes, a pause in the middle) through both panel renderers
+into an in-memory 80x24 terminal, and reports the bytes written and the CPU
+time per frame, frame construction included. Exits with code 1 if the ANSI
+renderer isn't at least `--min-ratio` times smaller than Rich, or costs more
+CPU per frame.
+
+Usage:
+    python benchmarks/render.py
+    python benchmarks/render.py --seconds 600
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from cli.cli import _stopwatch_frame  # noqa: E402
+from cli.render import AnsiPanelRenderer, RichPanelRenderer  # noqa: E402
+from core.formatting import format_hms  # noqa: E402
+from core.stats import LapStats  # noqa: E402
+
+SUBTITLE = "Space: Start/Stop | l: Lap | r: Reset | q: Quit"
+WIDTH = 80
+
+
+class _CountingTerminal(io.StringIO):
+    """Stands in for the TTY; counts the encoded bytes written to it."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.bytes = 0
+
+    def write(self, data: str) -> int:
+        self.bytes += len(data.encode())
+        return len(data)
+
+    def isatty(self) -> bool:
+        return True
+
+
+def _frames(seconds: int):
+    """Yield `(time_str, running, laps)` for each frame of the replay."""
+    laps = LapStats()
+    paused = range(seconds // 2, seconds // 2 + 30)
+    for second in range(seconds):
+        if second and second % 600 == 0:
+            laps.add(600.0)
+        yield format_hms(second), second not in paused, laps
+
+
+def _replay(renderer, seconds: int) -> tuple[int, float]:
+    frames = 0
+    last_view = None
+    started = time.process_time()
+    with renderer:
+        for time_str, running, laps in _frames(seconds):
+            view = (time_str, running, laps.count)
+            if view == last_view:
+                continue
+            last_view = view
+            lines, border_style = _stopwatch_frame(time_str, running, laps)
+            renderer.render(lines, border_style=border_style)
+            frames += 1
+    return frames, time.process_time() - started
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=int, default=3600, help="Replay length.")
+    parser.add_argument(
+        "--min-ratio",
+        type=float,
+        default=10.0,
+        help="Required Rich/ANSI bytes ratio.",
+    )
+    args = parser.parse_args()
+
+    from rich.console import Console
+
+    rich_tty = _CountingTerminal()
+    console = Console(
+        file=rich_tty,
+        force_terminal=True,
+        width=WIDTH,
+        height=24,
+        color_system="standard",
+    )
+    rich_frames, rich_cpu = _replay(
+        RichPanelRenderer("Stopwatch", SUBTITLE, console=console), args.seconds
+    )
+
+    ansi_tty = _CountingTerminal()
+    ansi_frames, ansi_cpu = _replay(
+        AnsiPanelRenderer(
+            "Stopwatch", SUBTITLE, write=ansi_tty.write, width=lambda: WIDTH
+        ),
+        args.seconds,
+    )
+
+    results = [
+        ("rich", rich_frames, rich_tty.bytes, rich_cpu),
+        ("ansi", ansi_frames, ansi_tty.bytes, ansi_cpu),
+    ]
+    for name, frames, written, cpu in results:
+        print(
+            f"{name:5} {frames:6} frames  {written / frames:8.1f} B/frame  "
+            f"{written / 1024:8.1f} KiB total  {cpu / frames * 1e6:8.1f} us/frame"
+        )
+
+    ratio = rich_tty.bytes / max(1, ansi_tty.bytes)
+    checks = [
+        (ratio >= args.min_ratio, f"ANSI writes {ratio:.1f}x fewer bytes"),
+        (
+            ansi_cpu / ansi_frames <= rich_cpu / rich_frames,
+            f"ANSI uses {rich_cpu / max(ansi_cpu, 1e-9):.1f}x less CPU per frame",
+        ),
+    ]
+    failed = False
+    for ok, message in checks:
+        failed |= not ok
+        print(f"{'ok' if ok else 'FAIL':4}  {message}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
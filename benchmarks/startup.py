@@ -0,0 +1,124 @@
+"""Cold-start benchmark for the `tm` entry points.
+
+Runs each scenario in a fresh interpreter with `python -X importtime`, reports
+the median wall time and total import time, and fails (exit code 1) if a
+scenario goes over its budget or imports a module it must not load.
+
+Usage:
+    python benchmarks/startup.py
+    python benchmarks/startup.py --runs 20 --scale 1.5
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    argv: list[str]
+    budget_ms: float
+    forbidden: tuple[str, ...] = ()
+
+
+SCENARIOS: list[Scenario] = [
+    Scenario(
+        name="tm --version",
+        argv=[str(SRC_DIR / "launcher.py"), "--version"],
+        budget_ms=250.0,
+        forbidden=("rich", "textual"),
+    ),
+    Scenario(
+        # Prompt/status-bar path; see benchmarks/status.py for its tight budget.
+        name="tm status",
+        argv=[str(SRC_DIR / "launcher.py"), "status"],
+        budget_ms=150.0,
+        forbidden=("typer", "rich", "textual", "asyncio"),
+    ),
+    Scenario(
+        # Everything the plain `tm cd 5 m` / `tm sw` path imports before the
+        # first frame, without actually entering the render loop.
+        name="tm cd (plain CLI imports)",
+        argv=["-c", "import app, cli.cli"],
+        budget_ms=300.0,
+        forbidden=("textual",),
+    ),
+]
+
+
+def _run_once(argv: list[str]) -> tuple[float, float, set[str]]:
+    env = dict(os.environ, PYTHONPATH=str(SRC_DIR), PYTHONDONTWRITEBYTECODE="1")
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *argv],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+
+    import_us = 0
+    modules: set[str] = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            import_us += int(cumulative)
+        modules.add(name.strip())
+
+    return wall_ms, import_us / 1000, modules
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="Runs per scenario.")
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Multiply every budget (e.g. for slow CI machines).",
+    )
+    args = parser.parse_args()
+
+    failed = False
+    for scenario in SCENARIOS:
+        walls: list[float] = []
+        imports: list[float] = []
+        loaded: set[str] = set()
+        for _ in range(max(1, args.runs)):
+            wall_ms, import_ms, modules = _run_once(scenario.argv)
+            walls.append(wall_ms)
+            imports.append(import_ms)
+            loaded |= modules
+
+        wall = statistics.median(walls)
+        budget = scenario.budget_ms * args.scale
+        leaked = sorted(m for m in loaded if m.split(".", 1)[0] in scenario.forbidden)
+        ok = wall <= budget and not leaked
+        failed |= not ok
+
+        status = "ok" if ok else "FAIL"
+        print(
+            f"{status:4}  {scenario.name:28} wall {wall:7.1f} ms "
+            f"(budget {budget:.0f} ms)  imports {statistics.median(imports):7.1f} ms"
+        )
+        if leaked:
+            print(f"      unexpected imports: {', '.join(leaked[:5])}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,147 @@
+"""Latency benchmark for `tm status`.
+
+Publishes a few live snapshots (a running stopwatch, a running and a paused
+countdown) in a throwaway runtime directory, then measures:
+
+1. `tm status` as a process, minus the cost of starting a bare interpreter
+   (`python -c pass`); this is the part `tm` is responsible for, and it must
+   stay under the 5 ms budget;
+2. the in-process read-and-format path, which must stay far below it.
+
+Exits with code 1 if either goes over budget or `tm status` loads a module
+it must not (Typer, Rich, Textual, or the daemon's socket client).
+
+Usage:
+    python benchmarks/status.py
+    python benchmarks/status.py --runs 50 --scale 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import compileall
+import io
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+# Wall time of `tm status` over a bare interpreter start, median.
+PROCESS_BUDGET_MS = 5.0
+# One in-process `tm status` (listdir, read, format), 99th percentile.
+CALL_BUDGET_MS = 0.5
+FORBIDDEN = ("typer", "rich", "textual", "asyncio", "socket", "json", "pathlib")
+
+
+def _wall_ms(argv: list[str], env: dict[str, str]) -> float:
+    started = time.perf_counter()
+    subprocess.run(argv, env=env, capture_output=True, check=False)
+    return (time.perf_counter() - started) * 1000
+
+
+def _loaded_modules(env: dict[str, str]) -> set[str]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", str(SRC_DIR / "launcher.py"), "status"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    return {
+        line.rsplit("|", 1)[1].strip()
+        for line in proc.stderr.splitlines()
+        if line.startswith("import time:") and "|" in line
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20, help="Process runs.")
+    parser.add_argument("--calls", type=int, default=2000, help="In-process calls.")
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Multiply every budget (e.g. for slow CI machines).",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="tm-status-bench-") as tmp:
+        os.environ["XDG_RUNTIME_DIR"] = tmp
+        env = dict(os.environ, PYTHONPATH=str(SRC_DIR))
+
+        from cli.client import status
+        from core.snapshot import LiveSnapshot
+        from core.termclock import Countdown, Stopwatch
+
+        stopwatch = Stopwatch()
+        stopwatch.start()
+        paused = Countdown(25 * 60)
+        paused.pause()
+        snapshots = [
+            LiveSnapshot.for_stopwatch("Project Alpha", stopwatch),
+            LiveSnapshot.for_countdown("tea", Countdown(3 * 60)),
+            LiveSnapshot.for_countdown("pomodoro", paused),
+        ]
+        failed = False
+        try:
+            # Byte-compile first, as an installed package would be.
+            compileall.compile_dir(SRC_DIR, quiet=1)
+            bare, tm = [], []
+            for _ in range(max(1, args.runs)):
+                bare.append(_wall_ms([sys.executable, "-c", "pass"], env))
+                tm.append(
+                    _wall_ms(
+                        [sys.executable, str(SRC_DIR / "launcher.py"), "status"], env
+                    )
+                )
+            overhead = statistics.median(tm) - statistics.median(bare)
+            budget = PROCESS_BUDGET_MS * args.scale
+            leaked = sorted(
+                m for m in _loaded_modules(env) if m.split(".", 1)[0] in FORBIDDEN
+            )
+            ok = overhead <= budget and not leaked
+            failed |= not ok
+            print(
+                f"{'ok' if ok else 'FAIL':4}  tm status process   "
+                f"+{overhead:5.2f} ms over bare python (budget {budget:.0f} ms; "
+                f"wall {statistics.median(tm):.1f} ms)"
+            )
+            if leaked:
+                print(f"      unexpected imports: {', '.join(leaked[:5])}")
+
+            samples = []
+            sink = io.StringIO()
+            with redirect_stdout(sink):
+                for _ in range(max(1, args.calls)):
+                    started = time.perf_counter()
+                    status([])
+                    samples.append((time.perf_counter() - started) * 1000)
+                    sink.seek(0)
+                    sink.truncate()
+            samples.sort()
+            p99 = samples[min(len(samples) - 1, int(0.99 * len(samples)))]
+            budget = CALL_BUDGET_MS * args.scale
+            ok = p99 <= budget
+            failed |= not ok
+            print(
+                f"{'ok' if ok else 'FAIL':4}  tm status in-process "
+                f"p50 {statistics.median(samples) * 1000:6.1f} us  "
+                f"p99 {p99 * 1000:6.1f} us (budget {budget * 1000:.0f} us)"
+            )
+        finally:
+            for snapshot in snapshots:
+                snapshot.close()
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,110 @@
+"""Check that `Stopwatch` time doesn't drift over many start/stop cycles.
+
+Drives a `Stopwatch` through `--toggles` start/stop calls (a million by
+default) with an injected integer clock that advances by irregular,
+non-round amounts of nanoseconds between calls, and checks that:
+
+1. `elapsed_ns` equals `runs.total_ns` and the exact sum of the time
+   spent running, to the nanosecond;
+2. every run recorded in `runs` has the duration it was given;
+3. `elapsed` is that sum converted to seconds once, not an accumulation
+   of rounded floats.
+
+For comparison it also prints how far summing the same runs as float
+seconds would have drifted. Exits with code 1 if a check fails.
+
+Usage:
+    python benchmarks/stopwatch_drift.py
+    python benchmarks/stopwatch_drift.py --toggles 100000 --seed 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.runlog import NS_PER_SECOND  # noqa: E402
+from core.termclock import Stopwatch  # noqa: E402
+
+
+class FakeClock:
+    """An integer nanosecond clock that only moves when told to."""
+
+    def __init__(self, start_ns: int = 1_700_000_000 * NS_PER_SECOND) -> None:
+        self.now_ns = start_ns
+
+    def __call__(self) -> int:
+        return self.now_ns
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--toggles",
+        type=int,
+        default=1_000_000,
+        help="Number of start/stop calls (default 1000000).",
+    )
+    parser.add_argument("--seed", type=int, default=1234, help="Random seed.")
+    args = parser.parse_args()
+    failed = False
+
+    def report(ok: bool, message: str) -> None:
+        nonlocal failed
+        failed |= not ok
+        print(f"{'ok' if ok else 'FAIL':4}  {message}")
+
+    rng = random.Random(args.seed)
+    clock = FakeClock()
+    stopwatch = Stopwatch(clock=clock, wall_clock=clock, name="Drift bench")
+
+    expected_ns = 0
+    durations: list[int] = []
+    float_total = 0.0
+
+    def advance() -> None:
+        nonlocal expected_ns, float_total
+        # Up to ~6 s, rarely a round number of nanoseconds.
+        step_ns = rng.randrange(1, 1 << 31) * 3 + 1
+        clock.now_ns += step_ns
+        if stopwatch.is_running:
+            expected_ns += step_ns
+            durations.append(step_ns)
+            float_total += step_ns / NS_PER_SECOND
+
+    for _ in range(args.toggles):
+        advance()
+        stopwatch.toggle()
+    if stopwatch.is_running:
+        advance()
+        stopwatch.stop()
+
+    runs = stopwatch.runs
+    report(
+        stopwatch.elapsed_ns == runs.total_ns == expected_ns,
+        f"{args.toggles} toggles, {len(runs)} runs: elapsed_ns "
+        f"{stopwatch.elapsed_ns}, runs.total_ns {runs.total_ns}, "
+        f"expected {expected_ns}",
+    )
+    mismatched = sum(
+        run.duration_ns != duration for run, duration in zip(runs, durations)
+    )
+    report(
+        len(runs) == len(durations) and not mismatched,
+        f"{mismatched} of {len(runs)} runs recorded with the wrong duration",
+    )
+    report(
+        stopwatch.elapsed == expected_ns / NS_PER_SECOND,
+        f"elapsed {stopwatch.elapsed!r} s",
+    )
+    drift_ns = round(float_total * NS_PER_SECOND) - expected_ns
+    print(f"      summing the runs as float seconds would be off by {drift_ns} ns")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
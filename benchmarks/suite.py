@@ -0,0 +1,425 @@
+"""Micro-benchmark suite for the core and rendering hot paths.
+
+Times the functions every frame or summary goes through, at realistic and
+extreme sizes (1 to 1M stopwatch runs where the input has a size), plus the
+cold start of each entry point, and writes the results as JSON:
+
+    {"meta": {...}, "results": {"<case>[size]": {"ns_per_op": ..., ...}}}
+
+With `--compare OLD.json`, each case is also compared against an earlier
+run and the suite exits with code 1 if any got slower than `--threshold`
+times its old best round. Runs offline; only the standard library is needed
+beyond what `tm` itself imports (Rich, for the Rich renderer cases).
+
+Usage:
+    python benchmarks/suite.py
+    python benchmarks/suite.py --quick --output /tmp/new.json
+    python benchmarks/suite.py --compare benchmarks/results/old.json
+    python benchmarks/suite.py --filter timeline --max-seconds 60
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+SRC_DIR = BENCH_DIR.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+sys.path.insert(0, str(BENCH_DIR))
+
+from cli.cli import (  # noqa: E402
+    _countdown_frame,
+    _stopwatch_frame,
+    print_stopwatch_summary,
+)
+from cli.render import AnsiPanelRenderer, RichPanelRenderer  # noqa: E402
+from core.formatting import (  # noqa: E402
+    format_hms,
+    format_stopwatch_timeline,
+    format_time,
+)
+from core.runlog import RunLog  # noqa: E402
+from core.stats import LapStats  # noqa: E402
+from core.termclock import Countdown, Stopwatch  # noqa: E402
+from startup import SCENARIOS, _run_once  # noqa: E402
+
+RESULTS_DIR = BENCH_DIR / "results"
+RUN_SIZES = (1, 1_000, 100_000, 1_000_000)
+QUICK_MAX_SIZE = 10_000
+# Each timing round runs the case at least this long.
+ROUND_SECONDS = 0.05
+ROUNDS = 5
+SUBTITLE = "Space: Start/Stop | l: Lap | r: Reset | q: Quit"
+
+
+@dataclass(frozen=True)
+class Case:
+    """`setup(size)` builds the input and returns the function to time."""
+
+    name: str
+    setup: Callable[[int], Callable[[], object]]
+    sizes: tuple[int, ...] = (1,)
+
+
+def _runs(count: int) -> RunLog:
+    """`count` back-to-back 25-minute runs starting a week ago."""
+    log = RunLog()
+    start = time.time_ns() - 7 * 24 * 3600 * 10**9
+    run_ns = 25 * 60 * 10**9
+    for _ in range(count):
+        log.append(start, start + run_ns, run_ns)
+        start += run_ns + 5 * 60 * 10**9
+    return log
+
+
+def _format_many(count: int) -> Callable[[], object]:
+    values = [i * 0.37 for i in range(count)]
+
+    def run() -> None:
+        for value in values:
+            format_time(value, show_centiseconds=False)
+
+    return run
+
+
+def _format_frames(count: int) -> Callable[[], object]:
+    # What a 60 fps render loop asks for: each second, 60 times over.
+    values = [i / 60 for i in range(count)]
+
+    def run() -> None:
+        for value in values:
+            format_hms(value)
+
+    return run
+
+
+def _running_stopwatch(_size: int) -> Callable[[], object]:
+    stopwatch = Stopwatch()
+    stopwatch.start()
+    return lambda: stopwatch.elapsed
+
+
+def _start_stop(_size: int) -> Callable[[], object]:
+    stopwatch = Stopwatch()
+
+    def run() -> None:
+        stopwatch.start()
+        stopwatch.stop()
+
+    return run
+
+
+def _countdown_tick(_size: int) -> Callable[[], object]:
+    countdown = Countdown(3600)
+    return countdown.tick
+
+
+def _countdown_time_left(_size: int) -> Callable[[], object]:
+    countdown = Countdown(3600)
+    return lambda: countdown.time_left
+
+
+def _timeline(count: int) -> Callable[[], object]:
+    runs = _runs(count)
+    return lambda: format_stopwatch_timeline(runs)
+
+
+def _summary(count: int) -> Callable[[], object]:
+    runs = _runs(count)
+    total = runs.total_ns / 1e9
+    sink = io.StringIO()
+
+    def run() -> None:
+        sink.seek(0)
+        sink.truncate()
+        stdout, sys.stdout = sys.stdout, sink
+        try:
+            print_stopwatch_summary("Bench", total, runs)
+        finally:
+            sys.stdout = stdout
+
+    return run
+
+
+def _laps(count: int) -> LapStats:
+    laps = LapStats()
+    for i in range(count):
+        laps.add(60.0 + (i % 17))
+    return laps
+
+
+def _stopwatch_frame_case(laps: int) -> Callable[[], object]:
+    stats = _laps(laps)
+    return lambda: _stopwatch_frame("00:42:17", True, stats)
+
+
+def _countdown_frame_case(_size: int) -> Callable[[], object]:
+    return lambda: _countdown_frame("04:59", 299.0, True)
+
+
+def _ansi_render(_size: int) -> Callable[[], object]:
+    panel = AnsiPanelRenderer(
+        "Stopwatch", SUBTITLE, write=lambda data: None, width=lambda: 80
+    )
+    frames = [_stopwatch_frame(f"00:00:{s:02}", True, LapStats()) for s in range(60)]
+    state = {"i": 0}
+
+    def run() -> None:
+        lines, border_style = frames[state["i"] % 60]
+        state["i"] += 1
+        panel.render(lines, border_style=border_style)
+
+    return run
+
+
+def _rich_render(_size: int) -> Callable[[], object]:
+    from rich.console import Console
+
+    console = Console(file=io.StringIO(), force_terminal=True, width=80)
+    panel = RichPanelRenderer("Stopwatch", SUBTITLE, console=console)
+    frames = [_stopwatch_frame(f"00:00:{s:02}", True, LapStats()) for s in range(60)]
+    state = {"i": 0}
+
+    def run() -> None:
+        lines, border_style = frames[state["i"] % 60]
+        state["i"] += 1
+        panel.render(lines, border_style=border_style)
+        console.file.seek(0)
+        console.file.truncate()
+
+    return run
+
+
+CASES: list[Case] = [
+    Case("format_time", lambda _: lambda: format_time(3725.5)),
+    Case(
+        "format_time.no_centiseconds",
+        lambda _: lambda: format_time(3725.5, show_centiseconds=False),
+    ),
+    Case("format_time_batch", _format_many, (1, 1_000, 1_000_000)),
+    Case("format_hms", lambda _: lambda: format_hms(3725.5)),
+    Case("format_hms.frames", _format_frames, (1_000, 1_000_000)),
+    Case("stopwatch.elapsed", _running_stopwatch),
+    Case("stopwatch.start_stop", _start_stop),
+    Case("countdown.tick", _countdown_tick),
+    Case("countdown.time_left", _countdown_time_left),
+    Case("format_stopwatch_timeline", _timeline, RUN_SIZES),
+    Case("print_stopwatch_summary", _summary, RUN_SIZES),
+    Case("frame.stopwatch", _stopwatch_frame_case, (0, 1_000)),
+    Case("frame.countdown", _countdown_frame_case),
+    Case("frame.render_ansi", _ansi_render),
+    Case("frame.render_rich", _rich_render),
+]
+
+
+def _time_case(fn: Callable[[], object], max_seconds: float) -> dict:
+    """Time `fn`: calibrate the calls per round, then take ROUNDS rounds."""
+    started = time.perf_counter_ns()
+    fn()
+    first_ns = time.perf_counter_ns() - started
+    if first_ns > ROUND_SECONDS * 1e9:
+        # Slow case: a few single calls, within the time budget.
+        rounds = max(1, min(ROUNDS, int(max_seconds * 1e9 // first_ns)))
+        samples = [first_ns]
+        for _ in range(rounds - 1):
+            started = time.perf_counter_ns()
+            fn()
+            samples.append(time.perf_counter_ns() - started)
+        number = 1
+    else:
+        number = max(1, int(ROUND_SECONDS * 1e9 // max(first_ns, 1)))
+        samples = []
+        for _ in range(ROUNDS):
+            started = time.perf_counter_ns()
+            for _ in range(number):
+                fn()
+            samples.append((time.perf_counter_ns() - started) / number)
+    return {
+        "ns_per_op": statistics.median(samples),
+        "min_ns": min(samples),
+        "stdev_ns": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "rounds": len(samples),
+        "ops_per_round": number,
+    }
+
+
+def _run_cases(args: argparse.Namespace) -> dict[str, dict]:
+    results: dict[str, dict] = {}
+    for case in CASES:
+        if args.filter and args.filter not in case.name:
+            continue
+        previous = None  # (size, ns) of the last size that ran
+        for size in case.sizes:
+            key = case.name if case.sizes == (1,) else f"{case.name}[{size}]"
+            if args.quick and size > QUICK_MAX_SIZE:
+                continue
+            if previous and previous[1] * size / max(previous[0], 1) > (
+                args.max_seconds * 1e9
+            ):
+                # Assume linear growth; don't start a call we can't afford.
+                results[key] = {"skipped": f"estimated over {args.max_seconds:g} s"}
+                print(f"  {key:42} skipped (estimated over {args.max_seconds:g} s)")
+                continue
+            fn = case.setup(size)
+            result = _time_case(fn, args.max_seconds)
+            result["size"] = size
+            if size > 1:
+                result["ns_per_item"] = result["ns_per_op"] / size
+            results[key] = result
+            previous = (size, result["ns_per_op"])
+            per_item = (
+                f"  ({_format_ns(result['ns_per_item'])}/item)" if size > 1 else ""
+            )
+            print(f"  {key:42} {_format_ns(result['ns_per_op']):>10}{per_item}")
+    return results
+
+
+def _run_startup(args: argparse.Namespace) -> dict[str, dict]:
+    results: dict[str, dict] = {}
+    for scenario in SCENARIOS:
+        key = f"startup:{scenario.name}"
+        if args.filter and args.filter not in key:
+            continue
+        walls = [_run_once(scenario.argv)[0] for _ in range(args.startup_runs)]
+        ns = statistics.median(walls) * 1e6
+        results[key] = {
+            "ns_per_op": ns,
+            "min_ns": min(walls) * 1e6,
+            "stdev_ns": statistics.stdev(walls) * 1e6 if len(walls) > 1 else 0.0,
+            "rounds": len(walls),
+            "ops_per_round": 1,
+        }
+        print(f"  {key:42} {_format_ns(ns):>10}")
+    return results
+
+
+def _meta() -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BENCH_DIR,
+            capture_output=True,
+            text=True,
+            check=False,
+        ).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit or None,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def _compare(old: dict, new: dict, threshold: float) -> bool:
+    """Print old vs. new timings; return True if anything regressed.
+
+    Compares the fastest round of each: scheduler noise only ever adds time,
+    so the minimum is the steadiest estimate on a busy machine.
+    """
+    regressed = False
+    print(f"\nCompared with {old['meta'].get('commit')} ({old['meta']['timestamp']}):")
+    for key, result in new["results"].items():
+        before = old["results"].get(key, {})
+        if "min_ns" not in result or "min_ns" not in before:
+            continue
+        ratio = result["min_ns"] / before["min_ns"]
+        flag = ""
+        if ratio > threshold:
+            flag = "  REGRESSION"
+            regressed = True
+        elif ratio < 1 / threshold:
+            flag = "  faster"
+        print(
+            f"  {key:42} {_format_ns(before['min_ns']):>10} -> "
+            f"{_format_ns(result['min_ns']):>10}  x{ratio:5.2f}{flag}"
+        )
+    return regressed
+
+
+def _format_ns(ns: float) -> str:
+    if ns < 1e3:
+        return f"{ns:.0f} ns"
+    if ns < 1e6:
+        return f"{ns / 1e3:.2f} us"
+    if ns < 1e9:
+        return f"{ns / 1e6:.2f} ms"
+    return f"{ns / 1e9:.2f} s"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="Where to write the JSON results "
+        "(default: benchmarks/results/<timestamp>.json).",
+    )
+    parser.add_argument("--compare", type=Path, help="Earlier results to compare.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="Flag cases slower than this multiple of --compare (default 1.25).",
+    )
+    parser.add_argument("--filter", help="Only run cases whose name contains this.")
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help=f"Skip sizes above {QUICK_MAX_SIZE:,} runs.",
+    )
+    parser.add_argument(
+        "--max-seconds",
+        type=float,
+        default=30.0,
+        help="Skip a size whose single call is expected to take longer.",
+    )
+    parser.add_argument(
+        "--startup-runs", type=int, default=5, help="Runs per entry point."
+    )
+    parser.add_argument(
+        "--no-startup", action="store_true", help="Skip the entry-point timings."
+    )
+    args = parser.parse_args()
+
+    meta = _meta()
+    print("Hot paths:")
+    results = _run_cases(args)
+    if not args.no_startup:
+        print("Startup:")
+        results.update(_run_startup(args))
+    report = {"meta": meta, "results": results}
+
+    output = args.output
+    if output is None:
+        stamp = meta["timestamp"].replace(":", "").replace("+0000", "Z")
+        output = RESULTS_DIR / f"{stamp}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print(f"\nWrote {output}")
+
+    if args.compare:
+        old = json.loads(args.compare.read_text(encoding="utf-8"))
+        if _compare(old, report, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
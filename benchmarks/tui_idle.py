@@ -0,0 +1,116 @@
+"""CPU cost of leaving `tm sw` and `tm cd` open in the Textual TUI.
+
+Runs `StopwatchTui` and `CountdownTui` headless under Textual's test pilot
+(no terminal needed), each once running and once paused, and for each run
+measures the CPU time the whole process spends per minute of wall time
+(Textual included), how often the app checked the time and how often it
+redrew the digits. Checks that:
+
+1. a running timer checks the time about once per displayed second, and
+   redraws the digits no more often than that;
+2. a paused timer doesn't check the time at all;
+3. every run stays under a CPU budget per minute.
+
+Exits with code 1 if a check fails.
+
+Usage:
+    python benchmarks/tui_idle.py
+    python benchmarks/tui_idle.py --seconds 30 --scale 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from core.termclock import Countdown, Stopwatch  # noqa: E402
+from tui.countdown import CountdownTui  # noqa: E402
+from tui.stopwatch import StopwatchTui  # noqa: E402
+
+SIZE = (100, 40)
+# CPU seconds per minute of wall time, the app and Textual together (the
+# header clock redraws once a second either way). Polling the stopwatch at
+# 60 fps used to cost about 24 on a slow machine.
+CPU_BUDGET_RUNNING = 1.5
+CPU_BUDGET_PAUSED = 1.0
+
+
+def _stopwatch_app(running: bool) -> StopwatchTui:
+    stopwatch = Stopwatch(name="Idle bench")
+    stopwatch.restore(3_723 * 10**9, time.time_ns() if running else None)
+    return StopwatchTui("Idle bench", stopwatch=stopwatch)
+
+
+def _countdown_app(running: bool) -> CountdownTui:
+    countdown = Countdown(3_600, name="Idle bench")
+    if not running:
+        countdown.pause()
+    return CountdownTui(3_600, countdown=countdown)
+
+
+async def _measure(app, seconds: float) -> tuple[float, float, float]:
+    """CPU seconds per minute, time checks and digit redraws per second."""
+    async with app.run_test(size=SIZE) as pilot:
+        await pilot.pause(0.5)
+        ticks, updates = app.ticks, app.digit_updates
+        cpu = time.process_time()
+        wall = time.perf_counter()
+        await pilot.pause(seconds)
+        wall = time.perf_counter() - wall
+        cpu = (time.process_time() - cpu) / wall * 60
+        return (
+            cpu,
+            (app.ticks - ticks) / wall,
+            (app.digit_updates - updates) / wall,
+        )
+
+
+async def _run(args) -> int:
+    failed = False
+
+    def report(ok: bool, message: str) -> None:
+        nonlocal failed
+        failed |= not ok
+        print(f"{'ok' if ok else 'FAIL':4}  {message}")
+
+    for name, make_app in (
+        ("stopwatch", _stopwatch_app),
+        ("countdown", _countdown_app),
+    ):
+        for running in (True, False):
+            cpu, ticks, updates = await _measure(make_app(running), args.seconds)
+            label = f"{name} {'running' if running else 'paused'}"
+            if running:
+                report(
+                    ticks <= 1.2 and updates <= ticks,
+                    f"{label}: {ticks:.2f} time checks/s, {updates:.2f} redraws/s",
+                )
+            else:
+                report(ticks == 0, f"{label}: {ticks:.2f} time checks/s")
+            budget = (CPU_BUDGET_RUNNING if running else CPU_BUDGET_PAUSED) * args.scale
+            report(
+                cpu <= budget,
+                f"{label}: {cpu:.2f} CPU s per minute (budget {budget:g})",
+            )
+    return 1 if failed else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=10.0, help="Per run.")
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Multiply every budget (e.g. for slow CI machines).",
+    )
+    return asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -7,11 +7,19 @@ Commands:
 - `time-manager cd <amount> [unit]` Start a countdown timer
 - `tm cd <amount> [unit]`           Start a countdown timer
 - `tm countdown <amount> [unit]`    Start a countdown timer
+- `tm log` / `tm report`            Query recorded stopwatch history
+- `tm daemon`                       Run the background timer daemon
+- `tm start/stop/reset/status`      Control the daemon's timers
+
+`launcher.main` is the installed entry point; it answers the daemon client
+commands without importing this module (and so without Typer).
 """
 
 from __future__ import annotations
 
 import os
+import re
+import sys
 
 # Terminal emulators differ in how they advertise TrueColor support.
 # These defaults help keep Textual/Rich rendering consistent across Windows Terminal,
@@ -19,16 +27,18 @@ import os
 os.environ.setdefault("COLORTERM", "truecolor")
 os.environ.setdefault("RICH_COLOR_SYSTEM", "truecolor")
 
-from importlib import metadata as _metadata
-
 import typer
 
-from cli import run_countdown_cli, run_stopwatch_cli, print_stopwatch_summary
-from tui import CountdownTui, StopwatchTui
+from core.durations import UNIT_SECONDS as _UNIT_SECONDS
+from core.durations import parse_duration
+
+# `cli` (Rich) and `tui` (Textual) are imported inside the commands that use
+# them so that `tm --version`, `tm --help` and argument errors stay fast.
 
 _ALIASES: dict[str, str] = {
     "stopwatch": "sw",
     "countdown": "cd",
+    "dashboard": "dash",
 }
 
 
@@ -57,6 +67,9 @@ app = typer.Typer(
         "  tm cd 5 m\n"
         "  tm cd 5 m -i\n"
         "  tm countdown 10 s\n"
+        "  tm cd tea=3m standup=15m\n"
+        "  tm log -n Project\n"
+        "  tm report week\n"
     ),
     cls=_TmGroup,
     add_completion=False,
@@ -69,8 +82,43 @@ INTERACTIVE = typer.Option(
     help="Run in interactive (Textual TUI) mode.",
 )
 
+RENDERER = typer.Option(
+    "auto",
+    "--renderer",
+    help=(
+        "Plain-mode drawing: 'ansi' repaints only changed characters, 'rich' "
+        "redraws the panel with Rich, 'auto' uses ansi on capable terminals."
+    ),
+    show_default=True,
+)
+
+PLAIN = typer.Option(
+    False,
+    "--plain",
+    help=(
+        "Write a line per event (start, progress, pause, finish) instead of "
+        "drawing. The default when not on a terminal."
+    ),
+)
+
+JSONL = typer.Option(
+    False,
+    "--jsonl",
+    help="Like --plain, but write each event as a JSON object.",
+)
+
+EVERY = typer.Option(
+    "1m",
+    "--every",
+    metavar="DURATION",
+    help="With --plain/--jsonl, how often to report progress (e.g. '30s', '5m').",
+    show_default=True,
+)
+
 
 def _get_version() -> str:
+    from importlib import metadata as _metadata
+
     for dist_name in ("time-manager", "tm"):
         try:
             return _metadata.version(dist_name)
@@ -86,33 +134,63 @@ def _version_callback(value: bool) -> None:
     raise typer.Exit()
 
 
-_UNIT_SECONDS: dict[str, int] = {
-    # seconds
-    "s": 1,
-    "sec": 1,
-    "secs": 1,
-    "second": 1,
-    "seconds": 1,
-    # minutes
-    "m": 60,
-    "min": 60,
-    "mins": 60,
-    "minute": 60,
-    "minutes": 60,
-    # hours
-    "h": 3600,
-    "hr": 3600,
-    "hrs": 3600,
-    "hour": 3600,
-    "hours": 3600,
-}
-
-
 def _die(message: str) -> None:
     typer.secho(f"Error: {message}", fg=typer.colors.RED, err=True)
     raise typer.Exit(code=1)
 
 
+def _attach_event_log() -> None:
+    """Append timer events to $TM_EVENTS, if it is set."""
+    if not os.environ.get("TM_EVENTS"):
+        return
+    from core.events import attach_from_env
+
+    try:
+        attach_from_env()
+    except OSError as exc:
+        _die(f"Can't write events to '{os.environ['TM_EVENTS']}': {exc.strerror}.")
+
+
+def _check_renderer(renderer: str) -> str:
+    from cli.render import RENDERERS
+
+    if renderer not in RENDERERS:
+        _die(f"Unknown renderer '{renderer}'. Use one of: {', '.join(RENDERERS)}.")
+    return renderer
+
+
+def _attach_stopwatch(name: str, renderer: str) -> None:
+    from core.snapshot import LiveView
+
+    view = LiveView.find((name or "").strip() or "Untitled")
+    if view is None:
+        _die(f"No running stopwatch named '{name}'.")
+    from cli import watch_stopwatch_cli
+
+    watch_stopwatch_cli(view, renderer=renderer)
+
+
+def _headless_output(plain: bool, jsonl: bool, interactive: bool) -> str | None:
+    """Pick the headless output: the one asked for, or 'plain' off a terminal."""
+    if plain and jsonl:
+        _die("Use either --plain or --jsonl, not both.")
+    if plain or jsonl:
+        if interactive:
+            _die("--plain and --jsonl can't be combined with interactive mode.")
+        return "jsonl" if jsonl else "plain"
+    if interactive or (sys.stdin.isatty() and sys.stdout.isatty()):
+        return None
+    # Without a terminal there are no keys to read and nothing to animate.
+    return "plain"
+
+
+def _parse_every(text: str) -> int:
+    seconds = _parse_duration_seconds(text)
+    if seconds <= 0:
+        _die("--every must be greater than 0.")
+    return seconds
+
+
 def _parse_countdown_seconds(amount: int, unit: str) -> int:
     if amount <= 0:
         _die("Time must be greater than 0.")
@@ -129,6 +207,55 @@ def _parse_countdown_seconds(amount: int, unit: str) -> int:
     return seconds
 
 
+def _open_stopwatch_session(name: str, *, resume: bool = False, store=None):
+    """Open the project's stopwatch session, without history if that fails.
+
+    `store` is an open `RunStore` to share with other sessions.
+    """
+    from core.session import StopwatchSession
+
+    try:
+        return StopwatchSession(name, resume=resume, store=store)
+    except LookupError:
+        _die(f"No saved stopwatch to resume for '{name}'.")
+    except Exception as exc:
+        if resume:
+            _die(f"Could not resume '{name}': {exc}")
+        typer.secho(
+            f"Warning: run history is disabled ({exc}).",
+            fg=typer.colors.YELLOW,
+            err=True,
+        )
+        return StopwatchSession(name, persist=False)
+
+
+def _parse_duration_seconds(text: str) -> int:
+    """Parse durations such as '90s', '5m', '1h' or '15 min' (default: minutes)."""
+    try:
+        return parse_duration(text)
+    except ValueError as exc:
+        _die(str(exc))
+
+
+def _parse_local_date_ns(text: str, *, end_of_day: bool = False) -> int:
+    """Parse an ISO date or datetime in local time to epoch nanoseconds.
+
+    With `end_of_day`, a bare date means the end of that day (exclusive).
+    """
+    from datetime import datetime, timedelta
+
+    try:
+        moment = datetime.fromisoformat(text)
+    except ValueError:
+        _die(f"Invalid date '{text}'. Use YYYY-MM-DD or YYYY-MM-DDTHH:MM.")
+
+    if end_of_day and len(text.strip()) <= 10:
+        moment += timedelta(days=1)
+    if moment.tzinfo is None:
+        moment = moment.astimezone()
+    return int(moment.timestamp()) * 1_000_000_000
+
+
 def _print_error_box(message: str) -> None:
     """Print an error message in a boxed panel when Rich is available."""
     try:
@@ -169,6 +296,7 @@ def _root(
     """
     ctx.ensure_object(dict)
     ctx.obj["interactive"] = interactive
+    _attach_event_log()
 
     if ctx.invoked_subcommand is not None:
         return
@@ -191,6 +319,31 @@ def sw(
         "-n",
         help="Project name to include in the summary.",
     ),
+    resume: bool = typer.Option(
+        False,
+        "--resume",
+        help="Continue the project's last stopwatch, counting time spent detached.",
+    ),
+    attach: str | None = typer.Option(
+        None,
+        "--attach",
+        metavar="NAME",
+        help="Watch the running stopwatch NAME from another terminal (read-only).",
+    ),
+    renderer: str = RENDERER,
+    plain: bool = PLAIN,
+    jsonl: bool = JSONL,
+    every: str = EVERY,
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Time every frame (input, format, build, write) and print a report.",
+    ),
+    profile_dump: str | None = typer.Option(
+        None,
+        "--profile-dump",
+        help="Write the raw per-frame samples to this CSV file (implies --profile).",
+    ),
 ) -> None:
     """
     Start a stopwatch.
@@ -198,35 +351,162 @@ def sw(
     Examples:
     tm sw
     tm sw -i
+    tm sw --resume -n "Project Alpha"
+    tm sw --profile --profile-dump frames.csv
+    tm sw --attach "Project Alpha"
+    tm sw --jsonl --every 5m > work.jsonl
     tm stopwatch
     """
     effective_interactive = bool(
         interactive or (ctx.obj or {}).get("interactive", False)
     )
-    if effective_interactive:
-        stopwatch_tui = StopwatchTui(project_name=name)
-        try:
-            stopwatch_tui.run()
-        finally:
-            if stopwatch_tui.stopwatch.is_running:
-                stopwatch_tui.stopwatch.stop()
-            print_stopwatch_summary(
-                name,
-                stopwatch_tui.stopwatch.elapsed,
-                stopwatch_tui.stopwatch.runs,
+    _check_renderer(renderer)
+    if attach is not None:
+        _attach_stopwatch(attach, renderer)
+        return
+    output = _headless_output(plain, jsonl, effective_interactive)
+    every_seconds = _parse_every(every)
+    if output is not None and (profile or profile_dump):
+        _die("--profile times the terminal display; it can't be used headless.")
+    profiler = None
+    if profile or profile_dump:
+        from core.profiler import FrameProfiler
+
+        # Textual puts a frame on screen at its next refresh, so a TUI frame
+        # is late only if it misses the refresh after that, too.
+        profiler = FrameProfiler(budget_s=(2 if effective_interactive else 1) / 60)
+    session = _open_stopwatch_session(name, resume=resume)
+    with session:
+        if effective_interactive:
+            from cli import print_stopwatch_summary
+            from tui import StopwatchTui
+
+            stopwatch_tui = StopwatchTui(
+                project_name=name, stopwatch=session.stopwatch, profiler=profiler
+            )
+            try:
+                stopwatch_tui.run()
+            finally:
+                if stopwatch_tui.stopwatch.is_running:
+                    stopwatch_tui.stopwatch.stop()
+                print_stopwatch_summary(
+                    name,
+                    stopwatch_tui.stopwatch.elapsed,
+                    stopwatch_tui.stopwatch.runs,
+                    stopwatch_tui.stopwatch.lap_stats,
+                )
+        elif output is not None:
+            from cli import run_stopwatch_headless
+
+            run_stopwatch_headless(
+                name, stopwatch=session.stopwatch, output=output, every=every_seconds
             )
-    else:
-        run_stopwatch_cli(name)
+        else:
+            from cli import run_stopwatch_cli
+
+            run_stopwatch_cli(
+                name, stopwatch=session.stopwatch, renderer=renderer, profiler=profiler
+            )
+
+    if profiler is not None:
+        profiler.print_report(profile_dump)
 
 
-@app.command(help="Start a countdown timer. (alias: countdown)")
+def _parse_timer_specs(tokens: list[str]) -> list[tuple[str | None, int]]:
+    """Parse countdown arguments into `(name, seconds)` pairs.
+
+    Accepts the classic `5 m` form as well as `5m`, `90s` and `tea=3m`; a
+    bare number followed by a unit token consumes it.
+    """
+    timers: list[tuple[str | None, int]] = []
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        name = None
+        if "=" in token:
+            name, token = token.split("=", 1)
+            name = name.strip() or None
+
+        match = re.fullmatch(r"\s*(-?\d+)\s*([a-zA-Z]*)\s*", token)
+        if match is None:
+            _die(f"Invalid duration '{token}'. Use e.g. '5 m', '90s' or 'tea=3m'.")
+
+        amount, unit = match.groups()
+        if not unit and i + 1 < len(tokens) and "=" not in tokens[i + 1]:
+            next_token = tokens[i + 1].lower().strip()
+            if next_token in _UNIT_SECONDS or not next_token[:1].isdigit():
+                unit = next_token
+                i += 1
+
+        timers.append((name, _parse_countdown_seconds(int(amount), unit or "m")))
+        i += 1
+    return timers
+
+
+def _read_timer_file(path: str) -> list[tuple[str | None, int]]:
+    """Read timers from a file, one `name duration` (or `name=duration`) a line."""
+    try:
+        with open(path, encoding="utf-8") as handle:
+            lines = handle.read().splitlines()
+    except OSError as exc:
+        _die(f"Could not read timer file '{path}': {exc.strerror}")
+
+    timers: list[tuple[str | None, int]] = []
+    for line in lines:
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        if "=" in line:
+            name, duration = line.split("=", 1)
+        else:
+            # The duration is the trailing `5m` or `5 m`; the rest is the name.
+            match = re.fullmatch(r"(.*?)\s*(\d+\s*[a-zA-Z]*)", line)
+            if match is None:
+                _die(f"Invalid timer line '{line}'. Use e.g. 'tea 3m'.")
+            name, duration = match.groups()
+        seconds = _parse_duration_seconds(duration)
+        if seconds <= 0:
+            _die("Time must be greater than 0.")
+        timers.append((name.strip() or None, seconds))
+    return timers
+
+
+def _label_timers(timers: list[tuple[str | None, int]]) -> list[tuple[str, int]]:
+    """Give every timer a unique name ('Timer 2', 'tea (3)')."""
+    named: list[tuple[str, int]] = []
+    seen: set[str] = set()
+    for index, (name, seconds) in enumerate(timers, 1):
+        label = name or f"Timer {index}"
+        if label in seen:
+            label = f"{label} ({index})"
+        seen.add(label)
+        named.append((label, seconds))
+    return named
+
+
+@app.command(help="Start one or more countdown timers. (alias: countdown)")
 def cd(
     ctx: typer.Context,
-    amount: int = typer.Argument(..., help="The amount of time."),
-    unit: str = typer.Argument(
-        "m", help="The unit of time. [s]econds, [m]inutes, [h]ours."
+    durations: list[str] = typer.Argument(
+        None,
+        help=(
+            "The amount of time and unit ([s]econds, [m]inutes, [h]ours), "
+            "e.g. '5 m'. Give several (e.g. '25m 5m' or 'tea=3m') to run "
+            "them together."
+        ),
+        show_default=False,
+    ),
+    timer_file: str | None = typer.Option(
+        None,
+        "--file",
+        "-f",
+        help="Read timers from a file with one 'name duration' per line.",
     ),
     interactive: bool = INTERACTIVE,
+    renderer: str = RENDERER,
+    plain: bool = PLAIN,
+    jsonl: bool = JSONL,
+    every: str = EVERY,
 ):
     """
     Start a countdown timer.
@@ -235,17 +515,337 @@ def cd(
     tm cd 5 m
     tm cd 5 m -i
     tm countdown 10 s
+    tm cd tea=3m standup=15m
+    tm cd -f timers.txt
+    tm cd 25m --plain --every 5m
     """
 
-    seconds = _parse_countdown_seconds(amount, unit)
+    _check_renderer(renderer)
+    timers = _parse_timer_specs(durations or [])
+    if timer_file:
+        timers += _read_timer_file(timer_file)
+    if not timers:
+        _die("Missing countdown duration, e.g. 'tm cd 5 m'.")
 
     effective_interactive = bool(
         interactive or (ctx.obj or {}).get("interactive", False)
     )
-    if effective_interactive:
-        CountdownTui(seconds).run()
-    else:
-        run_countdown_cli(seconds)
+    output = _headless_output(plain, jsonl, effective_interactive)
+    every_seconds = _parse_every(every)
+
+    if len(timers) > 1:
+        if effective_interactive:
+            _die("Interactive mode supports a single countdown.")
+        if output is not None:
+            from cli import run_countdowns_headless
+
+            run_countdowns_headless(
+                _label_timers(timers), output=output, every=every_seconds
+            )
+            return
+
+        from cli import run_countdowns_cli
+
+        run_countdowns_cli(_label_timers(timers))
+        return
+
+    name, seconds = timers[0]
+    from core.snapshot import LiveSnapshot
+    from core.termclock import Countdown
+
+    countdown = Countdown(seconds, name=name or "countdown")
+    with LiveSnapshot.for_countdown(name or "countdown", countdown):
+        if effective_interactive:
+            from tui import CountdownTui
+
+            CountdownTui(seconds, countdown=countdown).run()
+        elif output is not None:
+            from cli import run_countdown_headless
+
+            run_countdown_headless(
+                seconds, countdown=countdown, output=output, every=every_seconds
+            )
+        else:
+            from cli import run_countdown_cli
+
+            run_countdown_cli(seconds, countdown=countdown, renderer=renderer)
+
+
+@app.command(help="Show many stopwatches and countdowns in one TUI. (alias: dashboard)")
+def dash(
+    durations: list[str] = typer.Argument(
+        None,
+        help="Countdowns to add, e.g. 'tea=3m standup=15m'.",
+        show_default=False,
+    ),
+    stopwatches: list[str] = typer.Option(
+        [],
+        "--sw",
+        "-s",
+        help="Add a stopwatch for this project (repeat for more).",
+        show_default=False,
+    ),
+    timer_file: str | None = typer.Option(
+        None,
+        "--file",
+        "-f",
+        help="Read countdowns from a file with one 'name duration' per line.",
+    ),
+) -> None:
+    """
+    Show many stopwatches and countdowns in one TUI.
+
+    Stopwatches start paused; select one with the arrow keys and press
+    Space to start or stop it. Their runs are recorded like `tm sw` runs.
+
+    Examples:
+    tm dash -s "Project Alpha" -s "Project Beta"
+    tm dash tea=3m standup=15m -s Review
+    tm dashboard -f timers.txt
+    """
+    timers = _parse_timer_specs(durations or [])
+    if timer_file:
+        timers += _read_timer_file(timer_file)
+    names = list(dict.fromkeys(name.strip() or "Untitled" for name in stopwatches))
+    if not timers and not names:
+        _die("Nothing to show. Add stopwatches with --sw NAME or countdowns.")
+
+    from contextlib import ExitStack
+
+    from core.formatting import format_duration_words
+    from core.store import RunStore
+    from tui import DashboardTui
+
+    with ExitStack() as stack:
+        # One history database connection for every row, closed last.
+        store = None
+        if names:
+            try:
+                store = stack.enter_context(RunStore())
+            except Exception:
+                pass  # each session falls back, and says why
+        sessions = [
+            stack.enter_context(_open_stopwatch_session(name, store=store))
+            for name in names
+        ]
+        DashboardTui(
+            [session.stopwatch for session in sessions], _label_timers(timers)
+        ).run()
+        for session in sessions:
+            if session.stopwatch.is_running:
+                session.stopwatch.stop()
+            elapsed = session.stopwatch.elapsed
+            if elapsed:
+                typer.echo(f"{session.project_name}: {format_duration_words(elapsed)}")
+
+
+@app.command(help="Show recorded stopwatch runs, newest first.")
+def log(
+    project: str | None = typer.Option(
+        None, "--name", "-n", help="Only show runs for this project."
+    ),
+    since: str | None = typer.Option(
+        None, "--since", help="Only runs starting on/after this date (YYYY-MM-DD)."
+    ),
+    until: str | None = typer.Option(
+        None, "--until", help="Only runs starting on/before this date (YYYY-MM-DD)."
+    ),
+    min_duration: str | None = typer.Option(
+        None, "--min", help="Only runs at least this long (e.g. 90s, 5m, 1h)."
+    ),
+    max_duration: str | None = typer.Option(
+        None, "--max", help="Only runs at most this long (e.g. 90s, 5m, 1h)."
+    ),
+    limit: int = typer.Option(
+        50, "--limit", "-l", help="Maximum number of runs to show (0 for all)."
+    ),
+) -> None:
+    """
+    Show recorded stopwatch runs.
+
+    Examples:
+    tm log
+    tm log -n "Project Alpha" --since 2024-01-01
+    tm log --min 1h --limit 0
+    """
+    from core.formatting import format_log_entry
+    from core.store import RunStore, store_path
+
+    if not store_path().exists():
+        typer.echo("No runs recorded.")
+        return
+
+    ns = 1_000_000_000
+    with RunStore() as store:
+        found = False
+        for project_name, run in store.query(
+            project=project,
+            since_ns=_parse_local_date_ns(since) if since else None,
+            until_ns=_parse_local_date_ns(until, end_of_day=True) if until else None,
+            min_duration_ns=(
+                _parse_duration_seconds(min_duration) * ns if min_duration else None
+            ),
+            max_duration_ns=(
+                _parse_duration_seconds(max_duration) * ns if max_duration else None
+            ),
+            limit=limit or None,
+        ):
+            found = True
+            typer.echo(format_log_entry(project_name, run))
+
+        if not found:
+            typer.echo("No matching runs.")
+
+
+_REPORT_PERIODS = ("day", "week", "month", "year")
+
+
+def _report_range(period: str, anchor):
+    """Return the first and last local date of the `period` containing `anchor`."""
+    from datetime import timedelta
+
+    if period == "day":
+        return anchor, anchor
+    if period == "week":
+        first = anchor - timedelta(days=anchor.weekday())
+        return first, first + timedelta(days=6)
+    if period == "month":
+        first = anchor.replace(day=1)
+        next_month = (first + timedelta(days=32)).replace(day=1)
+        return first, next_month - timedelta(days=1)
+    return anchor.replace(month=1, day=1), anchor.replace(month=12, day=31)
+
+
+@app.command(help="Summarize recorded time per project for a day/week/month/year.")
+def report(
+    period: str = typer.Argument(
+        "week", help="The period to report: day, week, month or year."
+    ),
+    project: str | None = typer.Option(
+        None, "--name", "-n", help="Only report this project."
+    ),
+    on: str | None = typer.Option(
+        None, "--date", "-d", help="Report the period containing this date."
+    ),
+    as_json: bool = typer.Option(False, "--json", help="Print JSON for scripts."),
+) -> None:
+    """
+    Summarize recorded time per project.
+
+    Examples:
+    tm report
+    tm report month -n "Project Alpha"
+    tm report year --json
+    """
+    import json
+    from datetime import date
+
+    from core.formatting import format_duration_words
+    from core.store import RunStore, store_path
+
+    period = period.lower().strip()
+    if period not in _REPORT_PERIODS:
+        _die(f"Unknown period '{period}'. Please use {', '.join(_REPORT_PERIODS)}.")
+
+    try:
+        anchor = date.fromisoformat(on) if on else date.today()
+    except ValueError:
+        _die(f"Invalid date '{on}'. Use YYYY-MM-DD.")
+    first_day, last_day = _report_range(period, anchor)
+
+    totals: dict[str, dict] = {}
+    if store_path().exists():
+        with RunStore() as store:
+            for name, day, duration_ns, runs in store.daily_totals(
+                first_day, last_day, project=project
+            ):
+                entry = totals.setdefault(name, {"seconds": 0.0, "runs": 0, "days": {}})
+                entry["seconds"] += duration_ns / 1_000_000_000
+                entry["runs"] += runs
+                entry["days"][day.isoformat()] = duration_ns / 1_000_000_000
+
+    ranked = sorted(totals.items(), key=lambda item: item[1]["seconds"], reverse=True)
+    total_seconds = sum(entry["seconds"] for _, entry in ranked)
+
+    if as_json:
+        typer.echo(
+            json.dumps(
+                {
+                    "period": period,
+                    "start": first_day.isoformat(),
+                    "end": last_day.isoformat(),
+                    "total_seconds": total_seconds,
+                    "projects": [{"project": name, **entry} for name, entry in ranked],
+                }
+            )
+        )
+        return
+
+    typer.echo(f"{period.capitalize()}: {first_day} to {last_day}")
+    if not ranked:
+        typer.echo("No runs recorded.")
+        return
+
+    width = max(len("Total"), *(len(name) for name, _ in ranked))
+    for name, entry in ranked:
+        typer.echo(f"  {name:<{width}}  {format_duration_words(entry['seconds'])}")
+    typer.echo(f"  {'Total':<{width}}  {format_duration_words(total_seconds)}")
+
+
+@app.command(help="Run the background timer daemon (in the foreground).")
+def daemon() -> None:
+    """
+    Run the timer daemon that owns timers for `tm start/stop/reset/status`.
+
+    Examples:
+    tm daemon &
+    """
+    from core.daemon import run_daemon
+    from core.ipc import DaemonError
+
+    try:
+        run_daemon()
+    except DaemonError as exc:
+        _die(str(exc))
+
+
+def _client(argv: list[str]) -> None:
+    from cli.client import main as client_main
+
+    raise typer.Exit(code=client_main(argv))
+
+
+@app.command(help="Start a daemon stopwatch, or a countdown if DURATION is given.")
+def start(
+    name: str = typer.Argument(..., help="The timer name."),
+    duration: str | None = typer.Argument(
+        None, help="Countdown length (e.g. 25m); omit for a stopwatch."
+    ),
+) -> None:
+    _client(["start", name, *([duration] if duration else [])])
+
+
+@app.command(help="Pause a daemon stopwatch or countdown.")
+def stop(name: str = typer.Argument(..., help="The timer name.")) -> None:
+    _client(["stop", name])
+
+
+@app.command(help="Stop and discard a daemon timer (stopwatch runs are recorded).")
+def reset(name: str = typer.Argument(..., help="The timer name.")) -> None:
+    _client(["reset", name])
+
+
+@app.command(
+    help=(
+        "Show running stopwatches and countdowns (from tm sw, tm cd and the "
+        "daemon). With NAME, print just that timer's time; exits 1 if nothing "
+        "matches."
+    )
+)
+def status(
+    name: str | None = typer.Argument(None, help="Only show this timer."),
+) -> None:
+    _client(["status", *([name] if name else [])])
 
 
 def main() -> None:
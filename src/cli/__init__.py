@@ -1,5 +1,28 @@
 # time-manager CLI Components
+#
+# Exports are resolved lazily so that importing the package doesn't pull in
+# Rich before anything is rendered.
 
-from .cli import run_stopwatch_cli, run_countdown_cli, print_stopwatch_summary
+__all__ = [
+    "run_stopwatch_cli",
+    "run_countdown_cli",
+    "run_countdowns_cli",
+    "print_stopwatch_summary",
+    "watch_stopwatch_cli",
+    "run_stopwatch_headless",
+    "run_countdown_headless",
+    "run_countdowns_headless",
+]
 
-__all__ = ["run_stopwatch_cli", "run_countdown_cli", "print_stopwatch_summary"]
+
+def __getattr__(name: str):
+    if name.endswith("_headless") and name in __all__:
+        # Headless output writes plain lines; it needs neither Rich nor termios.
+        from . import headless
+
+        return getattr(headless, name)
+    if name in __all__:
+        from . import cli
+
+        return getattr(cli, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
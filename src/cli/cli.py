@@ -1,105 +1,202 @@
+import heapq
 import time
-import sys
-import select
-import termios
-import tty
-from datetime import datetime
-from rich.align import Align
-from rich.console import Group
-from rich.live import Live
-from rich.panel import Panel
-from rich.text import Text
-from rich import box
+from time import perf_counter_ns
+from collections.abc import Sequence
+from cli.keys import NonBlockingInput
 from core.formatting import (
+    format_hms,
+    format_seconds,
     format_time,
     format_stopwatch_timeline,
     format_duration_words,
+    format_lap_stats,
 )
-from core.termclock import Stopwatch, Countdown
-
-
-class NonBlockingInput:
-    """Context manager for non-blocking terminal input."""
-
-    def __enter__(self):
-        self.old_settings = termios.tcgetattr(sys.stdin)
-        tty.setcbreak(sys.stdin.fileno())
-        return self
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        termios.tcsetattr(sys.stdin, termios.TCSADRAIN, self.old_settings)
-
-    @staticmethod
-    def get_char():
-        """Check for and return a character if available, else None."""
-        if select.select([sys.stdin], [], [], 0) == ([sys.stdin], [], []):
-            return sys.stdin.read(1)
-        return None
-
+from core.profiler import FrameProfiler
+from core.scheduler import TimerScheduler
+from core.snapshot import LiveSnapshot, LiveView
+from core.stats import LapStats
+from core.termclock import Stopwatch, Countdown, until_next_second
+from core.timeline import timeline_lines
+
+# How often `tm sw --attach` looks for the owner's starts, stops and laps.
+_ATTACH_POLL_INTERVAL = 0.1
+
+
+def _stopwatch_frame(time_str: str, running: bool, laps: LapStats):
+    """Return the lines and border style of one stopwatch frame."""
+    # Visual feedback for paused state
+    style = "bold green" if running else "dim green"
+    border_style = "green" if running else "white"
+
+    lines = [(time_str, style), ("HH:MM:SS", "dim")]
+    if laps.count:
+        lines.append(("", ""))
+        lines.extend(
+            (stats_line, "dim")
+            for stats_line in format_lap_stats(laps, per_line=4).splitlines()
+        )
+    return lines, border_style
+
+
+def _apply_stopwatch_keys(stopwatch: Stopwatch, keys: list[str]) -> bool:
+    """Apply `keys` to `stopwatch` in order; return True on quit."""
+    for key in keys:
+        key = key.lower()
+        if key == "q":
+            return True
+        elif key == " ":
+            if stopwatch.is_running:
+                stopwatch.stop()
+            else:
+                stopwatch.start()
+        elif key == "l":
+            stopwatch.lap()
+        elif key == "r":
+            stopwatch.reset()
+    return False
+
+
+def run_stopwatch_cli(
+    project_name: str | None = None,
+    stopwatch: Stopwatch | None = None,
+    renderer: str = "auto",
+    profiler: FrameProfiler | None = None,
+):
+    """Run the plain stopwatch until 'q', then print its summary.
+
+    With a `profiler`, every pass of the loop is recorded as one frame.
+    """
+    from cli.render import open_panel_renderer
 
-def run_stopwatch_cli(project_name: str | None = None):
     project_name = (project_name or "").strip() or "Untitled"
-    stopwatch = Stopwatch()
+    if stopwatch is None:
+        stopwatch = Stopwatch(name=project_name)
     stopwatch.start()
 
-    subtitle = "Space: Start/Stop | r: Reset | q: Quit"
+    subtitle = "Space: Start/Stop | l: Lap | r: Reset | q: Quit"
 
     try:
-        with NonBlockingInput(), Live(refresh_per_second=60, screen=False) as live:
+        with (
+            NonBlockingInput() as keyboard,
+            open_panel_renderer("Stopwatch", subtitle, renderer) as panel,
+        ):
+            last_view = None
+            keys: list[str] = []
+            due_ns = None
             while True:
-                # Handle Input
-                char = NonBlockingInput.get_char()
-                if char:
-                    if char.lower() == "q":
-                        break
-                    elif char == " ":
-                        if stopwatch.is_running:
-                            stopwatch.stop()
-                        else:
-                            stopwatch.start()
-                    elif char.lower() == "r":
-                        stopwatch.reset()
+                if profiler:
+                    profiler.begin(due_ns)
+                # Handle every key that arrived since the last frame
+                if _apply_stopwatch_keys(stopwatch, keys):
+                    break
+                if profiler:
+                    profiler.mark(0)
 
-                # Update Display
                 elapsed = stopwatch.elapsed
-                time_str = format_time(elapsed, show_centiseconds=False)
                 # Always display HH:MM:SS (even when hours == 0)
-                if time_str.count(":") == 1:
-                    time_str = f"00:{time_str}"
+                time_str = format_hms(elapsed)
+                if profiler:
+                    profiler.mark(1)
+
+                # Only redraw when something visible changed
+                laps = stopwatch.lap_stats
+                view = (time_str, stopwatch.is_running, laps.count)
+                if view != last_view:
+                    last_view = view
+                    lines, border_style = _stopwatch_frame(
+                        time_str, stopwatch.is_running, laps
+                    )
+                    if profiler:
+                        profiler.mark(2)
+                    panel.render(lines, border_style=border_style)
+                    if profiler:
+                        profiler.mark(3)
+                if profiler:
+                    profiler.end()
+
+                # Sleep until the next displayed second or a keypress; while
+                # paused nothing changes on screen, so wait for input only.
+                timeout = until_next_second(elapsed) if stopwatch.is_running else None
+                if profiler and timeout is not None:
+                    due_ns = perf_counter_ns() + int(timeout * 1_000_000_000)
+                keys = keyboard.wait(timeout)
+                if keys or timeout is None:
+                    due_ns = None  # woken by a key: due as soon as it came in
+    except (KeyboardInterrupt, EOFError):
+        pass
+    finally:
+        if stopwatch.is_running:
+            stopwatch.stop()
+        print_stopwatch_summary(
+            project_name, stopwatch.elapsed, stopwatch.runs, stopwatch.lap_stats
+        )
 
-                # Visual feedback for paused state
-                style = "bold green" if stopwatch.is_running else "dim green"
-                border_style = "green" if stopwatch.is_running else "white"
 
-                display = Group(
-                    Align.center(Text(time_str, style=style)),
-                    Align.center(Text("HH:MM:SS", style="dim")),
-                )
+def watch_stopwatch_cli(view: LiveView, renderer: str = "auto") -> None:
+    """Show another process's stopwatch, read-only, until 'q' or it exits."""
+    from cli.render import open_panel_renderer
 
-                panel = Panel(
-                    display,
-                    title="Stopwatch",
-                    subtitle=subtitle,
-                    box=box.ROUNDED,
-                    border_style=border_style,
-                    padding=(1, 2),
-                )
-                live.update(panel)
-                time.sleep(1 / 60)
-    except KeyboardInterrupt:
+    subtitle = "Attached (read-only) | q: Quit"
+    snapshot = view.read()
+    if snapshot is None:
+        return
+    name = snapshot.name
+    owner_gone = False
+
+    try:
+        with (
+            NonBlockingInput() as keyboard,
+            open_panel_renderer(f"Stopwatch: {name}", subtitle, renderer) as panel,
+        ):
+            last_view = None
+            keys: list[str] = []
+            next_liveness_check = 0.0
+            while "q" not in keys and "Q" not in keys:
+                snapshot = view.read()
+                now = time.monotonic()
+                if now >= next_liveness_check:
+                    # A crashed owner can't clear its snapshot; check for it
+                    # about once a second.
+                    next_liveness_check = now + 1.0
+                    if not view.owner_alive():
+                        snapshot = None
+                if snapshot is None:
+                    owner_gone = True
+                    break
+
+                elapsed = snapshot.seconds()
+                time_str = format_hms(elapsed)
+                view_key = (time_str, snapshot.running, snapshot.laps.count)
+                if view_key != last_view:
+                    last_view = view_key
+                    lines, border_style = _stopwatch_frame(
+                        time_str, snapshot.running, snapshot.laps
+                    )
+                    panel.render(lines, border_style=border_style)
+
+                # The owner doesn't signal viewers, so look at the mapping
+                # again soon (a read is a few memory copies) besides waking
+                # on second boundaries.
+                timeout = _ATTACH_POLL_INTERVAL
+                if snapshot.running:
+                    timeout = min(timeout, until_next_second(elapsed))
+                keys = keyboard.wait(timeout)
+    except (KeyboardInterrupt, EOFError):
         pass
     finally:
-        if stopwatch.is_running:
-            stopwatch.stop()
-        print_stopwatch_summary(project_name, stopwatch.elapsed, stopwatch.runs)
+        view.close()
+    if owner_gone:
+        print(f"Stopwatch '{name}' is no longer running.")
 
 
 def print_stopwatch_summary(
     project_name: str,
     total_elapsed: float,
-    runs: list,
+    runs: Sequence,
+    lap_stats: LapStats | None = None,
 ) -> None:
     try:
+        from rich import box
         from rich.console import Console
         from rich.panel import Panel
     except Exception:
@@ -108,7 +205,10 @@ def print_stopwatch_summary(
         print(f"Project: {project_name}")
         print(f"Total: {format_time(total_elapsed, show_centiseconds=False)}")
         print()
-        print(format_stopwatch_timeline(project_name, total_elapsed, runs))
+        print(format_stopwatch_timeline(runs))
+        if lap_stats is not None and lap_stats.count:
+            print()
+            print(format_lap_stats(lap_stats, per_line=4))
         return
 
     if not runs:
@@ -119,35 +219,15 @@ def print_stopwatch_summary(
     # Format total elapsed time
     elapsed_text = format_duration_words(total_elapsed)
 
-    local_now = datetime.now().astimezone()
-    local_tz = local_now.tzinfo
-    tz_name = local_now.tzname() or "Local"
-
-    def _to_local(dt: datetime) -> datetime:
-        if dt.tzinfo is None:
-            return dt.replace(tzinfo=local_tz)
-        return dt.astimezone(local_tz)
-
-    # Build timeline content with breaks
-    timeline_lines = []
-    for i, run in enumerate(runs, 1):
-        start_str = _to_local(run.start_time).strftime("%H:%M")
-        end_str = _to_local(run.end_time).strftime("%H:%M") if run.end_time else "..."
-        duration_str = f"({format_duration_words(run.duration)})"
-
-        # Create timeline bar
-        bar = "▬" * 15
-        line = (
-            f"  Session #{i}\t{start_str} [green]{bar}[/green] {end_str} {tz_name}  "
-            f"[dim]{duration_str}[/dim]"
-        )
-        timeline_lines.append(line)
+    # Bounded however many runs there are: long sessions are bucketed
+    lines = list(timeline_lines(runs, markup=True))
 
-        # Add blank line between runs to show breaks
-        if i < len(runs):
-            timeline_lines.append("")
+    if lap_stats is not None and lap_stats.count:
+        lines.append("")
+        for stats_line in format_lap_stats(lap_stats, per_line=4).splitlines():
+            lines.append(f"  [dim]{stats_line}[/dim]")
 
-    timeline_content = "\n".join(timeline_lines)
+    timeline_content = "\n".join(lines)
 
     # Create panel with project name and total time in title
     panel = Panel(
@@ -162,60 +242,193 @@ def print_stopwatch_summary(
     Console().print(panel)
 
 
-def run_countdown_cli(seconds: int):
-    countdown = Countdown(seconds)
+def _countdown_frame(time_str: str, remaining: float, running: bool):
+    """Return the lines and border style of one countdown frame."""
+    # Change color based on urgency
+    color = "blue"
+    if remaining < 10:
+        color = "red"
+    elif remaining < 30:
+        color = "yellow"
+
+    # Visual feedback for paused state
+    style = f"bold {color}" if running else f"dim {color}"
+    border_style = color if running else "white"
+    return [(time_str, style)], border_style
+
+
+def run_countdown_cli(
+    seconds: int, countdown: Countdown | None = None, renderer: str = "auto"
+):
+    from cli.render import open_panel_renderer
+
+    countdown = countdown or Countdown(seconds)
 
     subtitle = "Space: Pause/Resume | q: Quit"
 
     try:
-        with NonBlockingInput(), Live(refresh_per_second=10, screen=False) as live:
+        with (
+            NonBlockingInput() as keyboard,
+            open_panel_renderer("Countdown", subtitle, renderer) as panel,
+        ):
+            last_view = None
+            keys: list[str] = []
             while not countdown.is_finished:
-                # Handle Input
-                char = NonBlockingInput.get_char()
-                if char:
-                    if char.lower() == "q":
-                        break
-                    elif char == " ":
+                # Handle every key that arrived since the last frame
+                if "q" in keys or "Q" in keys:
+                    break
+                for key in keys:
+                    if key == " ":
                         countdown.toggle()
 
-                countdown.tick()
                 remaining = countdown.time_left
-                time_str = format_time(remaining, show_centiseconds=False)
-
-                # Change color based on urgency
-                color = "blue"
-                if remaining < 10:
-                    color = "red"
-                elif remaining < 30:
-                    color = "yellow"
-
-                # Visual feedback for paused state
-                style = f"bold {color}" if countdown.is_running else f"dim {color}"
-                border_style = color if countdown.is_running else "white"
-
-                panel = Panel(
-                    Text(time_str, style=style, justify="center"),
-                    title="Countdown",
-                    subtitle=subtitle,
-                    box=box.ROUNDED,
-                    border_style=border_style,
-                    padding=(1, 2),
+                if countdown.is_finished:
+                    break
+                time_str = format_seconds(remaining)
+
+                # Only redraw when something visible changed
+                lines, border_style = _countdown_frame(
+                    time_str, remaining, countdown.is_running
                 )
-                live.update(panel)
-                time.sleep(0.1)
+                view = (lines, border_style)
+                if view != last_view:
+                    last_view = view
+                    panel.render(lines, border_style=border_style)
+
+                # Sleep until the displayed second changes or a key is pressed.
+                timeout = (
+                    until_next_second(remaining, counting_down=True)
+                    if countdown.is_running
+                    else None
+                )
+                keys = keyboard.wait(timeout)
 
             # Final "Time's Up" display
-            if countdown.is_finished:
-                panel = Panel(
-                    Text("00:00", style="bold red blink", justify="center"),
-                    title="Countdown",
-                    subtitle="Time's Up!",
-                    box=box.ROUNDED,
+            if countdown.check_finished():
+                panel.render(
+                    [("00:00", "bold red blink")],
                     border_style="red",
-                    padding=(1, 2),
+                    subtitle="Time's Up!",
                 )
-                live.update(panel)
                 time.sleep(2)  # Show for a bit before exiting
 
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, EOFError):
+        pass
+
+
+# Rows shown by the multi-timer view; the rest are summarized in a footer.
+_MAX_TIMER_ROWS = 15
+
+
+def run_countdowns_cli(timers: list[tuple[str, int]]):
+    """Run several named countdowns at once from one scheduler."""
+    from rich import box
+    from rich.live import Live
+    from rich.panel import Panel
+    from rich.table import Table
+
+    scheduler = TimerScheduler()
+    snapshots = [
+        LiveSnapshot.for_countdown(name, scheduler.add(name, seconds))
+        for name, seconds in timers
+    ]
+
+    subtitle = "Space: Pause/Resume all | q: Quit"
+
+    def _visible_rows():
+        # Soonest-expiring timers first, finished ones last.
+        entries = heapq.nsmallest(
+            _MAX_TIMER_ROWS,
+            scheduler,
+            key=lambda item: (item[1].is_finished, item[1].time_left),
+        )
+        rows = []
+        for name, countdown in entries:
+            if countdown.is_finished:
+                state = "Time's Up!"
+            elif countdown.is_running:
+                state = "Running"
+            else:
+                state = "Paused"
+            remaining = countdown.time_left
+            rows.append((name, format_seconds(remaining), state))
+        return entries, rows
+
+    try:
+        with (
+            NonBlockingInput() as keyboard,
+            Live(auto_refresh=False, screen=False) as live,
+        ):
+            last_view = None
+            keys: list[str] = []
+            while scheduler.pending:
+                # Handle every key that arrived since the last frame
+                if "q" in keys or "Q" in keys:
+                    break
+                for key in keys:
+                    if key == " ":
+                        if any(
+                            cd.is_running and not cd.is_finished for _, cd in scheduler
+                        ):
+                            scheduler.pause_all()
+                        else:
+                            scheduler.resume_all()
+
+                if scheduler.pop_expired():
+                    live.console.bell()
+
+                entries, rows = _visible_rows()
+                view = (tuple(rows), scheduler.pending)
+                if view != last_view:
+                    last_view = view
+
+                    table = Table(box=None, expand=True, show_header=False)
+                    table.add_column("Timer", ratio=2)
+                    table.add_column("Remaining", justify="right")
+                    table.add_column("Status", justify="right")
+                    for name, time_str, state in rows:
+                        if state == "Time's Up!":
+                            style = "bold red"
+                        elif state == "Paused":
+                            style = "dim"
+                        else:
+                            style = "bold blue"
+                        table.add_row(name, time_str, state, style=style)
+
+                    hidden = len(scheduler) - len(rows)
+                    title = f"Countdowns ({scheduler.pending} left)"
+                    if hidden > 0:
+                        title += f" +{hidden} more"
+                    live.update(
+                        Panel(
+                            table,
+                            title=title,
+                            subtitle=subtitle,
+                            box=box.ROUNDED,
+                            border_style="blue",
+                            padding=(1, 2),
+                        ),
+                        refresh=True,
+                    )
+
+                # Sleep until a visible second changes, a timer expires or a
+                # key is pressed; with everything paused, wait for input only.
+                wakeups = [
+                    until_next_second(countdown.time_left, counting_down=True)
+                    for _, countdown in entries
+                    if countdown.is_running and not countdown.is_finished
+                ]
+                deadline = scheduler.next_deadline()
+                if deadline is not None:
+                    wakeups.append(max(0.0, deadline - time.monotonic()))
+                keys = keyboard.wait(min(wakeups) if wakeups else None)
+
+            if not scheduler.pending:
+                # The last expiry already rang; show it for a bit before exiting.
+                time.sleep(2)
+
+    except (KeyboardInterrupt, EOFError):
         pass
+    finally:
+        for snapshot in snapshots:
+            snapshot.close()
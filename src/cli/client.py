@@ -0,0 +1,90 @@
+"""Thin clients: `tm start`, `tm stop` and `tm reset` talk to the timer daemon;
+`tm status` reads the live snapshots published by every running timer.
+
+These run for a few milliseconds per invocation, so they must not import
+Typer, Rich or Textual; `launcher` dispatches here directly. `tm status` runs
+every second in shell prompts, so it doesn't even load the socket client.
+"""
+
+from __future__ import annotations
+
+import sys
+
+from core.formatting import format_hms
+from core.snapshot import read_snapshots
+
+USAGE = """\
+Usage:
+  tm start NAME [DURATION]   Start/resume a stopwatch (a countdown with DURATION)
+  tm stop NAME               Pause a stopwatch or countdown
+  tm reset NAME              Stop and discard a timer (stopwatch runs are recorded)
+  tm status [NAME]           Show running timers (just NAME's time if given)
+"""
+
+
+def _format_timer(name: str, kind: str, seconds: float, running: bool) -> str:
+    state = "running" if running else "paused"
+    if kind == "countdown" and seconds <= 0:
+        state = "finished"
+    return f"{name}\t{kind}\t{format_hms(seconds)}\t{state}"
+
+
+def status(argv: list[str]) -> int:
+    """Print live timers; exit 1 (printing nothing) if none match."""
+    if len(argv) > 1:
+        sys.stderr.write(USAGE)
+        return 2
+
+    snapshots = read_snapshots()
+    if argv:
+        times = [format_hms(s.seconds()) for s in snapshots if s.name == argv[0]]
+        if not times:
+            return 1
+        sys.stdout.write("\n".join(times) + "\n")
+        return 0
+
+    if not snapshots:
+        return 1
+    lines = [_format_timer(s.name, s.kind, s.seconds(), s.running) for s in snapshots]
+    sys.stdout.write("\n".join(lines) + "\n")
+    return 0
+
+
+def main(argv: list[str]) -> int:
+    """Run one client command and return the process exit code."""
+    if not argv or argv[0] not in ("start", "stop", "reset", "status"):
+        sys.stderr.write(USAGE)
+        return 2
+
+    command, args = argv[0], argv[1:]
+    if command == "status":
+        return status(args)
+    if not 1 <= len(args) <= (2 if command == "start" else 1):
+        sys.stderr.write(USAGE)
+        return 2
+
+    from core.ipc import DaemonError, DaemonNotRunning, request
+
+    try:
+        payload: dict = {"name": args[0]}
+        if len(args) == 2:
+            from core.durations import parse_duration
+
+            payload["seconds"] = parse_duration(args[1])
+        reply = request(command, **payload)
+    except DaemonNotRunning:
+        sys.stderr.write(
+            "Error: the tm daemon is not running (start it with `tm daemon`).\n"
+        )
+        return 1
+    except (DaemonError, ValueError) as exc:
+        sys.stderr.write(f"Error: {exc}\n")
+        return 1
+
+    lines = [
+        _format_timer(t["name"], t["kind"], t["seconds"], t["running"])
+        for t in reply.get("timers", [])
+    ]
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+    return 0
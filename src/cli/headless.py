@@ -0,0 +1,319 @@
+"""Headless output for `tm sw` and `tm cd` (`--plain`, `--jsonl`).
+
+Used when there's no terminal to draw on (CI jobs, `nohup`, piping to a
+log) or when asked for. Instead of a live panel, the timer writes one line
+per event: when it starts, every `every` seconds of progress, when it is
+paused or resumed, and when it finishes or is stopped. `jsonl` writes each
+event as the JSON object `TM_EVENTS` would log (`core.events`); `plain`
+writes a short readable line.
+
+Nothing here reads the keyboard or touches termios. Between lines the
+process sleeps until the next one is due, and signals take the place of
+keys: SIGUSR1 pauses or resumes, SIGINT or SIGTERM stops.
+"""
+
+from __future__ import annotations
+
+import os
+import select
+import signal
+import sys
+import time
+from typing import TextIO
+
+from core.events import (
+    CountdownPaused,
+    CountdownResumed,
+    CountdownStarted,
+    CountdownTick,
+    JsonlSink,
+    Sink,
+    StopwatchStarted,
+    StopwatchStopped,
+    StopwatchTick,
+    TimerEvent,
+)
+from core.formatting import format_hms
+from core.runlog import NS_PER_SECOND
+from core.snapshot import LiveSnapshot
+from core.termclock import _BOUNDARY_SLACK, Countdown, Stopwatch
+
+HEADLESS_OUTPUTS = ("plain", "jsonl")
+
+_PLAIN_MESSAGES = {
+    "stopwatch.started": "started at {elapsed}",
+    "stopwatch.tick": "{elapsed} elapsed",
+    "stopwatch.stopped": "stopped at {elapsed}",
+    "countdown.started": "started, {remaining} left",
+    "countdown.tick": "{remaining} left",
+    "countdown.paused": "paused, {remaining} left",
+    "countdown.resumed": "resumed, {remaining} left",
+    "countdown.finished": "time's up",
+}
+
+
+class PlainSink(Sink):
+    """Writes one readable line per event: local time, timer, what happened."""
+
+    def __init__(self, stream: TextIO) -> None:
+        self._stream = stream
+
+    def handle(self, event: TimerEvent) -> None:
+        fields = event.to_dict()
+        elapsed_ns = fields.get("elapsed_ns", 0)
+        # Countdowns show whole seconds rounded up: "04:00 left" until the
+        # fifth minute is over.
+        remaining_ns = fields.get("remaining_ns", 0)
+        message = _PLAIN_MESSAGES[event.kind].format(
+            elapsed=format_hms(elapsed_ns // NS_PER_SECOND),
+            remaining=format_hms(-(-remaining_ns // NS_PER_SECOND)),
+        )
+        stamp = time.strftime(
+            "%Y-%m-%d %H:%M:%S", time.localtime(event.ts_ns / NS_PER_SECOND)
+        )
+        self._stream.write(f"{stamp}  {event.timer}: {message}\n")
+
+    def flush(self) -> None:
+        self._stream.flush()
+
+    def close(self) -> None:
+        self._stream.flush()
+
+
+def _open_sink(output: str, stream: TextIO | None) -> Sink:
+    if output not in HEADLESS_OUTPUTS:
+        raise ValueError(f"unknown headless output {output!r}")
+    stream = sys.stdout if stream is None else stream
+    return JsonlSink(stream) if output == "jsonl" else PlainSink(stream)
+
+
+class _Signals:
+    """Turns SIGINT/SIGTERM into a stop request and SIGUSR1 into a toggle.
+
+    `wait()` sleeps until its timeout or until one of them arrives: the
+    handlers only record the signal, and `signal.set_wakeup_fd` wakes the
+    `select` even if it arrived just before the sleep began.
+    """
+
+    def __enter__(self) -> "_Signals":
+        self.stop = False
+        self.toggles = 0
+        self._read, self._write = os.pipe()
+        os.set_blocking(self._read, False)
+        os.set_blocking(self._write, False)
+        self._previous = {
+            signal.SIGINT: signal.signal(signal.SIGINT, self._on_stop),
+            signal.SIGTERM: signal.signal(signal.SIGTERM, self._on_stop),
+            signal.SIGUSR1: signal.signal(signal.SIGUSR1, self._on_toggle),
+        }
+        self._previous_fd = signal.set_wakeup_fd(self._write)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        signal.set_wakeup_fd(self._previous_fd)
+        for signum, handler in self._previous.items():
+            signal.signal(signum, handler)
+        os.close(self._read)
+        os.close(self._write)
+
+    def _on_stop(self, signum, frame) -> None:
+        self.stop = True
+
+    def _on_toggle(self, signum, frame) -> None:
+        self.toggles += 1
+
+    def take_toggles(self) -> int:
+        """Return how many toggles arrived since the last call."""
+        toggles, self.toggles = self.toggles, 0
+        return toggles
+
+    def wait(self, timeout: float | None) -> None:
+        """Sleep for `timeout` seconds (None: forever) or until a signal."""
+        if not (self.stop or self.toggles):
+            select.select([self._read], [], [], timeout)
+        try:
+            while os.read(self._read, 64):
+                pass
+        except BlockingIOError:
+            pass
+
+
+def _until_next(value_ns: int, every_ns: int, *, counting_down: bool = False) -> float:
+    """Seconds until just after `value_ns` next crosses a multiple of `every_ns`."""
+    if counting_down:
+        left_ns = value_ns % every_ns or every_ns
+    else:
+        left_ns = every_ns - value_ns % every_ns
+    return left_ns / NS_PER_SECOND + _BOUNDARY_SLACK
+
+
+def run_stopwatch_headless(
+    project_name: str | None = None,
+    stopwatch: Stopwatch | None = None,
+    output: str = "plain",
+    every: float = 60.0,
+    stream: TextIO | None = None,
+) -> None:
+    """Run the stopwatch until SIGINT/SIGTERM, writing a line per event.
+
+    With `plain` output the usual summary follows; with `jsonl` the final
+    `stopwatch.stopped` event carries the total instead, so the output
+    stays one JSON object per line.
+    """
+    project_name = (project_name or "").strip() or "Untitled"
+    if stopwatch is None:
+        stopwatch = Stopwatch(name=project_name)
+    sink = _open_sink(output, stream)
+    every_ns = max(1, int(every * NS_PER_SECOND))
+
+    def emit(event: TimerEvent) -> None:
+        sink.handle(event)
+        sink.flush()
+
+    def stop() -> None:
+        stopwatch.stop()
+        run_ns = stopwatch.runs[-1].duration_ns if len(stopwatch.runs) else 0
+        emit(
+            StopwatchStopped(project_name, time.time_ns(), stopwatch.elapsed_ns, run_ns)
+        )
+
+    try:
+        with _Signals() as signals:
+            stopwatch.start()
+            emit(StopwatchStarted(project_name, time.time_ns(), stopwatch.elapsed_ns))
+            mark = stopwatch.elapsed_ns // every_ns
+            while not signals.stop:
+                for _ in range(signals.take_toggles()):
+                    if stopwatch.is_running:
+                        stop()
+                    else:
+                        stopwatch.start()
+                        emit(
+                            StopwatchStarted(
+                                project_name, time.time_ns(), stopwatch.elapsed_ns
+                            )
+                        )
+
+                elapsed_ns = stopwatch.elapsed_ns
+                if elapsed_ns // every_ns > mark:
+                    mark = elapsed_ns // every_ns
+                    emit(StopwatchTick(project_name, time.time_ns(), elapsed_ns))
+
+                # Nothing to report while paused: sleep until a signal.
+                signals.wait(
+                    _until_next(elapsed_ns, every_ns) if stopwatch.is_running else None
+                )
+    finally:
+        if stopwatch.is_running:
+            stop()
+        sink.close()
+
+    if output == "plain":
+        from cli.cli import print_stopwatch_summary
+
+        print_stopwatch_summary(
+            project_name, stopwatch.elapsed, stopwatch.runs, stopwatch.lap_stats
+        )
+
+
+def _run_countdowns(countdowns: list[Countdown], sink: Sink, every: float) -> None:
+    """Report `countdowns` until all have finished or a stop is requested.
+
+    SIGUSR1 pauses every running countdown, or resumes them all if none is
+    running. Stopping pauses whatever is still running, so the last line
+    says how much time was left.
+    """
+    every_ns = max(1, int(every * NS_PER_SECOND))
+
+    def emit(event: TimerEvent) -> None:
+        sink.handle(event)
+        sink.flush()
+
+    def left_ns(countdown: Countdown) -> int:
+        return int(countdown.time_left * NS_PER_SECOND)
+
+    def set_running(countdown: Countdown, running: bool) -> None:
+        if countdown.is_finished or countdown.is_running == running:
+            return
+        if running:
+            countdown.resume()
+            event = CountdownResumed
+        else:
+            countdown.pause()
+            event = CountdownPaused
+        emit(event(countdown.name, time.time_ns(), left_ns(countdown)))
+
+    now_ns = time.time_ns()
+    for countdown in countdowns:
+        emit(CountdownStarted(countdown.name, now_ns, left_ns(countdown)))
+    # Progress lines are due each time a countdown's time left, rounded up
+    # to `every`, drops.
+    marks = [-(-left_ns(countdown) // every_ns) for countdown in countdowns]
+    pending = set(range(len(countdowns)))
+
+    with _Signals() as signals:
+        while pending and not signals.stop:
+            for _ in range(signals.take_toggles()):
+                running = any(countdowns[i].is_running for i in pending)
+                for i in pending:
+                    set_running(countdowns[i], not running)
+
+            wakeups = []
+            for i in sorted(pending):
+                countdown = countdowns[i]
+                remaining_ns = left_ns(countdown)
+                if countdown.check_finished():
+                    emit(countdown.finished_event())
+                    pending.discard(i)
+                    continue
+                mark = -(-remaining_ns // every_ns)
+                if mark < marks[i]:
+                    marks[i] = mark
+                    emit(CountdownTick(countdown.name, time.time_ns(), remaining_ns))
+                if countdown.is_running:
+                    wakeups.append(
+                        _until_next(remaining_ns, every_ns, counting_down=True)
+                    )
+
+            if pending:
+                signals.wait(min(wakeups) if wakeups else None)
+
+        for i in pending:
+            set_running(countdowns[i], False)
+
+
+def run_countdown_headless(
+    seconds: int,
+    countdown: Countdown | None = None,
+    output: str = "plain",
+    every: float = 60.0,
+    stream: TextIO | None = None,
+) -> None:
+    """Run one countdown to the end, writing a line per event."""
+    countdown = countdown or Countdown(seconds, name="countdown")
+    sink = _open_sink(output, stream)
+    try:
+        _run_countdowns([countdown], sink, every)
+    finally:
+        sink.close()
+
+
+def run_countdowns_headless(
+    timers: list[tuple[str, int]],
+    output: str = "plain",
+    every: float = 60.0,
+    stream: TextIO | None = None,
+) -> None:
+    """Run several named countdowns to the end, writing a line per event."""
+    countdowns = [Countdown(seconds, name=name) for name, seconds in timers]
+    snapshots = [
+        LiveSnapshot.for_countdown(countdown.name, countdown)
+        for countdown in countdowns
+    ]
+    sink = _open_sink(output, stream)
+    try:
+        _run_countdowns(countdowns, sink, every)
+    finally:
+        sink.close()
+        for snapshot in snapshots:
+            snapshot.close()
@@ -0,0 +1,207 @@
+"""Keyboard input for the plain CLI loops.
+
+`NonBlockingInput` puts the terminal in cbreak mode and, whenever stdin is
+readable, drains everything pending with one `os.read`. `KeyDecoder` turns
+those bytes into key events: printable characters as themselves ("q", " "),
+everything else by name ("up", "pageup", "f5", "enter", "escape",
+"ctrl+a", "alt+x"). Escape sequences split across reads are held back until
+they complete, so arrow keys never arrive as stray "[" and "A" characters,
+and a pasted burst is handled in one frame instead of one key per frame.
+"""
+
+from __future__ import annotations
+
+import codecs
+import errno
+import os
+import select
+import sys
+import termios
+import tty
+
+# How long a lone ESC waits for the rest of a sequence before it counts as
+# the Escape key (the same trade-off as Vim's 'ttimeoutlen').
+ESCAPE_DELAY = 0.025
+
+# Bytes drained per read; a paste longer than this takes a few reads.
+_READ_SIZE = 4096
+
+_CSI_FINAL = {
+    "A": "up",
+    "B": "down",
+    "C": "right",
+    "D": "left",
+    "E": "begin",
+    "F": "end",
+    "H": "home",
+    "P": "f1",
+    "Q": "f2",
+    "R": "f3",
+    "S": "f4",
+    "Z": "shift+tab",
+}
+
+_CSI_TILDE = {
+    "1": "home",
+    "2": "insert",
+    "3": "delete",
+    "4": "end",
+    "5": "pageup",
+    "6": "pagedown",
+    "7": "home",
+    "8": "end",
+    "11": "f1",
+    "12": "f2",
+    "13": "f3",
+    "14": "f4",
+    "15": "f5",
+    "17": "f6",
+    "18": "f7",
+    "19": "f8",
+    "20": "f9",
+    "21": "f10",
+    "23": "f11",
+    "24": "f12",
+}
+
+_CONTROL = {
+    "\r": "enter",
+    "\n": "enter",
+    "\t": "tab",
+    "\x7f": "backspace",
+    "\x08": "backspace",
+}
+
+
+class KeyDecoder:
+    """Incremental decoder from terminal input bytes to key events."""
+
+    def __init__(self) -> None:
+        self._text = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._buffer = ""
+
+    @property
+    def pending(self) -> bool:
+        """True while an incomplete escape sequence is buffered."""
+        return bool(self._buffer)
+
+    def feed(self, data: bytes) -> list[str]:
+        """Decode `data` and return every key it completes."""
+        self._buffer += self._text.decode(data)
+        keys, self._buffer = _decode(self._buffer)
+        return keys
+
+    def flush(self) -> list[str]:
+        """Give up on an incomplete sequence (the user pressed Escape)."""
+        buffer, self._buffer = self._buffer, ""
+        if not buffer:
+            return []
+        # A lone ESC is the Escape key; ESC + '[' or 'O' is Alt+that key.
+        return ["escape"] if buffer == "\x1b" else [f"alt+{buffer[1]}"]
+
+
+def _decode(text: str) -> tuple[list[str], str]:
+    """Split `text` into keys plus an incomplete trailing escape sequence."""
+    keys: list[str] = []
+    i, end = 0, len(text)
+    while i < end:
+        char = text[i]
+        if char != "\x1b":
+            keys.append(_char_key(char))
+            i += 1
+            continue
+
+        if i + 1 == end:
+            return keys, text[i:]
+        intro = text[i + 1]
+        if intro == "[":
+            j = i + 2
+            while j < end and not "\x40" <= text[j] <= "\x7e":
+                j += 1
+            if j == end:
+                return keys, text[i:]
+            key = _csi_key(text[i + 2 : j], text[j])
+            i = j + 1
+        elif intro == "O":
+            if i + 2 == end:
+                return keys, text[i:]
+            key = _CSI_FINAL.get(text[i + 2])
+            i += 3
+        elif intro == "\x1b":
+            key = "escape"
+            i += 1
+        else:
+            key = f"alt+{_char_key(intro)}"
+            i += 2
+        if key is not None:
+            keys.append(key)
+    return keys, ""
+
+
+def _csi_key(params: str, final: str) -> str | None:
+    # Modifiers ("1;5A" for Ctrl+Up) are dropped: the loops only need the key.
+    if final == "~":
+        return _CSI_TILDE.get(params.split(";", 1)[0])
+    return _CSI_FINAL.get(final)
+
+
+def _char_key(char: str) -> str:
+    if char in _CONTROL:
+        return _CONTROL[char]
+    if char < " ":
+        return f"ctrl+{chr(ord(char) + 96)}"
+    return char
+
+
+class NonBlockingInput:
+    """Context manager for non-blocking, batched terminal input."""
+
+    def __init__(self, stream=None) -> None:
+        self._fd = (sys.stdin if stream is None else stream).fileno()
+        self._decoder = KeyDecoder()
+
+    def __enter__(self) -> "NonBlockingInput":
+        self.old_settings = termios.tcgetattr(self._fd)
+        tty.setcbreak(self._fd)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        termios.tcsetattr(self._fd, termios.TCSADRAIN, self.old_settings)
+
+    def read_keys(self) -> list[str]:
+        """Return every key pressed since the last call, without blocking."""
+        return self.wait(0)
+
+    def wait(self, timeout: float | None) -> list[str]:
+        """Block until a key arrives or `timeout` seconds pass.
+
+        A `timeout` of None blocks until a key is pressed. Returns all keys
+        available when it wakes (possibly none on timeout). Raises EOFError
+        once stdin reaches end of input.
+        """
+        if not select.select([self._fd], [], [], timeout)[0]:
+            return []
+        keys = self._drain()
+        while self._decoder.pending:
+            if not select.select([self._fd], [], [], ESCAPE_DELAY)[0]:
+                keys += self._decoder.flush()
+                break
+            keys += self._drain()
+        return keys
+
+    def _drain(self) -> list[str]:
+        keys: list[str] = []
+        while True:
+            try:
+                data = os.read(self._fd, _READ_SIZE)
+            except OSError as exc:
+                if exc.errno != errno.EIO:  # Linux reports a hangup as EIO
+                    raise
+                data = b""
+            if not data:
+                # End of input (the terminal hung up, or stdin is a file):
+                # the fd stays readable, so waiting again would spin.
+                raise EOFError
+            keys += self._decoder.feed(data)
+            if len(data) < _READ_SIZE or not select.select([self._fd], [], [], 0)[0]:
+                return keys
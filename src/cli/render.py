@@ -0,0 +1,248 @@
+"""Panel renderers for the plain CLI timers.
+
+A frame is a list of centered `(text, style)` lines inside a titled, rounded
+panel. `AnsiPanelRenderer` draws the panel once and then rewrites only the
+cells that changed, using relative cursor movement and a handful of SGR
+codes; a once-a-second stopwatch frame is then about 30 bytes instead of
+the whole reflowed box. `RichPanelRenderer` draws the same frame with Rich
+`Live`, and is used whenever the terminal can't be trusted with raw escape
+sequences (see `ansi_supported`).
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from collections.abc import Callable, Sequence
+
+Line = tuple[str, str]
+
+_SGR_CODES = {
+    "bold": "1",
+    "dim": "2",
+    "blink": "5",
+    "black": "30",
+    "red": "31",
+    "green": "32",
+    "yellow": "33",
+    "blue": "34",
+    "magenta": "35",
+    "cyan": "36",
+    "white": "37",
+}
+
+_RESET = "\x1b[0m"
+_HIDE_CURSOR = "\x1b[?25l"
+_SHOW_CURSOR = "\x1b[?25h"
+
+# Padding inside the border: (rows above/below, columns left/right).
+_PADDING = (1, 2)
+
+RENDERERS = ("auto", "ansi", "rich")
+
+
+def _sgr(style: str, *, color: bool = True) -> str:
+    """Translate a Rich-style string such as 'bold green' into an SGR prefix."""
+    codes = [
+        _SGR_CODES[word]
+        for word in style.split()
+        if word in _SGR_CODES and (color or not _SGR_CODES[word].startswith("3"))
+    ]
+    return f"\x1b[{';'.join(codes)}m" if codes else ""
+
+
+def ansi_supported(stream=None) -> bool:
+    """Whether `stream` is a terminal that understands cursor movement."""
+    stream = sys.stdout if stream is None else stream
+    if os.name != "posix" or os.environ.get("TERM", "dumb") == "dumb":
+        return False
+    try:
+        return stream.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+class AnsiPanelRenderer:
+    """Draws a panel once, then repaints only the changed character cells.
+
+    Changing the border style, the subtitle, the number of lines or the
+    terminal width redraws the whole panel. Everything is written through
+    `write`, one call per frame.
+    """
+
+    def __init__(
+        self,
+        title: str,
+        subtitle: str,
+        *,
+        write: Callable[[str], object] | None = None,
+        width: Callable[[], int] | None = None,
+        color: bool | None = None,
+    ) -> None:
+        self.title = title
+        self.subtitle = subtitle
+        self._write = write or _stdout_write
+        self._width = width or _terminal_width
+        self._color = (not os.environ.get("NO_COLOR")) if color is None else color
+        self._rows: list[tuple[str, str]] = []  # drawn (padded text, sgr) per row
+        self._shape = None  # (width, border style, subtitle, line count)
+
+    def __enter__(self) -> "AnsiPanelRenderer":
+        self._write(_HIDE_CURSOR)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._write(_RESET + _SHOW_CURSOR)
+
+    def render(
+        self,
+        lines: Sequence[Line],
+        *,
+        border_style: str,
+        subtitle: str | None = None,
+    ) -> None:
+        width = self._width()
+        subtitle = self.subtitle if subtitle is None else subtitle
+        shape = (width, border_style, subtitle, len(lines))
+        inner = width - 2 - 2 * _PADDING[1]
+        rows = [
+            (_center(text, inner), _sgr(style, color=self._color))
+            for text, style in lines
+        ]
+
+        if shape != self._shape:
+            self._write(self._full_frame(shape, rows))
+        else:
+            self._write(self._damage(rows))
+        self._shape = shape
+        self._rows = rows
+
+    def _full_frame(self, shape, rows: list[tuple[str, str]]) -> str:
+        width, border_style, subtitle, _ = shape
+        border = _sgr(border_style, color=self._color)
+        inner = width - 2
+        blank = f"{border}│{_RESET}{' ' * inner}{border}│{_RESET}"
+        out = []
+        if self._shape is not None:
+            # Back to the top of the previous frame, clearing it.
+            out.append(f"\x1b[{self._height(self._shape)}A\r\x1b[J")
+        out.append(f"{border}╭{_rule(self.title, inner)}╮{_RESET}\n")
+        out.extend(f"{blank}\n" for _ in range(_PADDING[0]))
+        pad = " " * _PADDING[1]
+        for text, sgr in rows:
+            out.append(
+                f"{border}│{_RESET}{pad}{sgr}{text}{_RESET}{pad}{border}│{_RESET}\n"
+            )
+        out.extend(f"{blank}\n" for _ in range(_PADDING[0]))
+        out.append(f"{border}╰{_rule(subtitle, inner)}╯{_RESET}\n")
+        return "".join(out)
+
+    def _damage(self, rows: list[tuple[str, str]]) -> str:
+        """Escape sequences that turn the drawn rows into `rows`."""
+        height = self._height(self._shape)
+        out = []
+        for index, ((old, old_sgr), (new, sgr)) in enumerate(zip(self._rows, rows)):
+            if old == new and old_sgr == sgr:
+                continue
+            if old_sgr == sgr:
+                first = next(i for i, (a, b) in enumerate(zip(old, new)) if a != b)
+                last = len(new) - next(
+                    i for i, (a, b) in enumerate(zip(old[::-1], new[::-1])) if a != b
+                )
+            else:
+                first, last = 0, len(new)
+            up = height - (1 + _PADDING[0] + index)
+            column = 2 + _PADDING[1] + first
+            out.append(
+                f"\x1b[{up}A\x1b[{column}G{sgr}{new[first:last]}{_RESET}"
+                f"\x1b[{up}B\r"
+            )
+        return "".join(out)
+
+    @staticmethod
+    def _height(shape) -> int:
+        return 2 + 2 * _PADDING[0] + shape[3]
+
+
+class RichPanelRenderer:
+    """The same panel drawn through Rich `Live`, reflowed on every frame."""
+
+    def __init__(self, title: str, subtitle: str, *, console=None) -> None:
+        from rich.live import Live
+
+        self.title = title
+        self.subtitle = subtitle
+        self._live = Live(auto_refresh=False, screen=False, console=console)
+
+    def __enter__(self) -> "RichPanelRenderer":
+        self._live.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._live.__exit__(exc_type, exc_val, exc_tb)
+
+    def render(
+        self,
+        lines: Sequence[Line],
+        *,
+        border_style: str,
+        subtitle: str | None = None,
+    ) -> None:
+        from rich import box
+        from rich.align import Align
+        from rich.console import Group
+        from rich.panel import Panel
+        from rich.text import Text
+
+        panel = Panel(
+            Group(*(Align.center(Text(text, style=style)) for text, style in lines)),
+            title=self.title,
+            subtitle=self.subtitle if subtitle is None else subtitle,
+            box=box.ROUNDED,
+            border_style=border_style,
+            padding=_PADDING,
+        )
+        self._live.update(panel, refresh=True)
+
+
+def open_panel_renderer(title: str, subtitle: str, renderer: str = "auto"):
+    """Return the panel renderer to use for `renderer` ('auto', 'ansi', 'rich').
+
+    'auto' picks the ANSI renderer on a capable terminal wide enough for the
+    panel, and Rich otherwise.
+    """
+    if renderer not in RENDERERS:
+        raise ValueError(f"unknown renderer '{renderer}'")
+    if renderer == "auto":
+        wide_enough = _terminal_width() >= len(subtitle) + 8
+        renderer = "ansi" if ansi_supported() and wide_enough else "rich"
+    if renderer == "ansi":
+        return AnsiPanelRenderer(title, subtitle)
+    return RichPanelRenderer(title, subtitle)
+
+
+def _center(text: str, width: int) -> str:
+    text = text[:width]
+    left = (width - len(text)) // 2
+    return f"{' ' * left}{text}{' ' * (width - len(text) - left)}"
+
+
+def _rule(label: str, width: int) -> str:
+    """A horizontal border of `width` cells with `label` centered in it."""
+    label = f" {label} " if label else ""
+    if len(label) > width - 2:
+        return "─" * width
+    left = (width - len(label)) // 2
+    return f"{'─' * left}{label}{'─' * (width - len(label) - left)}"
+
+
+def _stdout_write(data: str) -> None:
+    sys.stdout.write(data)
+    sys.stdout.flush()
+
+
+def _terminal_width() -> int:
+    try:
+        return os.get_terminal_size(sys.stdout.fileno()).columns
+    except (OSError, ValueError):
+        return 80
@@ -0,0 +1,123 @@
+"""asyncio front-ends for `Stopwatch` and `Countdown`.
+
+Waiting runs on the event loop's own timer heap (`loop.call_later`) instead
+of one task per timer polling `tick()`. `AsyncCountdown` hands out
+`Countdown.wait_finished()` futures, each holding one timer handle that is
+re-armed only when the countdown is paused or resumed, so 100k countdowns
+cost 100k heap entries and no CPU while they wait. State changes may come
+from any thread; those made off the loop's thread are handed over with
+`call_soon_threadsafe`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+
+from core.runlog import NS_PER_SECOND
+from core.termclock import Countdown, Stopwatch
+
+
+def _wake(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class AsyncCountdown:
+    """Await a `Countdown` finishing.
+
+    `await countdown.finished()` follows pauses and resumes made from any
+    thread. Cancelling the awaiting task only withdraws that waiter;
+    `cancel()` stops the countdown and cancels every waiter.
+    """
+
+    def __init__(self, countdown: Countdown | float) -> None:
+        if not isinstance(countdown, Countdown):
+            countdown = Countdown(countdown)
+        self.countdown = countdown
+        self._waiters: set[asyncio.Future] = set()
+
+    def finished(self) -> asyncio.Future:
+        """Return a future that resolves once the countdown reaches zero."""
+        waiter = self.countdown.wait_finished()
+        self._waiters.add(waiter)
+        waiter.add_done_callback(self._waiters.discard)
+        return waiter
+
+    def cancel(self) -> None:
+        """Pause the countdown and cancel everyone waiting on it."""
+        self.countdown.pause()
+        for waiter in list(self._waiters):
+            waiter.cancel()
+
+
+class AsyncStopwatch:
+    """Iterate over a `Stopwatch` at a fixed interval of elapsed time.
+
+    `async for elapsed in stopwatch.ticks(1.0)` yields whenever elapsed time
+    crosses a multiple of the interval, sleeping (not polling) while the
+    stopwatch is stopped. Ticks a slow consumer misses are skipped, not
+    queued, and a reset starts the count over. Cancel the consuming task,
+    or `break`, to stop.
+    """
+
+    def __init__(self, stopwatch: Stopwatch | None = None) -> None:
+        self.stopwatch = stopwatch or Stopwatch()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._changed: set[asyncio.Future] = set()
+        self.stopwatch.add_state_listener(self._on_state_change)
+
+    async def ticks(self, interval: float = 1.0) -> AsyncIterator[float]:
+        if interval <= 0:
+            raise ValueError("interval must be greater than 0")
+        loop = self._bind()
+        stopwatch = self.stopwatch
+        interval_ns = max(1, int(interval * NS_PER_SECOND))
+        next_ns = (stopwatch.elapsed_ns // interval_ns + 1) * interval_ns
+
+        while True:
+            changed = loop.create_future()
+            self._changed.add(changed)
+            wakeup = None
+            if stopwatch.is_running:
+                delay = (next_ns - stopwatch.elapsed_ns) / NS_PER_SECOND
+                wakeup = loop.call_later(max(0.0, delay), _wake, changed)
+            try:
+                await changed
+            finally:
+                self._changed.discard(changed)
+                if wakeup is not None:
+                    wakeup.cancel()
+
+            elapsed_ns = stopwatch.elapsed_ns
+            if elapsed_ns >= next_ns:
+                yield elapsed_ns / NS_PER_SECOND
+                elapsed_ns = stopwatch.elapsed_ns
+            if elapsed_ns >= next_ns or elapsed_ns + interval_ns < next_ns:
+                next_ns = (elapsed_ns // interval_ns + 1) * interval_ns
+
+    def _bind(self) -> asyncio.AbstractEventLoop:
+        """Bind to the first event loop that iterates, refusing any other."""
+        loop = asyncio.get_running_loop()
+        if self._loop is None:
+            self._loop = loop
+        elif self._loop is not loop:
+            raise RuntimeError("AsyncStopwatch is bound to another event loop")
+        return loop
+
+    def _on_state_change(self, _stopwatch: Stopwatch) -> None:
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            on_loop = asyncio.get_running_loop() is loop
+        except RuntimeError:  # called from a thread with no running loop
+            on_loop = False
+        if on_loop:
+            self._state_changed()
+        else:
+            loop.call_soon_threadsafe(self._state_changed)
+
+    def _state_changed(self) -> None:
+        for changed in list(self._changed):
+            _wake(changed)
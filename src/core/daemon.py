@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import signal
+import socket
+from pathlib import Path
+from time import monotonic
+
+from core.ipc import DaemonError, decode, encode, socket_path
+from core.scheduler import TimerScheduler
+from core.session import StopwatchSession
+from core.snapshot import LiveSnapshot
+
+# A watcher whose unsent output grows past this is too slow and is dropped.
+_WATCHER_BUFFER_LIMIT = 64 * 1024
+
+# Listen backlog, so bursts of clients (one per tmux pane) aren't refused.
+_BACKLOG = 1024
+
+
+class TimerDaemon:
+    """Owns every stopwatch and countdown and serves them over a Unix socket.
+
+    Stopwatches run inside `StopwatchSession`s, so their runs reach the same
+    journal and history database as `tm sw`. All countdowns share one
+    `TimerScheduler`, and the daemon keeps a single event-loop timer armed for
+    the next expiry. Every timer publishes a live snapshot, so `tm status`
+    never has to ask the daemon. Watchers get pushed an event on every
+    change rather than polling.
+    """
+
+    def __init__(self, path: Path | None = None, *, persist: bool = True) -> None:
+        self.path = Path(path) if path is not None else socket_path()
+        self.persist = persist
+        self.sessions: dict[str, StopwatchSession] = {}
+        self.scheduler = TimerScheduler()
+        self._snapshots: dict[str, LiveSnapshot] = {}
+        self._watchers: set[asyncio.StreamWriter] = set()
+        self._expiry: asyncio.TimerHandle | None = None
+        self._stopping: asyncio.Event | None = None
+
+    async def serve(self) -> None:
+        """Serve until `shutdown` is requested or SIGINT/SIGTERM arrives."""
+        self._claim_socket()
+        self._stopping = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, self._stopping.set)
+
+        server = await asyncio.start_unix_server(
+            self._handle, path=str(self.path), backlog=_BACKLOG
+        )
+        os.chmod(self.path, 0o600)
+        try:
+            async with server:
+                await self._stopping.wait()
+        finally:
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                loop.remove_signal_handler(signum)
+            for writer in list(self._watchers):
+                writer.close()
+            for session in self.sessions.values():
+                session.close()
+            self.sessions.clear()
+            for name in list(self._snapshots):
+                self._cancel_countdown(name)
+            self.path.unlink(missing_ok=True)
+
+    def _claim_socket(self) -> None:
+        """Remove a stale socket, refusing to start if a daemon is listening."""
+        if not self.path.exists():
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(self.path))
+        except (ConnectionRefusedError, FileNotFoundError):
+            self.path.unlink(missing_ok=True)
+        else:
+            raise DaemonError(f"a daemon is already listening on {self.path}")
+        finally:
+            probe.close()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while line := await reader.readline():
+                try:
+                    request = decode(line)
+                    if request.get("op") == "watch":
+                        self._watchers.add(writer)
+                        writer.write(encode({"ok": True}))
+                        continue
+                    reply = {"ok": True, **self.dispatch(request)}
+                except (DaemonError, KeyError, TypeError, ValueError) as exc:
+                    reply = {"ok": False, "error": str(exc)}
+                writer.write(encode(reply))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._watchers.discard(writer)
+            writer.close()
+
+    def dispatch(self, request: dict) -> dict:
+        """Apply one request and return the reply payload."""
+        op = request["op"]
+        if op == "status":
+            return {"timers": self.status(request.get("name"))}
+        if op == "shutdown":
+            if self._stopping is not None:
+                self._stopping.set()
+            return {}
+
+        name = str(request["name"]).strip()
+        if not name:
+            raise DaemonError("a timer name is required")
+
+        if op == "start":
+            seconds = request.get("seconds")
+            if seconds is not None:
+                self._start_countdown(name, float(seconds))
+            else:
+                self._stopwatch(name, create=True).stopwatch.start()
+        elif op == "stop":
+            if name in self.scheduler:
+                self.scheduler.pause(name)
+            else:
+                self._stopwatch(name).stopwatch.stop()
+        elif op == "reset":
+            if name in self.scheduler:
+                self._cancel_countdown(name)
+            else:
+                self.sessions.pop(self._stopwatch(name).project_name).close()
+        else:
+            raise DaemonError(f"unknown operation '{op}'")
+
+        self._rearm()
+        self._broadcast({"event": op, "name": name})
+        return {"timers": self.status(name)}
+
+    def status(self, name: str | None = None) -> list[dict]:
+        timers = []
+        for project, session in self.sessions.items():
+            if name is None or project == name:
+                stopwatch = session.stopwatch
+                timers.append(
+                    {
+                        "name": project,
+                        "kind": "stopwatch",
+                        "running": stopwatch.is_running,
+                        "seconds": stopwatch.elapsed,
+                    }
+                )
+        for timer_name, countdown in self.scheduler:
+            if name is None or timer_name == name:
+                timers.append(
+                    {
+                        "name": timer_name,
+                        "kind": "countdown",
+                        "running": countdown.is_running and not countdown.is_finished,
+                        "seconds": countdown.time_left,
+                    }
+                )
+        return timers
+
+    def _stopwatch(self, name: str, *, create: bool = False) -> StopwatchSession:
+        session = self.sessions.get(name)
+        if session is not None:
+            return session
+        if not create:
+            raise DaemonError(f"no timer named '{name}'")
+        if name in self.scheduler:
+            raise DaemonError(f"'{name}' is already a countdown")
+        try:
+            session = StopwatchSession(name, persist=self.persist)
+        except Exception:
+            session = StopwatchSession(name, persist=False)
+        self.sessions[name] = session
+        return session
+
+    def _start_countdown(self, name: str, seconds: float) -> None:
+        if name in self.sessions:
+            raise DaemonError(f"'{name}' is already a stopwatch")
+        if name in self.scheduler:
+            countdown = self.scheduler[name]
+            if not countdown.is_finished:
+                self.scheduler.resume(name)
+                return
+            self._cancel_countdown(name)
+        if seconds <= 0:
+            raise DaemonError("time must be greater than 0")
+        countdown = self.scheduler.add(name, seconds)
+        self._snapshots[name] = LiveSnapshot.for_countdown(name, countdown)
+
+    def _cancel_countdown(self, name: str) -> None:
+        self.scheduler.cancel(name)
+        self._snapshots.pop(name).close()
+
+    def _rearm(self) -> None:
+        """Keep exactly one loop timer armed for the next countdown expiry."""
+        if self._expiry is not None:
+            self._expiry.cancel()
+            self._expiry = None
+        deadline = self.scheduler.next_deadline()
+        if deadline is not None:
+            loop = asyncio.get_running_loop()
+            self._expiry = loop.call_later(
+                max(0.0, deadline - monotonic()), self._on_expiry
+            )
+
+    def _on_expiry(self) -> None:
+        self._expiry = None
+        for name, _ in self.scheduler.pop_expired():
+            self._broadcast({"event": "finished", "name": name})
+        self._rearm()
+
+    def _broadcast(self, event: dict) -> None:
+        if not self._watchers:
+            return
+        line = encode(event)
+        for writer in list(self._watchers):
+            transport = writer.transport
+            if transport.is_closing():
+                self._watchers.discard(writer)
+            elif transport.get_write_buffer_size() > _WATCHER_BUFFER_LIMIT:
+                self._watchers.discard(writer)
+                writer.close()
+            else:
+                writer.write(line)
+
+
+def run_daemon(path: Path | None = None) -> None:
+    asyncio.run(TimerDaemon(path).serve())
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import re
+
+UNIT_SECONDS: dict[str, int] = {
+    # seconds
+    "s": 1,
+    "sec": 1,
+    "secs": 1,
+    "second": 1,
+    "seconds": 1,
+    # minutes
+    "m": 60,
+    "min": 60,
+    "mins": 60,
+    "minute": 60,
+    "minutes": 60,
+    # hours
+    "h": 3600,
+    "hr": 3600,
+    "hrs": 3600,
+    "hour": 3600,
+    "hours": 3600,
+}
+
+
+def parse_duration(text: str, default_unit: str = "m") -> int:
+    """Parse durations such as '90s', '5m', '1h' or '15 min' into seconds.
+
+    Raises ValueError with a user-facing message if `text` isn't a duration.
+    """
+    match = re.fullmatch(r"\s*(\d+)\s*([a-zA-Z]*)\s*", text)
+    if match is None:
+        raise ValueError(f"Invalid duration '{text}'. Use e.g. '90s', '5m' or '1h'.")
+
+    amount, unit = match.groups()
+    multiplier = UNIT_SECONDS.get((unit or default_unit).lower())
+    if multiplier is None:
+        raise ValueError(f"Unknown unit '{unit}'. Please use 's', 'm', or 'h'.")
+    return int(amount) * multiplier
@@ -0,0 +1,315 @@
+"""Timer events and the bus that carries them to observers.
+
+`Stopwatch` and `Countdown` report what they do (start, stop, lap, reset,
+pause, resume, tick, finish) as small typed events on the process-wide
+`bus`. Nothing is built while no sink is attached: every emit site is
+guarded by a single `bus.active` check. Once a sink is attached, emitting
+is a lock-free append to a bounded queue; a background thread hands events
+to the sinks in batches, so a slow sink never stalls a timer. When the
+queue is full, events are dropped and counted in `bus.dropped`.
+
+    from core.events import bus, RingBufferSink
+
+    recent = bus.attach(RingBufferSink(1000))
+    ...
+    bus.flush()
+    for event in recent.events():
+        print(event.to_dict())
+
+Setting `TM_EVENTS=/path/to/events.jsonl` makes `tm` append every event
+to that file (see `attach_from_env`).
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import sys
+import threading
+from collections import deque
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from typing import ClassVar, TextIO
+
+# Events waiting for the dispatch thread before new ones are dropped.
+QUEUE_SIZE = 8192
+# Most events handed to the sinks per batch (one sink flush per batch).
+_BATCH_SIZE = 256
+
+ENV_VAR = "TM_EVENTS"
+
+
+@dataclass(slots=True)
+class TimerEvent:
+    """Base class: which timer, and when (wall clock, epoch nanoseconds).
+
+    Events are shared by every sink, so treat them as read-only. (They
+    aren't frozen: that would triple the cost of building one.)
+    """
+
+    kind: ClassVar[str] = "timer"
+
+    timer: str
+    ts_ns: int
+
+    def to_dict(self) -> dict:
+        return {"event": self.kind, **asdict(self)}
+
+
+@dataclass(slots=True)
+class StopwatchStarted(TimerEvent):
+    kind: ClassVar[str] = "stopwatch.started"
+
+    elapsed_ns: int
+
+
+@dataclass(slots=True)
+class StopwatchStopped(TimerEvent):
+    kind: ClassVar[str] = "stopwatch.stopped"
+
+    elapsed_ns: int
+    run_ns: int
+
+
+@dataclass(slots=True)
+class StopwatchLap(TimerEvent):
+    kind: ClassVar[str] = "stopwatch.lap"
+
+    lap_ns: int
+    laps: int
+
+
+@dataclass(slots=True)
+class StopwatchReset(TimerEvent):
+    kind: ClassVar[str] = "stopwatch.reset"
+
+    elapsed_ns: int  # the total that was discarded
+
+
+@dataclass(slots=True)
+class StopwatchTick(TimerEvent):
+    """Progress reported by the headless output (`tm sw --jsonl`).
+
+    `Stopwatch` itself never emits it; see `cli.headless`.
+    """
+
+    kind: ClassVar[str] = "stopwatch.tick"
+
+    elapsed_ns: int
+
+
+@dataclass(slots=True)
+class CountdownStarted(TimerEvent):
+    kind: ClassVar[str] = "countdown.started"
+
+    remaining_ns: int
+
+
+@dataclass(slots=True)
+class CountdownPaused(TimerEvent):
+    kind: ClassVar[str] = "countdown.paused"
+
+    remaining_ns: int
+
+
+@dataclass(slots=True)
+class CountdownResumed(TimerEvent):
+    kind: ClassVar[str] = "countdown.resumed"
+
+    remaining_ns: int
+
+
+@dataclass(slots=True)
+class CountdownTick(TimerEvent):
+    kind: ClassVar[str] = "countdown.tick"
+
+    remaining_ns: int
+
+
+@dataclass(slots=True)
+class CountdownFinished(TimerEvent):
+    """Reported the first time the countdown is seen finished.
+
+    `ts_ns` is when the deadline passed; `late_ns` is how long after that
+    someone noticed.
+    """
+
+    kind: ClassVar[str] = "countdown.finished"
+
+    late_ns: int
+
+
+class Sink:
+    """Receives events on the dispatch thread, in the order they were emitted."""
+
+    def handle(self, event: TimerEvent) -> None:
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        """Called after each batch of events."""
+
+    def close(self) -> None:
+        """Called once when the sink is detached."""
+
+
+class JsonlSink(Sink):
+    """Appends one JSON object per event to a file or text stream."""
+
+    def __init__(self, target: str | os.PathLike | TextIO) -> None:
+        import json
+
+        self._dumps = json.JSONEncoder(separators=(",", ":")).encode
+        if isinstance(target, (str, os.PathLike)):
+            self._stream = open(target, "a", encoding="utf-8")
+            self._owned = True
+        else:
+            self._stream = target
+            self._owned = False
+
+    def handle(self, event: TimerEvent) -> None:
+        self._stream.write(self._dumps(event.to_dict()) + "\n")
+
+    def flush(self) -> None:
+        self._stream.flush()
+
+    def close(self) -> None:
+        if self._owned:
+            self._stream.close()
+        else:
+            self._stream.flush()
+
+
+class RingBufferSink(Sink):
+    """Keeps the last `capacity` events in memory."""
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self._events: deque[TimerEvent] = deque(maxlen=capacity)
+
+    def handle(self, event: TimerEvent) -> None:
+        self._events.append(event)
+
+    def events(self) -> list[TimerEvent]:
+        """Return the buffered events, oldest first."""
+        return list(self._events)
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+
+class CallbackSink(Sink):
+    """Calls `callback(event)` for each event, on the dispatch thread."""
+
+    def __init__(self, callback: Callable[[TimerEvent], object]) -> None:
+        self._callback = callback
+
+    def handle(self, event: TimerEvent) -> None:
+        self._callback(event)
+
+
+class EventBus:
+    """Delivers events to attached sinks from a background thread.
+
+    `active` is True while at least one sink is attached; emit sites check
+    it before building an event.
+    """
+
+    def __init__(self, maxsize: int = QUEUE_SIZE) -> None:
+        self.active = False
+        self.dropped = 0
+        self.errors = 0
+        self.maxsize = maxsize
+        self._sinks: tuple[Sink, ...] = ()
+        # deque.append and popleft are atomic, so emitting takes no lock;
+        # `_pending` is only set when the dispatch thread may be asleep.
+        self._queue: deque = deque()
+        self._pending = threading.Event()
+        self._lock = threading.Lock()
+        self._worker: threading.Thread | None = None
+
+    def attach(self, sink: Sink) -> Sink:
+        """Start delivering events to `sink`; returns it."""
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="tm-events", daemon=True
+                )
+                self._worker.start()
+                atexit.register(self.close)
+            self._sinks += (sink,)
+            self.active = True
+        return sink
+
+    def detach(self, sink: Sink) -> None:
+        """Deliver what's queued, then stop sending events to `sink`."""
+        self.flush()
+        with self._lock:
+            if sink not in self._sinks:
+                return
+            self._sinks = tuple(s for s in self._sinks if s is not sink)
+            self.active = bool(self._sinks)
+        sink.close()
+
+    def emit(self, event: TimerEvent) -> None:
+        """Queue `event` for the sinks without blocking."""
+        if len(self._queue) >= self.maxsize:
+            self.dropped += 1
+            return
+        self._queue.append(event)
+        if not self._pending.is_set():
+            self._pending.set()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until every event emitted so far has reached the sinks.
+
+        Returns False if `timeout` seconds passed first.
+        """
+        if self._worker is None:
+            return True
+        done = threading.Event()
+        self._queue.append(done)
+        self._pending.set()
+        return done.wait(timeout)
+
+    def close(self) -> None:
+        """Flush and detach every sink."""
+        for sink in self._sinks:
+            self.detach(sink)
+
+    def _run(self) -> None:
+        queue, pending = self._queue, self._pending
+        while True:
+            pending.wait()
+            pending.clear()
+            while queue:
+                batch = []
+                while queue and len(batch) < _BATCH_SIZE:
+                    batch.append(queue.popleft())
+                self._deliver(batch)
+
+    def _deliver(self, batch: list) -> None:
+        # `flush()` markers ride in the queue behind the events they wait for.
+        markers = [item for item in batch if isinstance(item, threading.Event)]
+        if markers:
+            batch = [item for item in batch if not isinstance(item, threading.Event)]
+        for sink in self._sinks:
+            try:
+                for event in batch:
+                    sink.handle(event)
+                sink.flush()
+            except Exception as exc:
+                # A broken sink loses its batch but never stops dispatch.
+                self.errors += 1
+                print(f"tm: event sink {sink!r} failed: {exc}", file=sys.stderr)
+        for marker in markers:
+            marker.set()
+
+
+bus = EventBus()
+
+
+def attach_from_env() -> Sink | None:
+    """Attach a JSONL sink if $TM_EVENTS names a file to append to."""
+    path = os.environ.get(ENV_VAR)
+    if not path:
+        return None
+    return bus.attach(JsonlSink(path))
@@ -1,28 +1,93 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import TYPE_CHECKING
 
+# `tm status` imports this module on every shell prompt; spelling the guard
+# this way keeps `typing` from being imported at runtime.
+TYPE_CHECKING = False
 if TYPE_CHECKING:
+    from core.stats import LapStats
     from core.termclock import StopwatchRun
 
 
 def format_time(seconds: float, *, show_centiseconds: bool = True) -> str:
     """Format a duration in seconds as MM:SS(.CC) or HH:MM:SS(.CC)."""
-
+    if show_centiseconds:
+        return format_centiseconds(seconds)
+    return format_seconds(seconds)
+
+
+# The render loops format the same whole second many times over (every frame
+# for a second or more), so each whole-second formatter remembers its last
+# result as a (whole_seconds, text) pair. Rebinding the tuple is atomic, so
+# concurrent callers at worst miss the memo.
+_seconds_memo = (0, "00:00")
+_hms_memo = (0, "00:00:00")
+_CENTIS = tuple(f".{centis:02}" for centis in range(100))
+# Up to here, whole-second integer math agrees with float divmod; beyond it
+# (a few hundred million years) divmod rounds, and we keep its answers.
+_EXACT_SECONDS = 2**53
+
+
+def _whole_seconds(seconds: float) -> int:
+    try:
+        return int(seconds)
+    except OverflowError:
+        # Infinity: raise what the float divmod version did (its quotient was NaN).
+        return int(seconds - seconds)
+
+
+def format_seconds(seconds: float) -> str:
+    """Format a duration in seconds as MM:SS, or HH:MM:SS past the hour.
+
+    Same as `format_time(seconds, show_centiseconds=False)`.
+    """
+    global _seconds_memo
+    whole = _whole_seconds(max(0.0, float(seconds)))
+    memo = _seconds_memo
+    if memo[0] == whole:
+        return memo[1]
+    if whole >= _EXACT_SECONDS:
+        return _format_float_seconds(seconds)
+    minutes, secs = divmod(whole, 60)
+    if minutes < 60:
+        text = f"{minutes:02}:{secs:02}"
+    else:
+        hours, minutes = divmod(minutes, 60)
+        text = f"{hours:02}:{minutes:02}:{secs:02}"
+    _seconds_memo = (whole, text)
+    return text
+
+
+def format_centiseconds(seconds: float) -> str:
+    """Format a duration in seconds as MM:SS.CC, or HH:MM:SS.CC past the hour.
+
+    Same as `format_time(seconds)`.
+    """
     seconds = max(0.0, float(seconds))
-    minutes, secs = divmod(seconds, 60)
+    return format_seconds(seconds) + _CENTIS[_whole_seconds(seconds * 100) % 100]
+
+
+def format_hms(seconds: float) -> str:
+    """Format a duration in seconds as HH:MM:SS, even under an hour."""
+    global _hms_memo
+    whole = _whole_seconds(max(0.0, float(seconds)))
+    memo = _hms_memo
+    if memo[0] == whole:
+        return memo[1]
+    if whole >= _EXACT_SECONDS:
+        return _format_float_seconds(seconds)
+    minutes, secs = divmod(whole, 60)
     hours, minutes = divmod(minutes, 60)
+    text = f"{hours:02}:{minutes:02}:{secs:02}"
+    _hms_memo = (whole, text)
+    return text
 
-    if show_centiseconds:
-        centiseconds = int((seconds * 100) % 100)
-        if hours > 0:
-            return f"{int(hours):02}:{int(minutes):02}:{int(secs):02}.{centiseconds:02}"
-        return f"{int(minutes):02}:{int(secs):02}.{centiseconds:02}"
 
-    if hours > 0:
-        return f"{int(hours):02}:{int(minutes):02}:{int(secs):02}"
-    return f"{int(minutes):02}:{int(secs):02}"
+def _format_float_seconds(seconds: float) -> str:
+    minutes, secs = divmod(max(0.0, float(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{int(hours):02}:{int(minutes):02}:{int(secs):02}"
 
 
 def format_duration_words(seconds: float) -> str:
@@ -34,6 +99,51 @@ def format_duration_words(seconds: float) -> str:
     return f"{hours} {hours_label} {minutes} {minutes_label}"
 
 
+def build_lap_stats_fields(stats: "LapStats") -> list[tuple[str, str]]:
+    """Return (label, value) pairs describing lap statistics."""
+    if not stats.count:
+        return []
+
+    def _fmt(seconds: float | None) -> str:
+        return "--" if seconds is None else format_time(seconds)
+
+    return [
+        ("Laps", str(stats.count)),
+        ("Last", _fmt(stats.last)),
+        ("Min", _fmt(stats.min)),
+        ("Max", _fmt(stats.max)),
+        ("Mean", _fmt(stats.mean)),
+        ("SD", _fmt(stats.stdev)),
+        ("p50", _fmt(stats.p50)),
+        ("p95", _fmt(stats.p95)),
+    ]
+
+
+def format_lap_stats(stats: "LapStats", *, per_line: int | None = None) -> str:
+    """Format lap statistics as 'Label value' pairs, `per_line` to a line."""
+    pairs = [f"{label} {value}" for label, value in build_lap_stats_fields(stats)]
+    per_line = per_line or len(pairs) or 1
+    return "\n".join(
+        "  ".join(pairs[i : i + per_line]) for i in range(0, len(pairs), per_line)
+    )
+
+
+def format_log_entry(project_name: str, run: "StopwatchRun") -> str:
+    """Format one stored run as a single `tm log` line."""
+    start = run.start_time
+    end = run.end_time
+    end_text = end.strftime("%H:%M") if end else "..."
+    if end and end.date() != start.date():
+        end_text = end.strftime("%Y-%m-%d %H:%M")
+
+    duration_text = format_hms(run.duration)
+
+    return (
+        f"{start.strftime('%Y-%m-%d %H:%M')} - {end_text}  {duration_text}  "
+        f"{project_name}"
+    )
+
+
 def build_stopwatch_summary_fields(
     project_name: str,
     started_at: datetime | None,
@@ -44,9 +154,7 @@ def build_stopwatch_summary_fields(
     start_text = started_at.strftime("%Y-%m-%d %H:%M:%S") if started_at else "N/A"
     end_text = ended_at.strftime("%Y-%m-%d %H:%M:%S") if ended_at else "N/A"
 
-    elapsed_text = format_time(elapsed, show_centiseconds=False)
-    if elapsed_text.count(":") == 1:
-        elapsed_text = f"00:{elapsed_text}"
+    elapsed_text = format_hms(elapsed)
 
     return [
         ("Project name", clean_name),
@@ -68,38 +176,8 @@ def format_stopwatch_summary(
     return "\n".join(["Summary", *[f"{label}: {value}" for label, value in fields]])
 
 
-def format_stopwatch_timeline(
-    project_name: str, total_elapsed: float, runs: list["StopwatchRun"]
-) -> str:
+def format_stopwatch_timeline(runs: list["StopwatchRun"]) -> str:
     """Format stopwatch runs as a timeline visualization."""
-    if not runs:
-        return "No runs recorded."
-
-    local_now = datetime.now().astimezone()
-    local_tz = local_now.tzinfo
-    tz_name = local_now.tzname() or "Local"
-
-    def _to_local(dt: datetime) -> datetime:
-        if dt.tzinfo is None:
-            return dt.replace(tzinfo=local_tz)
-        return dt.astimezone(local_tz)
-
-    lines = []
-    lines.append(f"  Local time: {local_now.strftime('%H:%M:%S')} {tz_name}")
-    lines.append("")
-
-    for i, run in enumerate(runs, 1):
-        start_str = _to_local(run.start_time).strftime("%H:%M")
-        end_str = (
-            _to_local(run.end_time).strftime("%H:%M") if run.end_time else "..."
-        )
-        duration_str = f"({format_duration_words(run.duration)})"
-        
-        # Create a simple timeline bar
-        bar = "▬" * 15
-        line = f"  Session #{i}\t{start_str} {bar} {end_str}  {duration_str}"
-        lines.append(line)
-        if i < len(runs):
-            lines.append("")
-
-    return "\n".join(lines)
+    from core.timeline import timeline_lines
+
+    return "\n".join(timeline_lines(runs))
@@ -0,0 +1,79 @@
+"""Request/response protocol between `tm` clients and the timer daemon.
+
+Messages are single-line JSON objects over a Unix domain socket. A client
+sends `{"op": ..., ...}` and gets back `{"ok": true, ...}` or
+`{"ok": false, "error": ...}`. A `watch` request keeps the connection open
+and receives one `{"event": ...}` line per state change.
+
+This module is imported by short-lived clients, so it only uses the standard
+library pieces that are cheap to load (no asyncio, Typer, Rich or Textual).
+"""
+
+from __future__ import annotations
+
+import json
+import socket
+from collections.abc import Iterator
+from pathlib import Path
+
+from core.paths import runtime_dir
+
+
+class DaemonError(Exception):
+    """The daemon rejected a request."""
+
+
+class DaemonNotRunning(DaemonError):
+    """No daemon is listening on the socket."""
+
+
+def socket_path() -> Path:
+    return runtime_dir() / "daemon.sock"
+
+
+def encode(message: dict) -> bytes:
+    return json.dumps(message, separators=(",", ":")).encode() + b"\n"
+
+
+def decode(line: bytes) -> dict:
+    message = json.loads(line)
+    if not isinstance(message, dict):
+        raise ValueError("a message must be a JSON object")
+    return message
+
+
+def _connect(path: Path | None, timeout: float | None) -> socket.socket:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(str(path or socket_path()))
+    except (FileNotFoundError, ConnectionRefusedError) as exc:
+        sock.close()
+        raise DaemonNotRunning("the tm daemon is not running") from exc
+    return sock
+
+
+def request(op: str, *, path: Path | None = None, timeout: float = 2.0, **args) -> dict:
+    """Send one request and return the daemon's reply."""
+    with _connect(path, timeout) as sock:
+        sock.sendall(encode({"op": op, **args}))
+        reply = sock.makefile("rb").readline()
+
+    if not reply:
+        raise DaemonError("the daemon closed the connection")
+    message = decode(reply)
+    if not message.get("ok"):
+        raise DaemonError(message.get("error", "request failed"))
+    return message
+
+
+def watch(*, path: Path | None = None) -> Iterator[dict]:
+    """Yield events from the daemon until it shuts down."""
+    with _connect(path, None) as sock:
+        sock.sendall(encode({"op": "watch"}))
+        lines = sock.makefile("rb")
+        ack = lines.readline()
+        if not ack or not decode(ack).get("ok"):
+            raise DaemonError("the daemon refused to watch")
+        for line in lines:
+            yield decode(line)
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import os
+import struct
+import threading
+import zlib
+from collections.abc import Iterator
+from pathlib import Path
+
+from core.paths import data_dir, project_key
+from core.runlog import StopwatchRun
+
+_MAGIC = b"TMJ1"
+
+# start_ns, end_ns, duration_ns, followed by a CRC32 of those 24 bytes.
+_PAYLOAD = struct.Struct("<qqq")
+_CRC = struct.Struct("<I")
+RECORD_SIZE = _PAYLOAD.size + _CRC.size
+
+
+def journal_path(project_name: str) -> Path:
+    """Return the journal file used for `project_name`."""
+    return data_dir() / "journal" / f"{project_key(project_name)}.tmj"
+
+
+def _pack(run: StopwatchRun) -> bytes:
+    payload = _PAYLOAD.pack(run.start_ns, run.end_ns or 0, run.duration_ns)
+    return payload + _CRC.pack(zlib.crc32(payload))
+
+
+def _unpack(record: bytes) -> StopwatchRun | None:
+    payload = record[: _PAYLOAD.size]
+    (crc,) = _CRC.unpack_from(record, _PAYLOAD.size)
+    if zlib.crc32(payload) != crc:
+        return None
+    start_ns, end_ns, duration_ns = _PAYLOAD.unpack(payload)
+    return StopwatchRun(start_ns=start_ns, end_ns=end_ns, duration_ns=duration_ns)
+
+
+class _Flusher:
+    """One background thread that fsyncs every open journal with pending runs.
+
+    The thread runs only while a journal is open, so a process with many
+    journals open (`tm dash -s A -s B ...`) still has just one.
+    """
+
+    def __init__(self) -> None:
+        self._journals: set[Journal] = set()
+        self._wakeup = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    def add(self, journal: "Journal") -> None:
+        with self._wakeup:
+            self._journals.add(journal)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="tm-journal-fsync", daemon=True
+                )
+                self._thread.start()
+            self._wakeup.notify()
+
+    def remove(self, journal: "Journal") -> None:
+        """Stop flushing `journal`; the thread doesn't touch it afterwards."""
+        with self._wakeup:
+            self._journals.discard(journal)
+            self._wakeup.notify()
+
+    def _run(self) -> None:
+        with self._wakeup:
+            while self._journals:
+                interval = min(journal.fsync_interval for journal in self._journals)
+                self._wakeup.wait(interval)
+                for journal in self._journals:
+                    journal.flush()
+            self._thread = None
+
+
+class Journal:
+    """Append-only, crash-safe journal of completed stopwatch runs.
+
+    Each run is one fixed-size, checksummed record written with a single
+    `write()` on an O_APPEND descriptor, so it reaches the page cache (and
+    survives `kill -9`) before `append` returns. `fsync` is batched on a
+    background thread, shared by all open journals, at least every
+    `fsync_interval` seconds. A torn tail left by a crash is truncated the
+    next time the journal is opened.
+    """
+
+    def __init__(self, path: str | Path, *, fsync_interval: float = 1.0) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644)
+        self._recover()
+
+        self.fsync_interval = fsync_interval
+        self._dirty = False
+        self._closed = False
+        _flusher.add(self)
+
+    @classmethod
+    def for_project(cls, project_name: str, **kwargs) -> "Journal":
+        return cls(journal_path(project_name), **kwargs)
+
+    def append(self, run: StopwatchRun) -> None:
+        """Write `run` to the journal; durability follows within `fsync_interval`."""
+        os.write(self._fd, _pack(run))
+        self._dirty = True
+
+    def flush(self) -> None:
+        """fsync any pending records now."""
+        if self._dirty:
+            self._dirty = False
+            os.fsync(self._fd)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        _flusher.remove(self)
+        self.flush()
+        os.close(self._fd)
+
+    def __enter__(self) -> "Journal":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[StopwatchRun]:
+        return read_journal(self.path)
+
+    def _recover(self) -> None:
+        """Drop a torn or corrupt tail left behind by a crash."""
+        size = os.fstat(self._fd).st_size
+        if size < len(_MAGIC):
+            os.ftruncate(self._fd, 0)
+            os.write(self._fd, _MAGIC)
+            return
+
+        if os.pread(self._fd, len(_MAGIC), 0) != _MAGIC:
+            raise ValueError(f"{self.path} is not a time-manager journal")
+
+        # Records are fixed-size, so only the tail needs checking.
+        end = size - (size - len(_MAGIC)) % RECORD_SIZE
+        while end > len(_MAGIC):
+            record = os.pread(self._fd, RECORD_SIZE, end - RECORD_SIZE)
+            if _unpack(record) is not None:
+                break
+            end -= RECORD_SIZE
+
+        if end != size:
+            os.ftruncate(self._fd, end)
+            os.fsync(self._fd)
+
+
+_flusher = _Flusher()
+
+
+def read_journal(
+    path: str | Path, *, after_ns: int | None = None
+) -> Iterator[StopwatchRun]:
+    """Yield the valid runs stored in the journal at `path`.
+
+    With `after_ns`, only runs that started after it are yielded, found by
+    scanning back from the tail instead of reading the whole journal.
+    """
+    try:
+        handle = open(path, "rb")
+    except FileNotFoundError:
+        return
+
+    with handle:
+        if handle.read(len(_MAGIC)) != _MAGIC:
+            return
+
+        if after_ns is not None:
+            handle.seek(_tail_offset(handle, after_ns))
+
+        while True:
+            record = handle.read(RECORD_SIZE)
+            if len(record) < RECORD_SIZE:
+                return
+            run = _unpack(record)
+            if run is None:
+                return
+            if after_ns is None or run.start_ns > after_ns:
+                yield run
+
+
+def _tail_offset(handle, after_ns: int) -> int:
+    """Scan back from the end for where runs newer than `after_ns` begin."""
+    size = os.fstat(handle.fileno()).st_size
+    offset = size - (size - len(_MAGIC)) % RECORD_SIZE
+    while offset > len(_MAGIC):
+        record = os.pread(handle.fileno(), RECORD_SIZE, offset - RECORD_SIZE)
+        run = _unpack(record)
+        if run is not None and run.start_ns <= after_ns:
+            break
+        offset -= RECORD_SIZE
+    return offset
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import string
+from pathlib import Path
+
+APP_DIR_NAME = "time-manager"
+
+
+def _xdg_dir(env_var: str, fallback: str) -> Path:
+    base = os.environ.get(env_var)
+    if base and os.path.isabs(base):
+        return Path(base) / APP_DIR_NAME
+    return Path.home() / fallback / APP_DIR_NAME
+
+
+def data_dir() -> Path:
+    """Directory for persistent history ($XDG_DATA_HOME/time-manager)."""
+    return _xdg_dir("XDG_DATA_HOME", ".local/share")
+
+
+def state_dir() -> Path:
+    """Directory for state kept across restarts ($XDG_STATE_HOME/time-manager)."""
+    return _xdg_dir("XDG_STATE_HOME", ".local/state")
+
+
+def runtime_dir() -> Path:
+    """Directory for sockets and live snapshots ($XDG_RUNTIME_DIR/time-manager).
+
+    Falls back to a per-user directory under $TMPDIR (or /tmp). Keep in step
+    with `core.snapshot.live_dir`, which can't import this module.
+    """
+    base = os.environ.get("XDG_RUNTIME_DIR")
+    if base and os.path.isabs(base):
+        path = Path(base) / APP_DIR_NAME
+    else:
+        tmp = os.environ.get("TMPDIR") or "/tmp"
+        path = Path(tmp) / f"{APP_DIR_NAME}-{os.getuid()}"
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    return path
+
+
+def project_slug(project_name: str) -> str:
+    """Return a filesystem-safe key for a project name."""
+    slug = re.sub(r"[^a-z0-9]+", "-", (project_name or "").strip().lower()).strip("-")
+    return slug or "untitled"
+
+
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+def project_key(project_name: str) -> str:
+    """Return a filesystem-safe key that identifies one project.
+
+    Different names can share a slug ("Project Alpha", "Project-Alpha"), so
+    the slug is followed by a hash of the name itself. Names are compared
+    the way the history database does (ASCII case-insensitively), so names
+    it treats as one project share a key.
+    """
+    name = (project_name or "").strip().translate(_ASCII_LOWER)
+    digest = hashlib.blake2b(name.encode(), digest_size=4).hexdigest()
+    return f"{project_slug(project_name)}-{digest}"
@@ -0,0 +1,234 @@
+"""Per-frame timing for the render loops (`tm sw --profile`).
+
+A frame is split into phases: input handling, formatting, building the
+renderable, and writing it out. `FrameProfiler` timestamps the phase
+boundaries with `perf_counter_ns` and files each duration into two places:
+
+- a log-linear (HDR-style) histogram per phase, so percentiles cost O(1)
+  memory however long the session runs;
+- a ring of the most recent raw samples, which `dump()` writes as CSV.
+
+Both are allocated up front as `array`s of machine integers, so recording a
+frame never allocates. A frame *misses its deadline* when it finishes more
+than `budget_s` after it was due (when it was scheduled to start, or when it
+actually started if it wasn't scheduled).
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from time import perf_counter_ns
+
+PHASES = ("input", "format", "build", "write")
+
+# Histogram resolution: values below _SUB_BUCKETS nanoseconds are exact;
+# above, each power of two is split into _SUB_BUCKETS / 2 buckets (< 1.6%
+# relative error).
+_SUB_BUCKETS = 128
+_HALF = _SUB_BUCKETS // 2
+_SUB_BITS = _SUB_BUCKETS.bit_length() - 1
+# Up to 2**40 ns (about 18 minutes); longer values land in the last bucket.
+_MAX_SHIFT = 40 - _SUB_BITS
+_BUCKETS = _SUB_BUCKETS + _MAX_SHIFT * _HALF
+
+_PERCENTILES = (50.0, 90.0, 99.0, 99.9, 100.0)
+
+
+def _bucket(value_ns: int) -> int:
+    if value_ns < _SUB_BUCKETS:
+        return max(0, value_ns)
+    shift = value_ns.bit_length() - _SUB_BITS
+    if shift > _MAX_SHIFT:
+        return _BUCKETS - 1
+    return _SUB_BUCKETS + (shift - 1) * _HALF + (value_ns >> shift) - _HALF
+
+
+def _bucket_high(index: int) -> int:
+    """Largest value that lands in bucket `index`."""
+    if index < _SUB_BUCKETS:
+        return index
+    shift, offset = divmod(index - _SUB_BUCKETS, _HALF)
+    shift += 1
+    return ((offset + _HALF + 1) << shift) - 1
+
+
+class Histogram:
+    """Log-linear histogram of nanosecond durations, in a fixed array."""
+
+    def __init__(self) -> None:
+        self.counts = array("Q", bytes(8 * _BUCKETS))
+        self.total = 0
+        self.max = 0
+
+    def add(self, value_ns: int) -> None:
+        self.counts[_bucket(value_ns)] += 1
+        self.total += 1
+        if value_ns > self.max:
+            self.max = value_ns
+
+    def percentile(self, p: float) -> int:
+        """Upper bound of the bucket holding the `p`th percentile."""
+        if not self.total:
+            return 0
+        if p >= 100.0:
+            return self.max
+        rank = max(1, -(-self.total * p // 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(_bucket_high(index), self.max)
+        return self.max
+
+
+class FrameProfiler:
+    """Records phase timings for each frame of a render loop.
+
+    Per frame, call `begin()`, then `mark(phase)` at the end of each phase
+    in `PHASES` order (a phase that didn't happen can be skipped, and counts
+    as zero), then `end()`.
+    """
+
+    def __init__(self, budget_s: float = 1 / 60, capacity: int = 1 << 16) -> None:
+        self.budget_ns = int(budget_s * 1_000_000_000)
+        self.capacity = capacity
+        self.frames = 0
+        self.missed = 0
+        self.histograms = [Histogram() for _ in (*PHASES, "total")]
+        self.lateness = Histogram()
+        self._all = (*self.histograms, self.lateness)  # in row order
+        # Raw samples, one row of len(PHASES) + 2 per frame: the phases,
+        # the total, and the start's lateness against its schedule.
+        self._width = len(PHASES) + 2
+        self._samples = array("q", bytes(8 * self._width * capacity))
+        self._row = array("q", bytes(8 * self._width))
+        self._zeros = array("q", bytes(8 * self._width))
+        self._scheduled = 0
+        self._started = 0
+        self._last = 0
+        self._in_frame = False
+
+    @property
+    def in_frame(self) -> bool:
+        return self._in_frame
+
+    def begin(self, scheduled_ns: int | None = None) -> None:
+        """Start a frame; `scheduled_ns` is when it was due (perf_counter_ns)."""
+        now = perf_counter_ns()
+        self._row[:] = self._zeros
+        self._started = self._last = now
+        self._scheduled = now if scheduled_ns is None else min(scheduled_ns, now)
+        self._in_frame = True
+
+    def mark(self, phase: int) -> None:
+        """End phase number `phase` (an index into `PHASES`)."""
+        now = perf_counter_ns()
+        self._row[phase] += now - self._last
+        self._last = now
+
+    def end(self) -> None:
+        now = perf_counter_ns()
+        row, width, phases = self._row, self._width, len(PHASES)
+        row[phases] = now - self._started
+        row[phases + 1] = self._started - self._scheduled
+        if now - self._scheduled > self.budget_ns:
+            self.missed += 1
+
+        # Histogram.add, inlined: this runs inside the frame being measured.
+        for histogram, value in zip(self._all, row):
+            if value < _SUB_BUCKETS:
+                index = value if value > 0 else 0
+            else:
+                shift = value.bit_length() - _SUB_BITS
+                index = (
+                    _SUB_BUCKETS + (shift - 1) * _HALF + (value >> shift) - _HALF
+                    if shift <= _MAX_SHIFT
+                    else _BUCKETS - 1
+                )
+            histogram.counts[index] += 1
+            histogram.total += 1
+            if value > histogram.max:
+                histogram.max = value
+        offset = (self.frames % self.capacity) * width
+        self._samples[offset : offset + width] = row
+        self.frames += 1
+        self._in_frame = False
+
+    def report(self) -> str:
+        """Percentiles per phase and a histogram of whole-frame times."""
+        lines = [
+            f"Frame profile: {self.frames} frames, {self.missed} missed the "
+            f"{_format_ns(self.budget_ns)} deadline"
+        ]
+        if not self.frames:
+            return lines[0]
+
+        header = "".join(f"{f'p{p:g}' if p < 100 else 'max':>10}" for p in _PERCENTILES)
+        lines.append(f"  {'phase':<8}{header}")
+        names = (*PHASES, "total", "late")
+        for name, histogram in zip(names, self._all):
+            cells = "".join(
+                f"{_format_ns(histogram.percentile(p)):>10}" for p in _PERCENTILES
+            )
+            lines.append(f"  {name:<8}{cells}")
+
+        lines.append("")
+        lines.append("  frame time")
+        lines.extend(_bars(self.histograms[len(PHASES)]))
+        return "\n".join(lines)
+
+    def dump(self, path: str) -> int:
+        """Write the retained raw samples (oldest first) as CSV; returns rows."""
+        kept = min(self.frames, self.capacity)
+        first = self.frames - kept
+        width = self._width
+        with open(path, "w", encoding="utf-8") as out:
+            out.write(
+                "frame," + ",".join(f"{name}_ns" for name in PHASES) + ",total_ns,"
+                "late_ns\n"
+            )
+            for frame in range(first, self.frames):
+                offset = (frame % self.capacity) * width
+                row = self._samples[offset : offset + width]
+                out.write(f"{frame}," + ",".join(map(str, row)) + "\n")
+        return kept
+
+    def print_report(self, dump_path: str | None = None, file=None) -> None:
+        file = sys.stderr if file is None else file
+        print(self.report(), file=file)
+        if dump_path:
+            rows = self.dump(dump_path)
+            print(f"Wrote {rows} frame samples to {dump_path}", file=file)
+
+
+def _bars(histogram: Histogram, width: int = 40) -> list[str]:
+    """One bar per power-of-two range of `histogram` that has samples."""
+    ranges: dict[int, int] = {}
+    for index, count in enumerate(histogram.counts):
+        if count:
+            magnitude = max(0, _bucket_high(index).bit_length() - 1)
+            ranges[magnitude] = ranges.get(magnitude, 0) + count
+    peak = max(ranges.values())
+    cumulative = 0
+    lines = []
+    for magnitude in sorted(ranges):
+        count = ranges[magnitude]
+        cumulative += count
+        bar = "█" * max(1, round(width * count / peak))
+        span = f"{_format_ns(1 << magnitude)}-{_format_ns(2 << magnitude)}"
+        lines.append(
+            f"  {span:>17} {bar:<{width}} {count:>7} "
+            f"{100 * cumulative / histogram.total:6.2f}%"
+        )
+    return lines
+
+
+def _format_ns(value_ns: int) -> str:
+    if value_ns < 1_000:
+        return f"{value_ns}ns"
+    if value_ns < 1_000_000:
+        return f"{value_ns / 1_000:.1f}us"
+    if value_ns < 1_000_000_000:
+        return f"{value_ns / 1_000_000:.2f}ms"
+    return f"{value_ns / 1_000_000_000:.2f}s"
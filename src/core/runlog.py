@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import os
+import struct
+import tempfile
+from array import array
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import overload
+
+NS_PER_SECOND = 1_000_000_000
+
+# `end_ns` of a run that hasn't finished yet.
+_OPEN_END = -1
+
+# One spilled run: start_ns, end_ns, duration_ns.
+_RECORD = struct.Struct("<qqq")
+
+# How many spilled records to read per syscall while iterating.
+_READ_BATCH = 4096
+
+
+def _ns_to_datetime(ns: int) -> datetime:
+    """Convert integer nanoseconds since the epoch to a local aware datetime."""
+    seconds, remainder = divmod(ns, NS_PER_SECOND)
+    utc = datetime.fromtimestamp(seconds, tz=timezone.utc)
+    return utc.replace(microsecond=remainder // 1000).astimezone()
+
+
+@dataclass
+class StopwatchRun:
+    """Represents a single stopwatch run.
+
+    Times are integer nanoseconds since the epoch; `start_time` and `end_time`
+    only build `datetime` objects when a run is formatted.
+    """
+
+    start_ns: int
+    end_ns: int | None = None
+    duration_ns: int = 0
+
+    @property
+    def start_time(self) -> datetime:
+        return _ns_to_datetime(self.start_ns)
+
+    @property
+    def end_time(self) -> datetime | None:
+        if self.end_ns is None:
+            return None
+        return _ns_to_datetime(self.end_ns)
+
+    @property
+    def duration(self) -> float:
+        return self.duration_ns / NS_PER_SECOND
+
+
+class RunLog(Sequence[StopwatchRun]):
+    """Append-only, columnar log of stopwatch runs.
+
+    Runs are stored as three `array('q')` columns (24 bytes per run) instead of
+    one object per run; indexing and iteration build `StopwatchRun` views on
+    demand. With `max_in_memory`, the oldest half of the log is spilled to
+    `spill_path` (an anonymous temporary file by default) whenever the cap is
+    reached, so memory stays flat for sessions that run for weeks.
+    """
+
+    def __init__(
+        self,
+        max_in_memory: int | None = None,
+        spill_path: str | Path | None = None,
+    ) -> None:
+        if max_in_memory is not None and max_in_memory < 2:
+            raise ValueError("max_in_memory must be at least 2")
+
+        self._starts = array("q")
+        self._ends = array("q")
+        self._durations = array("q")
+        self._max_in_memory = max_in_memory
+        self._spill_path = Path(spill_path) if spill_path is not None else None
+        self._spill_file = None
+        self._spilled = 0
+        self._total_ns = 0
+
+    def append(self, start_ns: int, end_ns: int | None, duration_ns: int) -> None:
+        """Record a run. Amortized O(1), including spills."""
+        self._starts.append(start_ns)
+        self._ends.append(_OPEN_END if end_ns is None else end_ns)
+        self._durations.append(duration_ns)
+        self._total_ns += duration_ns
+
+        if self._max_in_memory is not None and len(self._starts) >= self._max_in_memory:
+            self._spill(len(self._starts) // 2)
+
+    @property
+    def total_ns(self) -> int:
+        """Sum of all run durations, in nanoseconds."""
+        return self._total_ns
+
+    @property
+    def in_memory(self) -> int:
+        """Number of runs currently held in memory."""
+        return len(self._starts)
+
+    def close(self) -> None:
+        """Release the spill file, if any."""
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+
+    def __len__(self) -> int:
+        return self._spilled + len(self._starts)
+
+    @overload
+    def __getitem__(self, index: int) -> StopwatchRun: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[StopwatchRun]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("run index out of range")
+
+        if index < self._spilled:
+            return self._read_spilled(index)
+
+        index -= self._spilled
+        return self._view(
+            self._starts[index], self._ends[index], self._durations[index]
+        )
+
+    def __iter__(self) -> Iterator[StopwatchRun]:
+        for first in range(0, self._spilled, _READ_BATCH):
+            count = min(_READ_BATCH, self._spilled - first)
+            data = os.pread(
+                self._spill_file.fileno(), count * _RECORD.size, first * _RECORD.size
+            )
+            for start_ns, end_ns, duration_ns in _RECORD.iter_unpack(data):
+                yield self._view(start_ns, end_ns, duration_ns)
+
+        for i in range(len(self._starts)):
+            yield self._view(self._starts[i], self._ends[i], self._durations[i])
+
+    def spans(self) -> Iterator[tuple[int, int]]:
+        """Yield `(start_ns, duration_ns)` per run, without building views."""
+        for first in range(0, self._spilled, _READ_BATCH):
+            count = min(_READ_BATCH, self._spilled - first)
+            data = os.pread(
+                self._spill_file.fileno(), count * _RECORD.size, first * _RECORD.size
+            )
+            for start_ns, _end_ns, duration_ns in _RECORD.iter_unpack(data):
+                yield start_ns, duration_ns
+
+        yield from zip(self._starts, self._durations)
+
+    @staticmethod
+    def _view(start_ns: int, end_ns: int, duration_ns: int) -> StopwatchRun:
+        return StopwatchRun(
+            start_ns=start_ns,
+            end_ns=None if end_ns == _OPEN_END else end_ns,
+            duration_ns=duration_ns,
+        )
+
+    def _read_spilled(self, index: int) -> StopwatchRun:
+        data = os.pread(self._spill_file.fileno(), _RECORD.size, index * _RECORD.size)
+        return self._view(*_RECORD.unpack(data))
+
+    def _spill(self, count: int) -> None:
+        if self._spill_file is None:
+            if self._spill_path is None:
+                self._spill_file = tempfile.TemporaryFile(prefix="tm-runs-")
+            else:
+                self._spill_file = open(self._spill_path, "w+b")
+
+        records = bytearray(count * _RECORD.size)
+        for i in range(count):
+            _RECORD.pack_into(
+                records,
+                i * _RECORD.size,
+                self._starts[i],
+                self._ends[i],
+                self._durations[i],
+            )
+        os.pwrite(self._spill_file.fileno(), records, self._spilled * _RECORD.size)
+
+        del self._starts[:count]
+        del self._ends[:count]
+        del self._durations[:count]
+        self._spilled += count
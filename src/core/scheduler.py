@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+from collections.abc import Iterator
+from time import monotonic
+
+from core.termclock import Countdown
+
+
+class TimerScheduler:
+    """Many named countdowns driven from a single deadline min-heap.
+
+    `add`, `cancel`, `pause` and `resume` are O(log n): instead of searching
+    the heap, a timer's old entry is left in place and skipped when it reaches
+    the top (the heap is rebuilt if stale entries pile up). Callers sleep until
+    `next_deadline()` (or use `wait()`), so a process holding thousands of
+    timers wakes only when one of them expires. Methods are safe to call from
+    other threads while one thread waits.
+    """
+
+    def __init__(self) -> None:
+        self._timers: dict[str, Countdown] = {}
+        self._heap: list[tuple[float, int, str]] = []
+        self._live: dict[str, int] = {}  # name -> sequence of its valid heap entry
+        self._finished: set[str] = set()
+        self._sequence = itertools.count()
+        self._changed = threading.Condition()
+
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._timers
+
+    def __getitem__(self, name: str) -> Countdown:
+        return self._timers[name]
+
+    def __iter__(self) -> Iterator[tuple[str, Countdown]]:
+        """Yield `(name, countdown)` pairs in the order they were added."""
+        return iter(list(self._timers.items()))
+
+    @property
+    def pending(self) -> int:
+        """Number of timers that haven't finished (running or paused)."""
+        return len(self._timers) - len(self._finished)
+
+    def add(self, name: str, seconds: float) -> Countdown:
+        with self._changed:
+            if name in self._timers:
+                raise ValueError(f"a timer named '{name}' already exists")
+            countdown = Countdown(seconds, name=name)
+            self._timers[name] = countdown
+            self._push(name, countdown)
+            return countdown
+
+    def cancel(self, name: str) -> None:
+        with self._changed:
+            del self._timers[name]
+            self._live.pop(name, None)
+            self._finished.discard(name)
+            self._compact_if_needed()
+            self._changed.notify_all()
+
+    def pause(self, name: str) -> None:
+        with self._changed:
+            countdown = self._timers[name]
+            if countdown.is_running and not countdown.is_finished:
+                countdown.pause()
+                self._live.pop(name, None)
+                self._changed.notify_all()
+
+    def resume(self, name: str) -> None:
+        with self._changed:
+            countdown = self._timers[name]
+            if not countdown.is_running and name not in self._finished:
+                countdown.resume()
+                self._push(name, countdown)
+
+    def toggle(self, name: str) -> None:
+        if self._timers[name].is_running:
+            self.pause(name)
+        else:
+            self.resume(name)
+
+    def pause_all(self) -> None:
+        for name in list(self._live):
+            self.pause(name)
+
+    def resume_all(self) -> None:
+        for name, countdown in self._timers.items():
+            if not countdown.is_running:
+                self.resume(name)
+
+    def next_deadline(self) -> float | None:
+        """Return the monotonic time of the next expiry, or None if none is due."""
+        heap = self._heap
+        while heap and self._live.get(heap[0][2]) != heap[0][1]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def pop_expired(self, now: float | None = None) -> list[tuple[str, Countdown]]:
+        """Return the timers that have expired since the last call."""
+        now = monotonic() if now is None else now
+        expired: list[tuple[str, Countdown]] = []
+        with self._changed:
+            while (deadline := self.next_deadline()) is not None and deadline <= now:
+                _, _, name = heapq.heappop(self._heap)
+                del self._live[name]
+                self._finished.add(name)
+                expired.append((name, self._timers[name]))
+        for _, countdown in expired:
+            countdown.check_finished()
+        return expired
+
+    def wait(self, timeout: float | None = None) -> list[tuple[str, Countdown]]:
+        """Block until a timer expires or `timeout` passes; return what expired.
+
+        Wakes early (possibly returning nothing) if timers are added, paused
+        or resumed from another thread.
+        """
+        with self._changed:
+            expired = self.pop_expired()
+            if expired:
+                return expired
+
+            deadline = self.next_deadline()
+            sleep_for = None if deadline is None else max(0.0, deadline - monotonic())
+            if timeout is not None:
+                sleep_for = timeout if sleep_for is None else min(sleep_for, timeout)
+            self._changed.wait(sleep_for)
+            return self.pop_expired()
+
+    def _push(self, name: str, countdown: Countdown) -> None:
+        sequence = next(self._sequence)
+        heapq.heappush(self._heap, (countdown.deadline, sequence, name))
+        self._live[name] = sequence
+        self._compact_if_needed()
+        self._changed.notify_all()
+
+    def _compact_if_needed(self) -> None:
+        if len(self._heap) <= 2 * len(self._live) + 64:
+            return
+        self._heap = [
+            (self._timers[name].deadline, sequence, name)
+            for name, sequence in self._live.items()
+        ]
+        heapq.heapify(self._heap)
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from time import time_ns
+
+from core.journal import Journal
+from core.snapshot import LiveSnapshot
+from core.state import StateFile, StopwatchState
+from core.store import RunStore
+from core.termclock import Stopwatch
+
+
+class StopwatchSession:
+    """A project's `Stopwatch` wired to its persistence backends.
+
+    Completed runs are appended to the project's journal as they happen and
+    queued for the history database, and every start/stop/reset updates the
+    project's state file so `resume=True` can pick the stopwatch up again
+    after the terminal closes or the process dies. Every session, persistent
+    or not, also publishes a live snapshot for `tm status`. Closing the
+    session stops a running stopwatch (recording its final run), flushes
+    everything to disk and withdraws the snapshot.
+
+    Sessions opened together can share one history database connection
+    through `store`; the caller then closes it, after the sessions.
+    """
+
+    def __init__(
+        self,
+        project_name: str,
+        *,
+        persist: bool = True,
+        resume: bool = False,
+        store: RunStore | None = None,
+    ) -> None:
+        self.project_name = (project_name or "").strip() or "Untitled"
+        self.stopwatch = Stopwatch(name=self.project_name)
+        self.journal: Journal | None = None
+        self.store: RunStore | None = None
+        self._owns_store = store is None
+        self.state: StateFile | None = None
+        self.snapshot: LiveSnapshot | None = None
+
+        if resume and not persist:
+            raise ValueError("resuming a stopwatch needs persistence enabled")
+
+        if persist:
+            try:
+                self.journal = Journal.for_project(self.project_name)
+                self.store = RunStore() if store is None else store
+                self.store.import_journal(self.project_name, self.journal.path)
+                self.state = StateFile.for_project(self.project_name)
+                if resume:
+                    self._resume()
+            except BaseException:
+                self.close()
+                raise
+            self.stopwatch.add_run_listener(self.journal.append)
+            self.stopwatch.add_run_listener(self._store_run)
+            self.stopwatch.add_state_listener(self._save_state)
+
+        self.snapshot = LiveSnapshot.for_stopwatch(self.project_name, self.stopwatch)
+
+    def _resume(self) -> None:
+        saved = self.state.read()
+        if saved is None:
+            raise LookupError(f"no saved stopwatch for '{self.project_name}'")
+        self.stopwatch.restore(
+            saved.accumulated_ns, saved.run_started_at_ns if saved.running else None
+        )
+
+    def _save_state(self, stopwatch: Stopwatch) -> None:
+        self.state.write(
+            StopwatchState(
+                running=stopwatch.is_running,
+                accumulated_ns=stopwatch.accumulated_ns,
+                run_started_at_ns=stopwatch.run_started_at_ns or 0,
+                updated_at_ns=time_ns(),
+            )
+        )
+
+    def _store_run(self, run) -> None:
+        self.store.append(self.project_name, run)
+
+    def close(self) -> None:
+        if self.stopwatch.is_running:
+            self.stopwatch.stop()
+        if self.journal is not None:
+            self.journal.close()
+            self.journal = None
+        if self.store is not None:
+            if self._owns_store:
+                self.store.close()
+            else:
+                self.store.flush()
+            self.store = None
+        if self.state is not None:
+            self.state.close()
+            self.state = None
+        if self.snapshot is not None:
+            self.snapshot.close()
+            self.snapshot = None
+
+    def __enter__(self) -> "StopwatchSession":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
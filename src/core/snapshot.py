@@ -0,0 +1,357 @@
+"""Tiny live snapshots of running timers, for `tm status`.
+
+Every `tm sw`/`tm cd` process (and the daemon) maps one small file per timer
+under the runtime directory and rewrites it on each start, stop, pause,
+resume or lap. A snapshot holds the value at a monotonic anchor, so readers
+work out the current time themselves and writers never have to update it
+per tick.
+
+The file is a seqlock: the writer makes the sequence number odd, rewrites
+the body and makes it even again; readers copy the body between two reads
+of the sequence and retry if it was odd or changed. Readers never write, so
+any number of them (`tm status`, `tm sw --attach`) cost the owner nothing.
+
+`tm status` is run every second by shell prompts and tmux status lines, so
+the reading side only uses `os` and `struct`: no pathlib, no typing, no
+dataclasses.
+"""
+
+from __future__ import annotations
+
+import itertools
+import mmap
+import os
+import struct
+from time import monotonic_ns
+
+_MAGIC = b"TML2"
+_KINDS = ("stopwatch", "countdown")
+_NAME_BYTES = 64
+
+# magic, sequence number.
+_HEADER = struct.Struct("<4sI")
+_SEQUENCE = struct.Struct("<I")
+_SEQUENCE_OFFSET = 4
+# kind, running, name length, pid, value_ns, anchor_ns, name, then the lap
+# count and last/min/max/mean/stdev/p50/p95 (NaN for "none yet").
+_BODY = struct.Struct(f"<B?Hi4xqq{_NAME_BYTES}sQ7d")
+_SIZE = _HEADER.size + _BODY.size
+
+# A write takes about a microsecond; give up after this many busy reads
+# (the writer may have died mid-update).
+_READ_ATTEMPTS = 100
+_NAN = float("nan")
+
+_file_ids = itertools.count()
+
+
+def live_dir() -> str:
+    """Return `core.paths.runtime_dir() / "live"` without importing pathlib."""
+    base = os.environ.get("XDG_RUNTIME_DIR")
+    if base and os.path.isabs(base):
+        runtime = os.path.join(base, "time-manager")
+    else:
+        tmp = os.environ.get("TMPDIR") or "/tmp"
+        runtime = os.path.join(tmp, f"time-manager-{os.getuid()}")
+    return os.path.join(runtime, "live")
+
+
+class Snapshot:
+    """One timer as last published by its owning process."""
+
+    __slots__ = ("name", "kind", "running", "value_ns", "anchor_ns", "pid", "laps")
+
+    def __init__(self, name, kind, running, value_ns, anchor_ns, pid, laps) -> None:
+        self.name = name
+        self.kind = kind
+        self.running = running
+        self.value_ns = value_ns
+        self.anchor_ns = anchor_ns
+        self.pid = pid
+        self.laps = laps
+
+    def seconds(self, now_ns: int | None = None) -> float:
+        """Elapsed (stopwatch) or remaining (countdown) seconds right now."""
+        value_ns = self.value_ns
+        if self.running:
+            passed = (monotonic_ns() if now_ns is None else now_ns) - self.anchor_ns
+            value_ns += passed if self.kind == "stopwatch" else -passed
+        return max(0, value_ns) / 1_000_000_000
+
+    @property
+    def finished(self) -> bool:
+        return self.kind == "countdown" and self.seconds() <= 0
+
+
+class LapSummary:
+    """The published lap statistics, shaped like `core.stats.LapStats`."""
+
+    __slots__ = ("count", "last", "min", "max", "mean", "stdev", "p50", "p95")
+
+    def __init__(self, count, last, min, max, mean, stdev, p50, p95) -> None:
+        self.count = count
+        # NaN (never equal to itself) stands for None.
+        self.last = last if last == last else None
+        self.min = min if min == min else None
+        self.max = max if max == max else None
+        self.mean = mean
+        self.stdev = stdev
+        self.p50 = p50 if p50 == p50 else None
+        self.p95 = p95 if p95 == p95 else None
+
+
+class LiveSnapshot:
+    """Publishes one timer's state through a small memory-mapped file.
+
+    Updates are three copies into the mapping (no syscalls), done only on
+    state changes. Publishing is best-effort: if the runtime directory can't
+    be used, the snapshot is simply disabled and the timer runs as usual.
+    """
+
+    def __init__(self, name: str, kind: str) -> None:
+        self.name = name
+        self.kind = kind
+        self.path: str | None = None
+        self._map = None
+        self._sequence = 0
+        self._header = (
+            _KINDS.index(kind),
+            name.encode()[:_NAME_BYTES].decode(errors="ignore").encode(),
+        )
+
+        directory = live_dir()
+        path = os.path.join(directory, f"{os.getpid()}-{next(_file_ids)}.snap")
+        try:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+            fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o600)
+        except OSError:
+            return
+        try:
+            os.ftruncate(fd, _SIZE)
+            self._map = mmap.mmap(fd, _SIZE)
+            # An odd sequence number: not published yet.
+            self._map[: _HEADER.size] = _HEADER.pack(_MAGIC, 1)
+            self.path = path
+        except OSError:
+            os.unlink(path)
+        finally:
+            os.close(fd)
+
+    @classmethod
+    def for_stopwatch(cls, name: str, stopwatch) -> "LiveSnapshot":
+        """Publish `stopwatch` now and after every start, stop, reset and lap."""
+        snapshot = cls(name, "stopwatch")
+        snapshot._publish_stopwatch(stopwatch)
+        stopwatch.add_state_listener(snapshot._publish_stopwatch)
+        stopwatch.add_lap_listener(snapshot._publish_stopwatch)
+        return snapshot
+
+    @classmethod
+    def for_countdown(cls, name: str, countdown) -> "LiveSnapshot":
+        """Publish `countdown` now and after every pause and resume."""
+        snapshot = cls(name, "countdown")
+        snapshot._publish_countdown(countdown)
+        countdown.add_state_listener(snapshot._publish_countdown)
+        return snapshot
+
+    def publish(self, running: bool, value_ns: int, laps=None) -> None:
+        if self._map is None:
+            return
+        kind, name = self._header
+        if laps is None or not laps.count:
+            lap_fields = (0, _NAN, _NAN, _NAN, 0.0, 0.0, _NAN, _NAN)
+        else:
+            lap_fields = (
+                laps.count,
+                laps.last,
+                laps.min,
+                laps.max,
+                laps.mean,
+                laps.stdev,
+                _NAN if laps.p50 is None else laps.p50,
+                _NAN if laps.p95 is None else laps.p95,
+            )
+        body = _BODY.pack(
+            kind,
+            running,
+            len(name),
+            os.getpid(),
+            value_ns,
+            monotonic_ns(),
+            name,
+            *lap_fields,
+        )
+        sequence = self._sequence
+        _SEQUENCE.pack_into(self._map, _SEQUENCE_OFFSET, sequence + 1)
+        self._map[_HEADER.size :] = body
+        self._sequence = (sequence + 2) & 0xFFFFFFFF
+        _SEQUENCE.pack_into(self._map, _SEQUENCE_OFFSET, self._sequence)
+
+    def _publish_stopwatch(self, stopwatch) -> None:
+        self.publish(stopwatch.is_running, stopwatch.elapsed_ns, stopwatch.lap_stats)
+
+    def _publish_countdown(self, countdown) -> None:
+        self.publish(countdown.is_running, int(countdown.time_left * 1_000_000_000))
+
+    def close(self) -> None:
+        """Stop publishing and remove the snapshot file."""
+        if self._map is not None:
+            # Attached viewers keep their mapping after the unlink; this
+            # tells them the owner is gone.
+            self._map[:4] = b"\0\0\0\0"
+            self._map.close()
+            self._map = None
+            os.unlink(self.path)
+
+    def __enter__(self) -> "LiveSnapshot":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class LiveView:
+    """Read-only view of another process's snapshot, for `tm sw --attach`.
+
+    The file is mapped once, so each `read()` is a few memory copies: no
+    syscalls, no locks and nothing the owner has to answer.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            self._map = mmap.mmap(fd, _SIZE, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise OSError(f"{path} is not a live snapshot") from None
+        finally:
+            os.close(fd)
+        self.pid: int | None = None
+
+    @classmethod
+    def find(cls, name: str, kind: str = "stopwatch") -> "LiveView | None":
+        """Attach to the newest live timer called `name`, if there is one."""
+        for path in reversed(_live_paths(live_dir())):
+            snapshot = _read(path)
+            if snapshot is not None and (snapshot.name, snapshot.kind) == (
+                name,
+                kind,
+            ):
+                try:
+                    return cls(path)
+                except OSError:
+                    continue
+        return None
+
+    def read(self) -> Snapshot | None:
+        """The current snapshot, or None once the owner has closed it."""
+        data = self._map
+        snapshot = _decode(lambda offset, size: data[offset : offset + size])
+        if snapshot is not None:
+            self.pid = snapshot.pid
+        return snapshot
+
+    def owner_alive(self) -> bool:
+        """Whether the publishing process still exists (it may have crashed)."""
+        return self.pid is None or _process_alive(self.pid)
+
+    def close(self) -> None:
+        self._map.close()
+
+    def __enter__(self) -> "LiveView":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+def read_snapshots(directory: str | None = None) -> list[Snapshot]:
+    """Return every live timer, oldest first.
+
+    Snapshots left behind by processes that no longer exist are removed.
+    """
+    directory = live_dir() if directory is None else directory
+    found = []
+    for path in _live_paths(directory):
+        snapshot = _read(path)
+        if snapshot is not None:
+            found.append(snapshot)
+    return found
+
+
+def _live_paths(directory: str) -> list[str]:
+    """Snapshot files of live processes, oldest first; removes the rest."""
+    try:
+        entries = os.listdir(directory)
+    except FileNotFoundError:
+        return []
+
+    found = []
+    for entry in entries:
+        pid, _, rest = entry.partition("-")
+        file_id = rest.removesuffix(".snap")
+        if file_id == rest or not (pid.isdigit() and file_id.isdigit()):
+            continue
+        path = os.path.join(directory, entry)
+        if not _process_alive(int(pid)):
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+            continue
+        found.append((int(pid), int(file_id), path))
+
+    found.sort()
+    return [path for _, _, path in found]
+
+
+def _read(path: str) -> Snapshot | None:
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except FileNotFoundError:
+        return None
+    try:
+        return _decode(lambda offset, size: os.pread(fd, size, offset))
+    finally:
+        os.close(fd)
+
+
+def _decode(read) -> Snapshot | None:
+    """Seqlock read through `read(offset, size) -> bytes`."""
+    for _ in range(_READ_ATTEMPTS):
+        header = read(0, _HEADER.size)
+        if len(header) != _HEADER.size:
+            return None
+        magic, sequence = _HEADER.unpack(header)
+        if magic != _MAGIC:
+            return None
+        if sequence & 1:
+            continue  # mid-update
+        body = read(_HEADER.size, _BODY.size)
+        if read(_SEQUENCE_OFFSET, _SEQUENCE.size) != header[_SEQUENCE_OFFSET:]:
+            continue  # changed while we copied it
+        if len(body) != _BODY.size:
+            return None
+        kind, running, name_len, pid, value_ns, anchor_ns, name, *laps = _BODY.unpack(
+            body
+        )
+        return Snapshot(
+            name[:name_len].decode(),
+            _KINDS[kind],
+            running,
+            value_ns,
+            anchor_ns,
+            pid,
+            LapSummary(*laps),
+        )
+    return None
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
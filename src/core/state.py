@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import os
+import struct
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+
+from core.paths import project_key, state_dir
+
+_MAGIC = b"TMS1"
+
+# magic, running, accumulated_ns, run_started_at_ns, updated_at_ns, CRC32.
+_LAYOUT = struct.Struct("<4s?7xqqqI")
+
+
+@dataclass(frozen=True)
+class StopwatchState:
+    """What it takes to rebuild a stopwatch in another process."""
+
+    running: bool
+    accumulated_ns: int
+    run_started_at_ns: int
+    updated_at_ns: int
+
+
+def state_path(project_name: str) -> Path:
+    """Return the state file used for `project_name`."""
+    return state_dir() / "stopwatch" / f"{project_key(project_name)}.state"
+
+
+class StateFile:
+    """Fixed-size, per-project stopwatch state, updated in place.
+
+    Every write is a single `pwrite` of one small checksummed record at
+    offset 0, done only on state transitions (start, stop, reset), so the
+    file never grows and reading it back is O(1).
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+
+    @classmethod
+    def for_project(cls, project_name: str) -> "StateFile":
+        return cls(state_path(project_name))
+
+    def read(self) -> StopwatchState | None:
+        """Return the saved state, or None if there is none (or it's corrupt)."""
+        return _unpack(os.pread(self._fd, _LAYOUT.size, 0))
+
+    def write(self, state: StopwatchState) -> None:
+        os.pwrite(self._fd, _pack(state), 0)
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+def _pack(state: StopwatchState) -> bytes:
+    fields = (
+        _MAGIC,
+        state.running,
+        state.accumulated_ns,
+        state.run_started_at_ns,
+        state.updated_at_ns,
+    )
+    body = _LAYOUT.pack(*fields, 0)[:-4]
+    return body + struct.pack("<I", zlib.crc32(body))
+
+
+def _unpack(data: bytes) -> StopwatchState | None:
+    if len(data) < _LAYOUT.size:
+        return None
+    magic, running, accumulated_ns, started_ns, updated_ns, crc = _LAYOUT.unpack(data)
+    if magic != _MAGIC or zlib.crc32(data[:-4]) != crc:
+        return None
+    return StopwatchState(running, accumulated_ns, started_ns, updated_ns)
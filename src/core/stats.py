@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import math
+from bisect import insort
+from dataclasses import dataclass, field
+
+
+class P2Quantile:
+    """Streaming quantile estimate using the P² algorithm (Jain & Chlamtac).
+
+    Keeps five markers, so memory and the cost of `add` are O(1) no matter how
+    many observations are seen. Exact for the first five observations.
+    """
+
+    def __init__(self, p: float) -> None:
+        if not 0.0 < p < 1.0:
+            raise ValueError("p must be between 0 and 1")
+        self.p = p
+        self._heights: list[float] = []
+        self._positions = [1.0, 2.0, 3.0, 4.0, 5.0]
+        self._desired = [1.0, 1.0 + 2 * p, 1.0 + 4 * p, 3.0 + 2 * p, 5.0]
+        self._increments = [0.0, p / 2, p, (1.0 + p) / 2, 1.0]
+
+    @property
+    def value(self) -> float | None:
+        heights = self._heights
+        if not heights:
+            return None
+        if len(heights) < 5 or self._positions[4] <= 5:
+            return heights[round(self.p * (len(heights) - 1))]
+        return heights[2]
+
+    def add(self, x: float) -> None:
+        heights = self._heights
+        if len(heights) < 5:
+            insort(heights, x)
+            return
+
+        positions = self._positions
+        if x < heights[0]:
+            heights[0] = x
+            cell = 0
+        elif x >= heights[4]:
+            heights[4] = x
+            cell = 3
+        else:
+            cell = 0
+            while x >= heights[cell + 1]:
+                cell += 1
+
+        for i in range(cell + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        # Nudge the three middle markers towards their desired positions.
+        for i in range(1, 4):
+            delta = self._desired[i] - positions[i]
+            if (delta >= 1 and positions[i + 1] - positions[i] > 1) or (
+                delta <= -1 and positions[i - 1] - positions[i] < -1
+            ):
+                step = 1 if delta > 0 else -1
+                candidate = self._parabolic(i, step)
+                if heights[i - 1] < candidate < heights[i + 1]:
+                    heights[i] = candidate
+                else:
+                    heights[i] = self._linear(i, step)
+                positions[i] += step
+
+    def _parabolic(self, i: int, step: int) -> float:
+        h, n = self._heights, self._positions
+        return h[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (h[i + 1] - h[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (h[i] - h[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def _linear(self, i: int, step: int) -> float:
+        h, n = self._heights, self._positions
+        return h[i] + step * (h[i + step] - h[i]) / (n[i + step] - n[i])
+
+
+@dataclass
+class LapStats:
+    """Lap statistics maintained incrementally, in O(1) per lap.
+
+    Mean and variance use Welford's algorithm; p50 and p95 are P² estimates.
+    All values are in seconds.
+    """
+
+    count: int = 0
+    last: float | None = None
+    min: float | None = None
+    max: float | None = None
+    mean: float = 0.0
+    _m2: float = field(default=0.0, repr=False)
+    _p50: P2Quantile = field(default_factory=lambda: P2Quantile(0.5), repr=False)
+    _p95: P2Quantile = field(default_factory=lambda: P2Quantile(0.95), repr=False)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (0.0 with fewer than two laps)."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+    @property
+    def p50(self) -> float | None:
+        return self._p50.value
+
+    @property
+    def p95(self) -> float | None:
+        return self._p95.value
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.last = seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+
+        delta = seconds - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (seconds - self.mean)
+
+        self._p50.add(seconds)
+        self._p95.add(seconds)
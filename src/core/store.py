@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from time import monotonic
+
+from core.journal import read_journal
+from core.paths import data_dir
+from core.runlog import NS_PER_SECOND, StopwatchRun
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    project TEXT NOT NULL COLLATE NOCASE,
+    start_ns INTEGER NOT NULL,
+    end_ns INTEGER NOT NULL,
+    duration_ns INTEGER NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS runs_project_start ON runs (project, start_ns);
+CREATE INDEX IF NOT EXISTS runs_start ON runs (start_ns);
+
+-- Per-project, per-local-day totals, maintained as runs are inserted.
+CREATE TABLE IF NOT EXISTS daily_totals (
+    project TEXT NOT NULL COLLATE NOCASE,
+    day TEXT NOT NULL,
+    duration_ns INTEGER NOT NULL,
+    runs INTEGER NOT NULL,
+    PRIMARY KEY (project, day)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS daily_totals_day ON daily_totals (day);
+"""
+
+# Bumped whenever derived tables need rebuilding from `runs`.
+_SCHEMA_VERSION = 2
+
+_INSERT_RUN = (
+    "INSERT OR IGNORE INTO runs (project, start_ns, end_ns, duration_ns) "
+    "VALUES (?, ?, ?, ?)"
+)
+
+_ADD_TO_DAY = (
+    "INSERT INTO daily_totals (project, day, duration_ns, runs) VALUES (?, ?, ?, ?) "
+    "ON CONFLICT (project, day) DO UPDATE SET "
+    "duration_ns = duration_ns + excluded.duration_ns, runs = runs + excluded.runs"
+)
+
+# Rows pulled from SQLite per round trip while streaming query results.
+_FETCH_SIZE = 256
+
+
+def split_by_local_day(
+    start_ns: int, end_ns: int, duration_ns: int
+) -> Iterator[tuple[date, int]]:
+    """Split a run into `(local_date, duration_ns)` pieces at local midnights.
+
+    The pieces always add up to `duration_ns`.
+    """
+    remaining = duration_ns
+    cursor = start_ns
+    day = datetime.fromtimestamp(cursor / NS_PER_SECOND).date()
+    while remaining > 0:
+        next_day = day + timedelta(days=1)
+        # A naive local midnight, so DST transitions are resolved by the OS.
+        midnight_ns = (
+            int(datetime.combine(next_day, time()).timestamp()) * NS_PER_SECOND
+        )
+        if end_ns <= midnight_ns:
+            yield day, remaining
+            return
+        piece = min(remaining, midnight_ns - cursor)
+        yield day, piece
+        remaining -= piece
+        cursor = midnight_ns
+        day = next_day
+
+
+def store_path() -> Path:
+    """Return the default history database path."""
+    return data_dir() / "history.sqlite3"
+
+
+class RunStore:
+    """SQLite-backed, indexed history of stopwatch runs across projects.
+
+    The database runs in WAL mode so `tm log` can read while a stopwatch is
+    writing. A run appended more than `flush_interval` seconds after the last
+    write is written straight away, so other processes see it; runs appended
+    in quicker succession are buffered and written `batch_size` at a time in
+    a single transaction. The journal covers anything still buffered if the
+    process dies.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        *,
+        batch_size: int = 32,
+        flush_interval: float = 1.0,
+    ) -> None:
+        self.path = Path(path) if path is not None else store_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._migrate()
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._last_flush = float("-inf")
+        self._pending: list[tuple[str, int, int, int]] = []
+
+    def append(self, project: str, run: StopwatchRun) -> None:
+        """Queue `run` for `project`.
+
+        The queue is written once the batch is full, or at once if nothing
+        was written in the last `flush_interval` seconds.
+        """
+        self._pending.append(
+            (project, run.start_ns, run.end_ns or run.start_ns, run.duration_ns)
+        )
+        if (
+            len(self._pending) >= self._batch_size
+            or monotonic() - self._last_flush >= self._flush_interval
+        ):
+            self.flush()
+
+    def import_journal(self, project: str, path: str | Path) -> int:
+        """Copy runs from `project`'s journal that aren't stored yet.
+
+        Catches the store up after a crash lost a buffered batch. Only the
+        journal's tail is read.
+        """
+        imported = 0
+        for run in read_journal(path, after_ns=self.last_start_ns(project)):
+            self.append(project, run)
+            imported += 1
+        self.flush()
+        return imported
+
+    def flush(self) -> None:
+        """Write all queued runs in one transaction."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        self._last_flush = monotonic()
+        with self._transaction():
+            for row in pending:
+                # Runs already stored (e.g. re-imported from the journal) are
+                # ignored and must not be counted in the rollups twice.
+                if self._conn.execute(_INSERT_RUN, row).rowcount:
+                    self._add_to_rollups(*row)
+
+    def last_start_ns(self, project: str) -> int | None:
+        """Return the start of the newest stored run for `project`."""
+        row = self._conn.execute(
+            "SELECT MAX(start_ns) FROM runs WHERE project = ?", (project,)
+        ).fetchone()
+        return row[0]
+
+    def query(
+        self,
+        *,
+        project: str | None = None,
+        since_ns: int | None = None,
+        until_ns: int | None = None,
+        min_duration_ns: int | None = None,
+        max_duration_ns: int | None = None,
+        limit: int | None = None,
+        newest_first: bool = True,
+    ) -> Iterator[tuple[str, StopwatchRun]]:
+        """Stream matching `(project, run)` pairs through a cursor."""
+        clauses: list[str] = []
+        params: list[object] = []
+        if project is not None:
+            clauses.append("project = ?")
+            params.append(project)
+        if since_ns is not None:
+            clauses.append("start_ns >= ?")
+            params.append(since_ns)
+        if until_ns is not None:
+            clauses.append("start_ns < ?")
+            params.append(until_ns)
+        if min_duration_ns is not None:
+            clauses.append("duration_ns >= ?")
+            params.append(min_duration_ns)
+        if max_duration_ns is not None:
+            clauses.append("duration_ns <= ?")
+            params.append(max_duration_ns)
+
+        sql = "SELECT project, start_ns, end_ns, duration_ns FROM runs"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY start_ns DESC" if newest_first else " ORDER BY start_ns"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        cursor = self._conn.execute(sql, params)
+        try:
+            while rows := cursor.fetchmany(_FETCH_SIZE):
+                for project_name, start_ns, end_ns, duration_ns in rows:
+                    yield project_name, StopwatchRun(
+                        start_ns=start_ns, end_ns=end_ns, duration_ns=duration_ns
+                    )
+        finally:
+            cursor.close()
+
+    def daily_totals(
+        self,
+        first_day: date,
+        last_day: date,
+        *,
+        project: str | None = None,
+    ) -> Iterator[tuple[str, date, int, int]]:
+        """Yield `(project, day, duration_ns, runs)` for days in the range.
+
+        Reads only the rollup table, so the cost is O(days), not O(runs). A
+        run is counted on the day it started; its time is split across days.
+        """
+        sql = (
+            "SELECT project, day, duration_ns, runs FROM daily_totals "
+            "WHERE day BETWEEN ? AND ?"
+        )
+        params: list[object] = [first_day.isoformat(), last_day.isoformat()]
+        if project is not None:
+            sql += " AND project = ?"
+            params.append(project)
+        sql += " ORDER BY day, project"
+
+        for project_name, day, duration_ns, runs in self._conn.execute(sql, params):
+            yield project_name, date.fromisoformat(day), duration_ns, runs
+
+    def close(self) -> None:
+        self.flush()
+        self._conn.close()
+
+    def __enter__(self) -> "RunStore":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _add_to_rollups(
+        self, project: str, start_ns: int, end_ns: int, duration_ns: int
+    ) -> None:
+        first = True
+        for day, piece_ns in split_by_local_day(start_ns, end_ns, duration_ns):
+            self._conn.execute(
+                _ADD_TO_DAY, (project, day.isoformat(), piece_ns, 1 if first else 0)
+            )
+            first = False
+
+    def _migrate(self) -> None:
+        """Rebuild derived tables for databases created by older versions."""
+        (version,) = self._conn.execute("PRAGMA user_version").fetchone()
+        if version >= _SCHEMA_VERSION:
+            return
+
+        with self._transaction():
+            self._conn.execute("DELETE FROM daily_totals")
+            rows = self._conn.execute(
+                "SELECT project, start_ns, end_ns, duration_ns FROM runs"
+            )
+            for row in rows:
+                self._add_to_rollups(*row)
+            self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    @contextmanager
+    def _transaction(self):
+        self._conn.execute("BEGIN")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
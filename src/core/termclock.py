@@ -1,77 +1,230 @@
-from time import monotonic
+import threading
+from time import monotonic, monotonic_ns, time_ns
 from dataclasses import dataclass, field
-from typing import Optional
-from datetime import datetime
+from typing import Callable, Optional
 
+from core.events import bus as _bus
+from core.events import (
+    CountdownFinished,
+    CountdownPaused,
+    CountdownResumed,
+    CountdownStarted,
+    CountdownTick,
+    StopwatchLap,
+    StopwatchReset,
+    StopwatchStarted,
+    StopwatchStopped,
+)
+from core.stats import LapStats
+from core.runlog import NS_PER_SECOND, RunLog, StopwatchRun  # noqa: F401
+
+# Wake slightly after a displayed-second boundary rather than just before it,
+# so the redraw that follows always sees the new value.
+_BOUNDARY_SLACK = 0.005
 
-@dataclass
-class StopwatchRun:
-    """Represents a single stopwatch run."""
 
-    start_time: datetime
-    end_time: datetime | None = None
-    duration: float = 0.0
+def until_next_second(seconds: float, *, counting_down: bool = False) -> float:
+    """Return how long until the whole-second part of `seconds` changes."""
+    fraction = seconds % 1.0
+    if counting_down:
+        return (fraction or 1.0) + _BOUNDARY_SLACK
+    return (1.0 - fraction) + _BOUNDARY_SLACK
 
 
 @dataclass
 class Stopwatch:
-    """Core logic for a stopwatch."""
+    """Core logic for a stopwatch.
+
+    Elapsed time is accumulated in integer nanoseconds read from `clock`
+    (`time.monotonic_ns` by default; `time.perf_counter_ns` also works), so
+    thousands of start/stop cycles add no rounding error. The wall clock is
+    read once per run, as an integer, to anchor the run's start time.
+
+    `name` labels the stopwatch in the events it reports (see `core.events`).
+    """
 
-    _start_time: Optional[float] = None
-    _accumulated_time: float = 0.0
+    clock: Callable[[], int] = field(default=monotonic_ns, repr=False)
+    wall_clock: Callable[[], int] = field(default=time_ns, repr=False)
+    name: str = ""
+    _start_ns: Optional[int] = None
+    _accumulated_ns: int = 0
     _running: bool = False
-    _runs: list[StopwatchRun] = field(default_factory=list)
-    _current_run_start: datetime | None = None
+    _runs: RunLog = field(default_factory=RunLog)
+    _run_start_wall_ns: int | None = None
+    _lap_start_ns: int = 0
+    _lap_stats: LapStats = field(default_factory=LapStats)
+    _run_listeners: list[Callable[[StopwatchRun], None]] = field(
+        default_factory=list, repr=False
+    )
+    _state_listeners: list[Callable[["Stopwatch"], None]] = field(
+        default_factory=list, repr=False
+    )
+    _lap_listeners: list[Callable[["Stopwatch"], None]] = field(
+        default_factory=list, repr=False
+    )
 
     @property
     def is_running(self) -> bool:
         return self._running
 
+    @property
+    def elapsed_ns(self) -> int:
+        """Return the total elapsed time in integer nanoseconds."""
+        if self._running:
+            return self._accumulated_ns + (self.clock() - self._start_ns)
+        return self._accumulated_ns
+
     @property
     def elapsed(self) -> float:
         """Return the total elapsed time in seconds."""
-        if self._running:
-            return self._accumulated_time + (monotonic() - self._start_time)
-        return self._accumulated_time
+        return self.elapsed_ns / NS_PER_SECOND
 
     @property
-    def runs(self) -> list[StopwatchRun]:
-        """Return all completed and current runs."""
+    def accumulated_ns(self) -> int:
+        """Return the time from completed runs only, in nanoseconds."""
+        return self._accumulated_ns
+
+    @property
+    def run_started_at_ns(self) -> int | None:
+        """Return when the current run started (epoch ns), or None if stopped."""
+        return self._run_start_wall_ns if self._running else None
+
+    @property
+    def runs(self) -> RunLog:
+        """Return all completed runs as a sequence of `StopwatchRun` views."""
         return self._runs
 
+    def add_run_listener(self, listener: Callable[[StopwatchRun], None]) -> None:
+        """Call `listener` with each run as soon as it completes."""
+        self._run_listeners.append(listener)
+
+    def add_state_listener(self, listener: Callable[["Stopwatch"], None]) -> None:
+        """Call `listener` after every start, stop and reset."""
+        self._state_listeners.append(listener)
+
+    def add_lap_listener(self, listener: Callable[["Stopwatch"], None]) -> None:
+        """Call `listener` after every lap."""
+        self._lap_listeners.append(listener)
+
+    def _notify_state(self) -> None:
+        for listener in self._state_listeners:
+            listener(self)
+
+    def restore(self, accumulated_ns: int, running_since_ns: int | None = None):
+        """Rebuild state saved by another process.
+
+        `running_since_ns` is the wall-clock start (epoch ns) of a run that
+        was still going; the time since then, including time nobody was
+        watching, counts towards that run.
+        """
+        self._accumulated_ns = accumulated_ns
+        self._running = running_since_ns is not None
+        self._run_start_wall_ns = running_since_ns
+        self._start_ns = None
+        if running_since_ns is not None:
+            detached_ns = max(0, self.wall_clock() - running_since_ns)
+            self._start_ns = self.clock() - detached_ns
+        self._notify_state()
+
+    @property
+    def lap_stats(self) -> LapStats:
+        """Statistics over all recorded laps."""
+        return self._lap_stats
+
+    @property
+    def current_lap(self) -> float:
+        """Return the time since the last lap (or since the start), in seconds."""
+        return (self.elapsed_ns - self._lap_start_ns) / NS_PER_SECOND
+
+    def lap(self) -> float | None:
+        """Close the current lap and return its duration in seconds.
+
+        Laps measure stopwatch time, so paused periods don't count. Does
+        nothing (and returns None) while the stopwatch is stopped.
+        """
+        if not self._running:
+            return None
+
+        now_ns = self.elapsed_ns
+        lap_seconds = (now_ns - self._lap_start_ns) / NS_PER_SECOND
+        self._lap_start_ns = now_ns
+        self._lap_stats.add(lap_seconds)
+        if _bus.active:
+            _bus.emit(
+                StopwatchLap(
+                    self.name,
+                    self.wall_clock(),
+                    int(lap_seconds * NS_PER_SECOND),
+                    self._lap_stats.count,
+                )
+            )
+        for listener in self._lap_listeners:
+            listener(self)
+        return lap_seconds
+
     def start(self):
         if not self._running:
-            self._start_time = monotonic()
+            self._start_ns = self.clock()
             self._running = True
-            self._current_run_start = datetime.now().astimezone()
+            self._run_start_wall_ns = self.wall_clock()
+            if _bus.active:
+                _bus.emit(
+                    StopwatchStarted(
+                        self.name, self._run_start_wall_ns, self._accumulated_ns
+                    )
+                )
+            self._notify_state()
 
     def stop(self):
         if self._running:
-            elapsed_in_run = monotonic() - self._start_time
-            self._accumulated_time += elapsed_in_run
-            self._start_time = None
+            elapsed_in_run = self.clock() - self._start_ns
+            self._accumulated_ns += elapsed_in_run
+            self._start_ns = None
             self._running = False
 
             # Record the completed run
-            if self._current_run_start:
+            if self._run_start_wall_ns is not None:
+                start_wall_ns = self._run_start_wall_ns
+                self._run_start_wall_ns = None
                 self._runs.append(
-                    StopwatchRun(
-                        start_time=self._current_run_start,
-                        end_time=datetime.now().astimezone(),
-                        duration=elapsed_in_run,
+                    start_wall_ns, start_wall_ns + elapsed_in_run, elapsed_in_run
+                )
+                if self._run_listeners:
+                    run = StopwatchRun(
+                        start_ns=start_wall_ns,
+                        end_ns=start_wall_ns + elapsed_in_run,
+                        duration_ns=elapsed_in_run,
+                    )
+                    for listener in self._run_listeners:
+                        listener(run)
+
+            if _bus.active:
+                _bus.emit(
+                    StopwatchStopped(
+                        self.name,
+                        self.wall_clock(),
+                        self._accumulated_ns,
+                        elapsed_in_run,
                     )
                 )
-                self._current_run_start = None
+            self._notify_state()
 
     def reset(self):
         # If currently running, stop and record the run first
         if self._running:
             self.stop()
 
+        if _bus.active:
+            _bus.emit(
+                StopwatchReset(self.name, self.wall_clock(), self._accumulated_ns)
+            )
         self._running = False
-        self._accumulated_time = 0.0
-        self._start_time = None
-        self._current_run_start = None
+        self._accumulated_ns = 0
+        self._start_ns = None
+        self._run_start_wall_ns = None
+        self._lap_start_ns = 0
+        self._lap_stats = LapStats()
+        self._notify_state()
 
     def toggle(self):
         if self._running:
@@ -82,20 +235,48 @@ class Stopwatch:
 
 @dataclass
 class Countdown:
-    """Core logic for a countdown timer."""
+    """Core logic for a countdown timer.
+
+    Time is measured against an absolute monotonic deadline, so `time_left` is
+    exact whether or not anyone calls `tick()`. Pausing stores the remaining
+    time and resuming sets a new deadline from it.
+
+    `name` labels the countdown in the events it reports (see `core.events`).
+    """
 
     initial_seconds: int
-    _time_left: float = field(init=False)
-    _last_tick: Optional[float] = field(init=False, default=None)
+    name: str = ""
+    _deadline: Optional[float] = field(init=False, default=None)
+    _remaining: float = field(init=False)
     _running: bool = field(init=False, default=True)
+    _changed: threading.Condition = field(
+        init=False, repr=False, compare=False, default_factory=threading.Condition
+    )
+    # wait_finished() futures, each with its pending expiry handle (if any).
+    _async_waiters: dict = field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+    _state_listeners: list[Callable[["Countdown"], None]] = field(
+        init=False, repr=False, compare=False, default_factory=list
+    )
+    _finish_reported: bool = field(init=False, repr=False, compare=False, default=False)
 
     def __post_init__(self):
-        self._time_left = float(self.initial_seconds)
-        self._last_tick = monotonic()
+        self._remaining = float(self.initial_seconds)
+        self._deadline = monotonic() + self._remaining
+        if _bus.active:
+            _bus.emit(CountdownStarted(self.name, time_ns(), self._remaining_ns()))
 
     @property
     def time_left(self) -> float:
-        return max(0.0, self._time_left)
+        if self._running:
+            return max(0.0, self._deadline - monotonic())
+        return max(0.0, self._remaining)
+
+    @property
+    def deadline(self) -> float | None:
+        """Monotonic time at which the countdown expires, or None while paused."""
+        return self._deadline if self._running else None
 
     @property
     def is_running(self) -> bool:
@@ -103,30 +284,153 @@ class Countdown:
 
     @property
     def is_finished(self) -> bool:
-        return self._time_left <= 0
+        return self.time_left <= 0
+
+    def check_finished(self) -> bool:
+        """Return `is_finished`, reporting the finish the first time it's seen.
+
+        The first call that finds the countdown finished emits
+        `countdown.finished` (if any sink is attached). `tick()`, `wait()`,
+        `wait_finished()` and `TimerScheduler.pop_expired()` call it; loops
+        that watch a countdown some other way should too.
+        """
+        if self.time_left > 0:
+            return False
+        if not self._finish_reported:
+            self._finish_reported = True
+            if _bus.active:
+                _bus.emit(self.finished_event())
+        return True
+
+    def finished_event(self) -> CountdownFinished:
+        """Build the `countdown.finished` event, stamped at the deadline.
+
+        `late_ns` is how long after the deadline this is called.
+        """
+        late_ns = 0
+        if self._deadline is not None:
+            late_ns = max(0, int((monotonic() - self._deadline) * NS_PER_SECOND))
+        return CountdownFinished(self.name, time_ns() - late_ns, late_ns)
 
     def tick(self):
-        """Update the timer based on elapsed real time."""
-        if self._running and self._time_left > 0:
-            now = monotonic()
-            if self._last_tick:
-                delta = now - self._last_tick
-                self._time_left -= delta
-            self._last_tick = now
-        else:
-            self._last_tick = monotonic()
+        """Report progress (and the finish, once); time left needs no ticking."""
+        if _bus.active:
+            _bus.emit(CountdownTick(self.name, time_ns(), self._remaining_ns()))
+        self.check_finished()
+
+    def _remaining_ns(self) -> int:
+        return int(self.time_left * NS_PER_SECOND)
 
     def pause(self):
-        self._running = False
-        self._last_tick = None
+        if self._running:
+            self._remaining = self.time_left
+            self._deadline = None
+            self._running = False
+            if _bus.active:
+                _bus.emit(CountdownPaused(self.name, time_ns(), self._remaining_ns()))
+            self._notify()
 
     def resume(self):
         if not self._running:
+            self._deadline = monotonic() + self._remaining
             self._running = True
-            self._last_tick = monotonic()
+            if _bus.active:
+                _bus.emit(CountdownResumed(self.name, time_ns(), self._remaining_ns()))
+            self._notify()
 
     def toggle(self):
         if self._running:
             self.pause()
         else:
             self.resume()
+
+    def add_state_listener(self, listener: Callable[["Countdown"], None]) -> None:
+        """Call `listener` after every pause and resume."""
+        self._state_listeners.append(listener)
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until the countdown finishes or `timeout` seconds pass.
+
+        Follows pauses and resumes made from other threads. Returns True if the
+        countdown finished.
+        """
+        give_up_at = None if timeout is None else monotonic() + timeout
+        with self._changed:
+            while not self.check_finished():
+                sleep_for = self.time_left if self._running else None
+                if give_up_at is not None:
+                    budget = give_up_at - monotonic()
+                    if budget <= 0:
+                        return False
+                    sleep_for = budget if sleep_for is None else min(sleep_for, budget)
+                self._changed.wait(sleep_for)
+        return True
+
+    def wait_finished(self):
+        """Return a future that resolves once the countdown finishes.
+
+        Call it from a running event loop. The future follows pauses and
+        resumes made from any thread: while the countdown runs it holds one
+        timer handle on its loop, re-armed only when the countdown is paused
+        or resumed. Cancel the future (or the task awaiting it) to stop
+        waiting.
+        """
+        import asyncio
+
+        waiter = asyncio.get_running_loop().create_future()
+        if self.check_finished():
+            waiter.set_result(None)
+            return waiter
+        self._async_waiters[waiter] = None
+        waiter.add_done_callback(self._forget_waiter)
+        self._arm(waiter)
+        return waiter
+
+    def _arm(self, waiter) -> None:
+        """Reschedule `waiter`'s expiry for the current deadline (on its loop)."""
+        if waiter.done():
+            return
+        expiry = self._async_waiters.get(waiter)
+        if expiry is not None:
+            expiry.cancel()
+            expiry = None
+        if self._running:
+            expiry = waiter.get_loop().call_later(self.time_left, self._expire, waiter)
+        self._async_waiters[waiter] = expiry
+
+    def _expire(self, waiter) -> None:
+        if waiter.done():
+            return
+        self._async_waiters[waiter] = None
+        # The loop may run a handle up to one clock tick early.
+        if self.check_finished():
+            waiter.set_result(None)
+        else:
+            self._arm(waiter)
+
+    def _forget_waiter(self, waiter) -> None:
+        expiry = self._async_waiters.pop(waiter, None)
+        if expiry is not None:
+            expiry.cancel()
+
+    def _notify(self) -> None:
+        """Wake `wait()` callers, re-arm `wait_finished()` futures, call listeners."""
+        with self._changed:
+            self._changed.notify_all()
+
+        if self._async_waiters:
+            import asyncio
+
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:  # not on an event loop's thread
+                running = None
+            for waiter in list(self._async_waiters):
+                loop = waiter.get_loop()
+                if loop is running:
+                    self._arm(waiter)
+                else:
+                    loop.call_soon_threadsafe(self._arm, waiter)
+
+        for listener in self._state_listeners:
+            listener(self)
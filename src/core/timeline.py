@@ -0,0 +1,160 @@
+"""The run timeline shown by `format_stopwatch_timeline` and the exit summary.
+
+`timeline_lines()` is a generator, and however many runs there are it yields
+a bounded number of lines:
+
+- up to `max_runs` runs get a line each, with a bar proportional to the run's
+  duration (the longest run gets the full `BAR_WIDTH`);
+- beyond that, runs are summed per local hour (when they span two days or
+  less) or per local day, one line per bucket, and only the latest
+  `page_size` buckets are shown.
+
+Bucketing streams over the runs once and keeps only the buckets shown, so
+memory stays flat for a million runs. Local times come from the UTC offset,
+which is looked up once per UTC day (per quarter hour on days with a DST
+change) instead of converting a `datetime` for every run.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from collections.abc import Iterator, Sequence
+
+from core.formatting import format_duration_words
+from core.runlog import NS_PER_SECOND, RunLog
+
+MAX_RUNS = 50
+PAGE_SIZE = 24
+BAR_WIDTH = 15
+BAR = "▬"
+
+_DAY = 86_400
+_HOUR = 3_600
+# UTC offsets change on (local) whole or half hours, so on UTC quarter hours.
+_QUARTER_HOUR = 900
+
+
+class _UtcOffsets:
+    """Local UTC offset (seconds) of an epoch time, cached per UTC day."""
+
+    def __init__(self) -> None:
+        self._days: dict[int, int | None] = {}
+        self._quarters: dict[int, int] = {}
+
+    def __call__(self, seconds: int) -> int:
+        day = seconds // _DAY
+        try:
+            offset = self._days[day]
+        except KeyError:
+            first = time.localtime(day * _DAY).tm_gmtoff
+            last = time.localtime(day * _DAY + _DAY - 1).tm_gmtoff
+            offset = self._days[day] = first if first == last else None
+        if offset is not None:
+            return offset
+
+        quarter = seconds // _QUARTER_HOUR
+        try:
+            return self._quarters[quarter]
+        except KeyError:
+            offset = time.localtime(quarter * _QUARTER_HOUR).tm_gmtoff
+            self._quarters[quarter] = offset
+            return offset
+
+
+def _spans(runs: Sequence) -> Iterator[tuple[int, int]]:
+    if isinstance(runs, RunLog):
+        return runs.spans()
+    return ((run.start_ns, run.duration_ns) for run in runs)
+
+
+def _bar(value: int, peak: int, markup: bool) -> str:
+    length = max(1, round(BAR_WIDTH * value / peak)) if peak else 1
+    bar = f"{BAR * length:<{BAR_WIDTH}}"
+    return f"[green]{bar}[/green]" if markup else bar
+
+
+def _dim(text: str, markup: bool) -> str:
+    return f"[dim]{text}[/dim]" if markup else text
+
+
+def timeline_lines(
+    runs: Sequence,
+    *,
+    markup: bool = False,
+    max_runs: int = MAX_RUNS,
+    page_size: int = PAGE_SIZE,
+) -> Iterator[str]:
+    """Yield the timeline of `runs` (oldest first) line by line.
+
+    With `markup`, bars and durations carry Rich markup.
+    """
+    if not runs:
+        yield "No runs recorded."
+        return
+
+    now = time.localtime()
+    yield f"  Local time: {time.strftime('%H:%M:%S', now)} {now.tm_zone or 'Local'}"
+    yield ""
+    offsets = _UtcOffsets()
+    if len(runs) <= max_runs:
+        yield from _run_lines(list(runs), offsets, markup)
+    else:
+        yield from _bucket_lines(runs, offsets, markup, max(1, page_size))
+
+
+def _run_lines(runs: list, offsets: _UtcOffsets, markup: bool) -> Iterator[str]:
+    def clock(ns: int) -> str:
+        seconds = ns // NS_PER_SECOND
+        minute = (seconds + offsets(seconds)) // 60 % (24 * 60)
+        return f"{minute // 60:02}:{minute % 60:02}"
+
+    peak = max(run.duration_ns for run in runs)
+    for i, run in enumerate(runs, 1):
+        end = clock(run.end_ns) if run.end_ns is not None else "..."
+        duration = _dim(f"({format_duration_words(run.duration)})", markup)
+        bar = _bar(run.duration_ns, peak, markup)
+        yield f"  Session #{i}\t{clock(run.start_ns)} {bar} {end}  {duration}"
+        if i < len(runs):
+            yield ""
+
+
+def _bucket_lines(
+    runs: Sequence, offsets: _UtcOffsets, markup: bool, page_size: int
+) -> Iterator[str]:
+    first, last = runs[0].start_ns, runs[-1].start_ns
+    by_hour = last - first <= 2 * _DAY * NS_PER_SECOND
+    unit = _HOUR if by_hour else _DAY
+    unit_name = "hour" if by_hour else "day"
+
+    # One pass over the runs, keeping [key, runs, total_ns] for the latest
+    # `page_size` buckets only.
+    shown: deque[list[int]] = deque(maxlen=page_size)
+    buckets = 0
+    current = None
+    for start_ns, duration_ns in _spans(runs):
+        seconds = start_ns // NS_PER_SECOND
+        key = (seconds + offsets(seconds)) // unit
+        if current is None or key != current[0]:
+            current = [key, 0, 0]
+            shown.append(current)
+            buckets += 1
+        current[1] += 1
+        current[2] += duration_ns
+
+    if buckets > page_size:
+        first_shown = buckets - len(shown)
+        note = (
+            f"  {unit_name.capitalize()}s {first_shown + 1}-{buckets}"
+            f" of {buckets} ({len(runs)} runs)"
+        )
+        yield _dim(note, markup)
+        yield ""
+
+    label_format = "%Y-%m-%d %H:00" if by_hour else "%Y-%m-%d"
+    peak = max(total_ns for _key, _count, total_ns in shown)
+    for key, count, total_ns in shown:
+        label = time.strftime(label_format, time.gmtime(key * unit))
+        runs_text = f"{count} run" if count == 1 else f"{count} runs"
+        duration = _dim(f"({format_duration_words(total_ns / NS_PER_SECOND)})", markup)
+        yield f"  {label}\t{_bar(total_ns, peak, markup)} {runs_text:>9}  {duration}"
@@ -0,0 +1,28 @@
+"""Process entry point for `tm` / `time-manager`.
+
+Daemon client commands (`tm start/stop/reset/status`) must answer in a few
+milliseconds, so they are dispatched here without importing Typer, Rich or
+Textual. Everything else goes to the Typer app in `app`.
+"""
+
+from __future__ import annotations
+
+import sys
+
+_CLIENT_COMMANDS = frozenset({"start", "stop", "reset", "status"})
+
+
+def main() -> None:
+    argv = sys.argv[1:]
+    if argv and argv[0] in _CLIENT_COMMANDS and not {"-h", "--help"} & set(argv):
+        from cli.client import main as client_main
+
+        raise SystemExit(client_main(argv))
+
+    from app import main as app_main
+
+    app_main()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,22 @@
 # Timer TUI Components
-from .stopwatch import StopwatchTui
-from .countdown import CountdownTui
+#
+# Exports are resolved lazily so that importing the package doesn't pull in
+# Textual unless a TUI is actually started.
 
-__all__ = ["StopwatchTui", "CountdownTui"]
+__all__ = ["StopwatchTui", "CountdownTui", "DashboardTui"]
+
+
+def __getattr__(name: str):
+    if name == "StopwatchTui":
+        from .stopwatch import StopwatchTui
+
+        return StopwatchTui
+    if name == "CountdownTui":
+        from .countdown import CountdownTui
+
+        return CountdownTui
+    if name == "DashboardTui":
+        from .dashboard import DashboardTui
+
+        return DashboardTui
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,13 +1,21 @@
 from textual.app import App, ComposeResult
 from textual.containers import Container
+from textual.timer import Timer
 from textual.widgets import Digits, Footer, Header, Static
-from textual.reactive import reactive
-from core.formatting import format_time
-from core.termclock import Countdown
+from core.formatting import format_seconds
+from core.termclock import Countdown, until_next_second
+
+# Below this many seconds left, a running countdown is shown in red.
+URGENT_SECONDS = 10
 
 
 class CountdownTui(App):
-    """A countdown timer app."""
+    """A countdown timer app.
+
+    Like `StopwatchTui`, it wakes once per displayed second (the last wake-up
+    lands on the deadline itself), not at all while paused, and only touches
+    the widgets whose text or classes change.
+    """
 
     TITLE = "Time Manager"
     SUB_TITLE = "Countdown"
@@ -19,12 +27,17 @@ class CountdownTui(App):
         ("space", "toggle_pause", "Pause/Resume"),
     ]
 
-    time_left = reactive(0.0)
-
-    def __init__(self, seconds: int) -> None:
+    def __init__(self, seconds: int, countdown: Countdown | None = None) -> None:
         super().__init__()
-        self.countdown = Countdown(seconds)
+        self.countdown = countdown or Countdown(seconds)
         self._finished_announced = False
+        self._timer: Timer | None = None
+        self._shown_time: str | None = None
+        self._shown_state: tuple[str, bool] | None = None
+        # How many times the time was checked and the digits changed (for
+        # benchmarks).
+        self.ticks = 0
+        self.digit_updates = 0
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
@@ -38,57 +51,55 @@ class CountdownTui(App):
         yield Footer()
 
     def on_mount(self) -> None:
-        self.time_left = self.countdown.time_left
-        self.update_display()
-        self._sync_status()
-        self.set_interval(0.1, self.tick)
+        self._digits = self.query_one("#countdown", Digits)
+        self._status = self.query_one("#status", Static)
+        self.tick()
 
     def tick(self) -> None:
-        self.countdown.tick()
-        self.time_left = self.countdown.time_left
-
-        if self.countdown.is_finished and not self._finished_announced:
-            self._finished_announced = True
-            self.notify("Time's up!", severity="error", timeout=10)
-            self.bell()
-            self.query_one("#status", Static).update("Time's Up!")
-            self.query_one("#status", Static).set_class(True, "danger")
-
-        self.update_display()
-        self._sync_status()
-
-    def update_display(self) -> None:
-        time_str = format_time(self.time_left, show_centiseconds=False)
-        digits = self.query_one("#countdown", Digits)
-        digits.update(time_str)
-
-        # Subtle urgency cue while still respecting the palette.
-        is_finished = self.countdown.is_finished
-        is_paused = (not self.countdown.is_running) and (not is_finished)
-        is_urgent = (not is_paused) and (is_finished or self.time_left < 10)
-
-        digits.set_class(is_paused, "muted")
-        digits.set_class(is_urgent, "danger")
+        self.ticks += 1
+        countdown = self.countdown
+        countdown.tick()
+        time_left = countdown.time_left
+
+        if countdown.is_finished:
+            state = "finished"
+            if not self._finished_announced:
+                self._finished_announced = True
+                self.notify("Time's up!", severity="error", timeout=10)
+                self.bell()
+        else:
+            state = "running" if countdown.is_running else "paused"
+
+        time_str = format_seconds(time_left)
+        if time_str != self._shown_time:
+            self._shown_time = time_str
+            self._digits.update(time_str)
+            self.digit_updates += 1
+        urgent = state == "finished" or (
+            state == "running" and time_left < URGENT_SECONDS
+        )
+        if (state, urgent) != self._shown_state:
+            self._shown_state = state, urgent
+            self._sync_status(state, urgent)
+
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+        if state == "running":
+            delay = until_next_second(time_left, counting_down=True)
+            self._timer = self.set_timer(delay, self.tick)
 
     def action_toggle_pause(self) -> None:
         self.countdown.toggle()
-        self._sync_status()
-
-    def _sync_status(self) -> None:
-        status_widget = self.query_one("#status", Static)
-
-        is_finished = self.countdown.is_finished
-        if is_finished:
-            status_widget.update("Time's Up!")
-            status_widget.set_class(True, "danger")
-            status_widget.set_class(False, "running", "paused")
-            return
-
-        if self.countdown.is_running:
-            status_widget.update("Running")
-            status_widget.set_class(True, "running")
-            status_widget.set_class(False, "paused", "danger")
-        else:
-            status_widget.update("Paused")
-            status_widget.set_class(True, "paused")
-            status_widget.set_class(False, "running", "danger")
+        self.tick()
+
+    def _sync_status(self, state: str, urgent: bool) -> None:
+        # Subtle urgency cue while still respecting the palette.
+        self._digits.set_class(state == "paused", "muted")
+        self._digits.set_class(urgent, "danger")
+
+        status = {"running": "Running", "paused": "Paused", "finished": "Time's Up!"}
+        self._status.update(status[state])
+        self._status.set_class(state == "running", "running")
+        self._status.set_class(state == "paused", "paused")
+        self._status.set_class(state == "finished", "danger")
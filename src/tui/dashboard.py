@@ -0,0 +1,263 @@
+from collections.abc import Sequence
+from time import monotonic
+
+from rich.segment import Segment
+from textual.app import App, ComposeResult
+from textual.binding import Binding
+from textual.geometry import Region, Size
+from textual.reactive import reactive
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+from textual.timer import Timer
+from textual.widgets import Footer, Header
+
+from core.formatting import format_hms
+from core.scheduler import TimerScheduler
+from core.termclock import Stopwatch, until_next_second
+
+# After the next row's displayed second changes, wait a little longer to
+# catch the other rows changing within the same few frames: rows tick at
+# random phases, and one refresh per row per second would wake the app
+# dozens of times a second.
+_COALESCE = 0.045
+NAME_WIDTH = 24
+
+
+class _Row:
+    """One timer in the list, and what its line last showed."""
+
+    __slots__ = ("name", "stopwatch", "countdown", "shown")
+
+    def __init__(self, name: str, stopwatch=None, countdown=None) -> None:
+        self.name = name
+        self.stopwatch = stopwatch
+        self.countdown = countdown
+        self.shown = None
+
+    def view(self) -> tuple:
+        """Everything the row's line shows: (state, whole seconds, laps)."""
+        if self.stopwatch is not None:
+            stopwatch = self.stopwatch
+            state = "running" if stopwatch.is_running else "paused"
+            return state, int(stopwatch.elapsed), stopwatch.lap_stats.count
+        countdown = self.countdown
+        left = countdown.time_left
+        if left <= 0:
+            return "finished", 0, 0
+        return ("running" if countdown.is_running else "paused"), int(left), 0
+
+    def until_change(self) -> float | None:
+        """Seconds until just after the displayed second changes (None if paused)."""
+        if self.stopwatch is not None:
+            if not self.stopwatch.is_running:
+                return None
+            return until_next_second(self.stopwatch.elapsed)
+        countdown = self.countdown
+        if not countdown.is_running or countdown.is_finished:
+            return None
+        return until_next_second(countdown.time_left, counting_down=True)
+
+
+class TimerList(ScrollView, can_focus=True):
+    """Virtualized list of timers, one line each.
+
+    Only the lines on screen are ever built (`render_line`), and one shared
+    timer drives the whole list: it wakes shortly after the next visible
+    row's displayed second changes (or the next countdown anywhere
+    finishes), refreshes exactly the visible rows whose line changed by then
+    and goes back to sleep. With everything paused, nothing runs at all.
+    """
+
+    COMPONENT_CLASSES = {
+        "timer-list--cursor",
+        "timer-list--running",
+        "timer-list--paused",
+        "timer-list--finished",
+    }
+
+    BINDINGS = [
+        Binding("up", "cursor(-1)", "Up", show=False),
+        Binding("down", "cursor(1)", "Down", show=False),
+        Binding("pageup", "page(-1)", "Page up", show=False),
+        Binding("pagedown", "page(1)", "Page down", show=False),
+        Binding("home", "jump(0)", "First", show=False),
+        Binding("end", "jump(-1)", "Last", show=False),
+        ("space", "toggle", "Start/Stop"),
+        ("l", "lap", "Lap"),
+        ("r", "reset", "Reset"),
+    ]
+
+    cursor = reactive(0, always_update=True)
+
+    def __init__(
+        self,
+        stopwatches: Sequence[Stopwatch] = (),
+        countdowns: Sequence[tuple[str, float]] = (),
+        *,
+        id: str | None = None,
+    ) -> None:
+        super().__init__(id=id)
+        self.scheduler = TimerScheduler()
+        self.rows = [
+            _Row(stopwatch.name, stopwatch=stopwatch) for stopwatch in stopwatches
+        ]
+        self.rows += [
+            _Row(name, countdown=self.scheduler.add(name, seconds))
+            for name, seconds in countdowns
+        ]
+        self.virtual_size = Size(0, len(self.rows))
+        self._timer: Timer | None = None
+        # How many lines were built and refresh passes made (for benchmarks).
+        self.lines_rendered = 0
+        self.refreshes = 0
+
+    def on_mount(self) -> None:
+        self._schedule()
+
+    # Rendering
+
+    def render_line(self, y: int) -> Strip:
+        scroll_x, scroll_y = self.scroll_offset
+        index = scroll_y + y
+        width = self.size.width
+        if index >= len(self.rows):
+            return Strip.blank(width, self.rich_style)
+
+        row = self.rows[index]
+        state, seconds, laps = row.shown = row.view()
+        self.lines_rendered += 1
+        if row.stopwatch is not None:
+            kind = "stopwatch"
+            extra = f"{laps} lap{'' if laps == 1 else 's'}" if laps else ""
+        else:
+            kind = "countdown"
+            extra = ""
+        text = (
+            f" {row.name[:NAME_WIDTH]:<{NAME_WIDTH}}  {kind:<9}  "
+            f"{format_hms(seconds):>9}  {state:<8}  {extra}"
+        )
+        style = self.get_component_rich_style(f"timer-list--{state}")
+        if index == self.cursor:
+            style += self.get_component_rich_style("timer-list--cursor")
+        strip = Strip([Segment(text, style)])
+        return strip.crop_extend(scroll_x, scroll_x + width, style)
+
+    def _visible(self) -> range:
+        top = self.scroll_offset.y
+        return range(top, min(len(self.rows), top + self.size.height))
+
+    # The shared refresh
+
+    def _tick(self) -> None:
+        self.refreshes += 1
+        for name, _countdown in self.scheduler.pop_expired():
+            self.app.notify(f"{name}: time's up!", severity="error", timeout=10)
+            self.app.bell()
+        rows = self.rows
+        for index in self._visible():
+            row = rows[index]
+            if row.view() != row.shown:
+                self.refresh_line(index)
+        self._schedule()
+
+    def _schedule(self) -> None:
+        """(Re)arm the shared timer for the next visible change."""
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+        rows = self.rows
+        delays = [
+            delay
+            for index in self._visible()
+            if (delay := rows[index].until_change()) is not None
+        ]
+        deadline = self.scheduler.next_deadline()
+        if deadline is not None:
+            delays.append(deadline - monotonic())
+        if delays:
+            delay = max(0.0, min(delays)) + _COALESCE
+            self._timer = self.set_timer(delay, self._tick)
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        super().watch_scroll_y(old_value, new_value)
+        # Different rows are on screen now.
+        self._schedule()
+
+    def on_resize(self) -> None:
+        self._schedule()
+
+    # Actions
+
+    def watch_cursor(self, old: int, new: int) -> None:
+        self.refresh_line(old)
+        self.refresh_line(new)
+        self.scroll_to_region(Region(0, new, 1, 1), animate=False, immediate=True)
+
+    def _move(self, index: int) -> None:
+        if self.rows:
+            self.cursor = max(0, min(len(self.rows) - 1, index))
+
+    def action_cursor(self, step: int) -> None:
+        self._move(self.cursor + step)
+
+    def action_page(self, direction: int) -> None:
+        self._move(self.cursor + direction * max(1, self.size.height - 1))
+
+    def action_jump(self, index: int) -> None:
+        self._move(index if index >= 0 else len(self.rows) + index)
+
+    def _changed(self) -> None:
+        """The selected row changed state: redraw it and re-arm the timer."""
+        self.refresh_line(self.cursor)
+        self._schedule()
+
+    def action_toggle(self) -> None:
+        if not self.rows:
+            return
+        row = self.rows[self.cursor]
+        if row.stopwatch is not None:
+            if row.stopwatch.is_running:
+                row.stopwatch.stop()
+            else:
+                row.stopwatch.start()
+        elif not row.countdown.is_finished:
+            self.scheduler.toggle(row.name)
+        self._changed()
+
+    def action_lap(self) -> None:
+        if self.rows and self.rows[self.cursor].stopwatch is not None:
+            self.rows[self.cursor].stopwatch.lap()
+            self._changed()
+
+    def action_reset(self) -> None:
+        if self.rows and self.rows[self.cursor].stopwatch is not None:
+            self.rows[self.cursor].stopwatch.reset()
+            self._changed()
+
+
+class DashboardTui(App):
+    """Many stopwatches and countdowns, one line each."""
+
+    TITLE = "Time Manager"
+    SUB_TITLE = "Dashboard"
+
+    CSS_PATH = "theme.tcss"
+
+    BINDINGS = [("q", "quit", "Quit")]
+
+    def __init__(
+        self,
+        stopwatches: Sequence[Stopwatch] = (),
+        countdowns: Sequence[tuple[str, float]] = (),
+    ) -> None:
+        super().__init__()
+        self.stopwatches = list(stopwatches)
+        self.countdowns = list(countdowns)
+
+    def compose(self) -> ComposeResult:
+        yield Header(show_clock=True)
+        yield TimerList(self.stopwatches, self.countdowns, id="timer-list")
+        yield Footer()
+
+    def on_mount(self) -> None:
+        self.query_one(TimerList).focus()
@@ -1,21 +1,22 @@
+from time import perf_counter_ns
+
 from textual.app import App, ComposeResult
 from textual.containers import Container
+from textual.timer import Timer
 from textual.widgets import Header, Footer, Digits, Button, Static
-from textual.reactive import reactive
-from core.formatting import format_time
-from core.termclock import Stopwatch
-
-
-def _format_stopwatch(seconds: float) -> str:
-    """Always format stopwatch as HH:MM:SS"""
-    time_str = format_time(seconds, show_centiseconds=False)
-    if time_str.count(":") == 1:
-        return f"00:{time_str}"
-    return time_str
+from core.formatting import format_hms, format_lap_stats
+from core.profiler import FrameProfiler
+from core.termclock import Stopwatch, until_next_second
 
 
 class StopwatchTui(App):
-    """A simple stopwatch app."""
+    """A simple stopwatch app.
+
+    The display only changes once a second, so instead of polling, one timer
+    wakes just after the next displayed-second boundary, and nothing runs at
+    all while the stopwatch is stopped. Widgets are looked up once, and each
+    is only updated when what it shows changes.
+    """
 
     TITLE = "Time Manager"
     SUB_TITLE = "Stopwatch"
@@ -25,15 +26,30 @@ class StopwatchTui(App):
     BINDINGS = [
         ("q", "quit", "Quit"),
         ("space", "toggle_timer", "Start/Stop"),
+        ("l", "lap", "Lap"),
         ("r", "reset_timer", "Reset"),
     ]
 
-    time_elapsed = reactive(0.0)
-
-    def __init__(self, project_name: str | None = None) -> None:
+    def __init__(
+        self,
+        project_name: str | None = None,
+        stopwatch: Stopwatch | None = None,
+        profiler: FrameProfiler | None = None,
+    ) -> None:
         super().__init__()
-        self.stopwatch = Stopwatch()
         self.project_name = (project_name or "").strip() or "Untitled"
+        self.stopwatch = (
+            stopwatch if stopwatch is not None else Stopwatch(name=self.project_name)
+        )
+        self.profiler = profiler
+        self._frame_due_ns = 0
+        self._timer: Timer | None = None
+        self._shown_time = "00:00:00"
+        self._shown_state: tuple[bool, bool] | None = None
+        # How many times the time was checked and the digits changed (for
+        # benchmarks).
+        self.ticks = 0
+        self.digit_updates = 0
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
@@ -50,6 +66,8 @@ class StopwatchTui(App):
                         yield Static("HH:MM:SS", id="format-hint")
                     with Container(id="status-row"):
                         yield Static("Ready", id="status", classes="ready")
+                    with Container(id="laps-row"):
+                        yield Static("", id="lap-stats")
             with Container(id="buttons-row"):
                 with Container(id="buttons"):
                     # Don't use `variant=` here; we want fully deterministic styling via TCSS.
@@ -57,58 +75,113 @@ class StopwatchTui(App):
                     yield Button(
                         "STOP", id="stop", classes="stop", disabled=True, flat=True
                     )
+                    yield Button(
+                        "LAP", id="lap", classes="lap", disabled=True, flat=True
+                    )
                     yield Button("RESET", id="reset", classes="reset", flat=True)
         yield Footer()
 
     def on_mount(self) -> None:
-        self.set_interval(1 / 60, self.update_time)
-        self.update_buttons()
+        self._digits = self.query_one("#time-display", Digits)
+        self._status = self.query_one("#status", Static)
+        self._lap_stats = self.query_one("#lap-stats", Static)
+        self._start = self.query_one("#start", Button)
+        self._stop = self.query_one("#stop", Button)
+        self._lap = self.query_one("#lap", Button)
+        self._changed()
 
     def update_time(self) -> None:
-        self.time_elapsed = self.stopwatch.elapsed
-        time_str = _format_stopwatch(self.time_elapsed)
-        self.query_one("#time-display", Digits).update(time_str)
+        self.ticks += 1
+        profiler = self.profiler
+        if profiler and not profiler.in_frame:
+            profiler.begin(self._frame_due_ns or perf_counter_ns())
+        else:
+            profiler = None  # the last frame hasn't reached the screen yet
+
+        elapsed = self.stopwatch.elapsed
+        time_str = format_hms(elapsed)
+        if profiler:
+            profiler.mark(1)
+        if time_str != self._shown_time:
+            self._shown_time = time_str
+            self._digits.update(time_str)
+            self.digit_updates += 1
+        if profiler:
+            profiler.mark(2)
+            # Textual writes to the terminal from its own refresh; the frame
+            # ends when that has happened.
+            self.call_after_refresh(self._end_profiled_frame)
+        self._schedule(elapsed)
+
+    def _schedule(self, elapsed: float) -> None:
+        """(Re)arm the clock for the next displayed second, if running."""
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+        if self.stopwatch.is_running:
+            delay = until_next_second(elapsed)
+            # Key bindings run as their own messages, so there's no input
+            # phase; a frame is due when its timer is.
+            self._frame_due_ns = perf_counter_ns() + int(delay * 1_000_000_000)
+            self._timer = self.set_timer(delay, self.update_time)
+
+    def _end_profiled_frame(self) -> None:
+        self.profiler.mark(3)
+        self.profiler.end()
 
     def action_toggle_timer(self) -> None:
         if self.stopwatch.is_running:
             self.stopwatch.stop()
         else:
             self.stopwatch.start()
-        self.update_buttons()
+        self._changed()
+
+    def action_lap(self) -> None:
+        if self.stopwatch.lap() is not None:
+            self.update_laps()
 
     def action_reset_timer(self) -> None:
         self._reset_stopwatch()
-        self.update_buttons()
+        self._changed()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "start":
             self.stopwatch.start()
         elif event.button.id == "stop":
             self.stopwatch.stop()
+        elif event.button.id == "lap":
+            self.action_lap()
         elif event.button.id == "reset":
             self._reset_stopwatch()
 
+        self._changed()
+
+    def _changed(self) -> None:
+        """The stopwatch started, stopped or reset: redraw and re-arm."""
         self.update_buttons()
+        self._frame_due_ns = 0  # this frame is due now, not at the boundary
+        self.update_time()
 
     def update_buttons(self) -> None:
         running = self.stopwatch.is_running
-        if running:
-            self.query_one("#start").disabled = True
-            self.query_one("#stop").disabled = False
-        else:
-            self.query_one("#start").disabled = False
-            self.query_one("#stop").disabled = True
+        ready = not running and self.stopwatch.elapsed_ns == 0
+        if (running, ready) == self._shown_state:
+            return
+        self._shown_state = running, ready
 
-        status = (
-            "Running" if running else ("Ready" if self.time_elapsed == 0 else "Paused")
-        )
-        status_widget = self.query_one("#status", Static)
-        status_widget.update(status)
-        status_widget.set_class(running, "running")
-        status_widget.set_class((not running) and self.time_elapsed == 0, "ready")
-        status_widget.set_class((not running) and self.time_elapsed > 0, "paused")
+        self._start.disabled = running
+        self._stop.disabled = not running
+        self._lap.disabled = not running
+
+        status = "Running" if running else ("Ready" if ready else "Paused")
+        self._status.update(status)
+        self._status.set_class(running, "running")
+        self._status.set_class(ready, "ready")
+        self._status.set_class(not running and not ready, "paused")
+
+    def update_laps(self) -> None:
+        self._lap_stats.update(format_lap_stats(self.stopwatch.lap_stats, per_line=4))
 
     def _reset_stopwatch(self) -> None:
         self.stopwatch.reset()
-        self.time_elapsed = 0.0
-        self.query_one("#time-display", Digits).update("00:00:00")
+        self.update_laps()